@@ -4,83 +4,30 @@ Automated playtest - walks through a complete game path
 """
 
 from stories.noir_detective import NoirDetectiveStory
-from engine.game import Game
+from engine.explorer import explore, print_report
 import sys
 
 
-def simulate_playthrough():
-    """Simulate a complete playthrough by checking scene connectivity"""
+def simulate_playthrough(story_class=NoirDetectiveStory, processes=None):
+    """Explore every reachable game state, running on_enter effects and conditions"""
     print("=" * 60)
     print("AUTOMATED PLAYTHROUGH TEST")
     print("=" * 60)
     print()
     
-    story = NoirDetectiveStory()
-    
-    print(f"Story: {story.title}")
-    print(f"Starting scene: {story.starting_scene}")
+    print("Exploring all story states...")
+    report = explore(story_class, processes=processes)
     print()
     
-    visited = set()
-    to_visit = [story.starting_scene]
-    endings_found = []
-    dead_ends = []
-    
-    print("Exploring all story paths...")
-    
-    while to_visit:
-        scene_id = to_visit.pop(0)
-        
-        if scene_id in visited:
-            continue
-            
-        visited.add(scene_id)
-        scene = story.get_scene(scene_id)
-        
-        if scene is None:
-            dead_ends.append(scene_id)
-            print(f"  ✗ Dead end: {scene_id} (scene not found)")
-            continue
-        
-        if scene.is_ending:
-            endings_found.append(scene_id)
-            print(f"  ✓ Found ending: {scene_id}")
-            continue
-        
-        choices = story.get_available_choices(scene)
-        
-        if len(choices) == 0 and not scene.is_ending:
-            dead_ends.append(scene_id)
-            print(f"  ✗ Dead end: {scene_id} (no choices, not marked as ending)")
-            continue
-        
-        for choice in choices:
-            if choice.next_scene not in visited:
-                to_visit.append(choice.next_scene)
-    
-    print()
     print("=" * 60)
     print("RESULTS")
     print("=" * 60)
-    print(f"Scenes explored: {len(visited)}")
-    print(f"Endings found: {len(endings_found)}")
-    print(f"Dead ends: {len(dead_ends)}")
-    print()
-    
-    if dead_ends:
-        print("Dead end scenes:")
-        for dead_end in dead_ends:
-            print(f"  - {dead_end}")
-        print()
-    
-    print("All endings:")
-    for i, ending in enumerate(endings_found, 1):
-        print(f"  {i}. {ending}")
+    print_report(report)
     
     print()
     print("=" * 60)
     
-    if dead_ends:
+    if report.dead_ends or report.missing_scenes or report.truncated:
         print("⚠ WARNING: Dead ends found!")
         return False
     else:
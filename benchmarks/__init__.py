@@ -0,0 +1 @@
+"""Performance benchmarks for the Terminal Theatre engine"""
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sleep-after-render animation loop vs. the FrameScheduler
+
+Simulates a loaded host where every frame takes a fixed time to draw
+and compares the wall time of the rain animation (3 frames x 3 loops).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.animation import AnimationLibrary, FrameScheduler
+
+
+def legacy_play(frames, delay, render_cost):
+    for _ in frames:
+        time.sleep(render_cost)  # render + clear
+        time.sleep(delay)
+
+
+def main():
+    animation = AnimationLibrary.rain_effect()
+    frames = list(animation.frames) * animation.loop
+    target = len(frames) * animation.frame_delay
+
+    print("=" * 72)
+    print(f"ANIMATION BENCHMARK ({len(frames)} frames @ {animation.frame_delay}s, target {target:.2f}s)")
+    print("=" * 72)
+    for render_cost in (0.0, 0.05, 0.15, 0.3):
+        start = time.perf_counter()
+        legacy_play(frames, animation.frame_delay, render_cost)
+        legacy = time.perf_counter() - start
+
+        scheduler = FrameScheduler(animation.frame_delay)
+        stats = scheduler.run(frames, lambda frame: time.sleep(render_cost))
+        print(f"  render {render_cost * 1000:>4.0f}ms   legacy {legacy:5.2f}s   "
+              f"scheduled {stats.elapsed:5.2f}s   fps {stats.achieved_fps:5.2f}   "
+              f"dropped {stats.frames_dropped}   jitter {stats.jitter * 1000:5.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: synchronous vs background autosave
+
+Measures how long the main thread is blocked per scene transition when
+autosaving synchronously (serialize + write on the spot) versus through
+the AutosaveWorker (snapshot + enqueue), for growing choice histories,
+on a local temp directory and with a simulated 20 ms storage latency.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.autosave import AutosaveWorker
+from engine.save_manager import SaveManager
+from engine.story import GameState
+
+SCENES = 50
+HISTORY_SIZES = [100, 1_000, 10_000]
+SLOW_WRITE = 0.02
+
+
+class SlowSaveManager(SaveManager):
+    """Adds a fixed delay per write, like a networked home directory"""
+
+    def save_game(self, slot, game_state, save_name=None):
+        time.sleep(SLOW_WRITE)
+        return super().save_game(slot, game_state, save_name)
+
+
+def build_state(choices: int) -> GameState:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 150}")
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    for index in range(40):
+        state.set_flag(f"flag_{index}")
+    return state
+
+
+def run(manager: SaveManager, state: GameState, background: bool):
+    """Play SCENES transitions; return (mean blocked ms, worker stats)"""
+    worker = AutosaveWorker(manager) if background else None
+    blocked = 0.0
+    for scene in range(SCENES):
+        state.visit_scene(f"scene_{scene}")
+        started = time.perf_counter()
+        if background:
+            snapshot = state.snapshot()
+            worker.submit(snapshot.to_dict)
+        else:
+            manager.save_game(SaveManager.AUTOSAVE_SLOT, state.to_dict(), "Autosave")
+        blocked += time.perf_counter() - started
+        time.sleep(0.002)  # Rendering the next scene
+    stats = None
+    if worker:
+        worker.close()
+        stats = worker.stats
+    return blocked / SCENES * 1000, stats
+
+
+def main():
+    print("=" * 78)
+    print(f"AUTOSAVE BENCHMARK ({SCENES} scene transitions, main-thread time per autosave)")
+    print("=" * 78)
+    with tempfile.TemporaryDirectory() as directory:
+        for label, manager in (
+            ("local disk", SaveManager(save_dir=directory)),
+            (f"+{SLOW_WRITE * 1000:.0f} ms storage", SlowSaveManager(save_dir=directory)),
+        ):
+            print(f"\n{label}")
+            for size in HISTORY_SIZES:
+                sync_ms, _ = run(manager, build_state(size), background=False)
+                async_ms, stats = run(manager, build_state(size), background=True)
+                print(f"  {size:>6} choices  sync {sync_ms:8.2f} ms   background {async_ms:6.3f} ms   "
+                      f"(written {stats.written}, coalesced {stats.coalesced}, "
+                      f"mean latency {stats.mean_latency * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled story bundles vs Python story modules
+
+Compiles each shipped story to a bundle, then in a fresh interpreter per
+run measures the time and memory to get from "engine imported" to the
+opening scene, and to every scene, loading either the Python module or
+the bundle. The engine import itself (mostly Rich) is reported
+separately since both paths pay it.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.bundle import compile_story, load_story_class
+
+ROOT = Path(__file__).parent.parent
+
+PROBE = """
+import json, resource, sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import engine.bundle
+engine_ready = time.perf_counter()
+tracemalloc.start()
+begin = time.perf_counter()
+if {bundle!r}:
+    story = engine.bundle.BundledStory({bundle!r})
+else:
+    module_name, class_name = {spec!r}.split(":")
+    story = getattr(__import__(module_name, fromlist=[class_name]), class_name)()
+story.get_scene(story.starting_scene)
+opened = time.perf_counter()
+opening_memory = tracemalloc.get_traced_memory()[0]
+for scene in story.scenes.values():
+    pass
+everything = time.perf_counter()
+all_memory = tracemalloc.get_traced_memory()[0]
+print(json.dumps({{
+    "engine": engine_ready - start,
+    "opening": opened - begin,
+    "all": everything - begin,
+    "opening_memory": opening_memory,
+    "all_memory": all_memory,
+    "maxrss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+STORIES = [
+    "stories.noir_detective:NoirDetectiveStory",
+    "stories.blood_and_neon:BloodAndNeonStory",
+]
+
+RUNS = 5
+
+
+def probe(spec: str, bundle: str = "") -> dict:
+    """Median of several fresh-interpreter runs"""
+    code = PROBE.format(root=str(ROOT), spec=spec, bundle=bundle)
+    results = [json.loads(subprocess.check_output([sys.executable, "-c", code])) for _ in range(RUNS)]
+    return {key: sorted(result[key] for result in results)[RUNS // 2] for key in results[0]}
+
+
+def main():
+    print("=" * 78)
+    print(f"STORY BUNDLE BENCHMARK (median of {RUNS} fresh interpreters)")
+    print("=" * 78)
+    with tempfile.TemporaryDirectory() as directory:
+        for spec in STORIES:
+            story = load_story_class(spec)()
+            bundle = str(Path(directory) / (spec.split(":")[1] + ".ttsb"))
+            size = compile_story(story, bundle)
+            source = ROOT / (spec.split(":")[0].replace(".", "/") + ".py")
+
+            module = probe(spec)
+            compiled = probe(spec, bundle)
+            print(f"\n{spec.split(':')[1]} ({len(story.scenes)} scenes; "
+                  f"source {source.stat().st_size / 1024:.1f} KiB, bundle {size / 1024:.1f} KiB)")
+            print(f"  engine import (shared)   {module['engine'] * 1000:8.2f} ms")
+            print(f"  {'':24} {'module':>12} {'bundle':>12}")
+            print(f"  {'to opening scene':24} {module['opening'] * 1000:9.2f} ms {compiled['opening'] * 1000:9.2f} ms")
+            print(f"  {'to all scenes':24} {module['all'] * 1000:9.2f} ms {compiled['all'] * 1000:9.2f} ms")
+            print(f"  {'memory at opening':24} {module['opening_memory'] / 1024:8.1f} KiB "
+                  f"{compiled['opening_memory'] / 1024:8.1f} KiB")
+            print(f"  {'memory, all scenes':24} {module['all_memory'] / 1024:8.1f} KiB "
+                  f"{compiled['all_memory'] / 1024:8.1f} KiB")
+            print(f"  {'peak RSS':24} {module['maxrss'] / 1024:9.1f} MB {compiled['maxrss'] / 1024:9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cached vs uncached choice availability
+
+Replays a random walk over a synthetic story whose scenes each carry several
+conditional choices (a mix of declarative predicates and lambdas), with
+state changing only occasionally, as in a long automated sweep. Also
+walks the shipped stories, whose choices are unconditional, to show the
+cache's overhead when there is nothing to save.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.logic import HasFlag, HasItem, Var
+from engine.story import Choice, Scene, Story
+from stories.blood_and_neon import BloodAndNeonStory
+from stories.noir_detective import NoirDetectiveStory
+
+STEPS = 200_000
+SCENES = 200
+WRITE_EVERY = 10_000
+
+
+class SyntheticStory(Story):
+    """Densely conditional story graph"""
+
+    def __init__(self, scenes: int = SCENES, seed: int = 7):
+        super().__init__()
+        rng = random.Random(seed)
+        self.starting_scene = "scene_0"
+        for index in range(scenes):
+            choices = []
+            for slot in range(6):
+                target = f"scene_{rng.randrange(scenes)}"
+                flag, item = f"flag_{rng.randrange(40)}", f"item_{rng.randrange(20)}"
+                kind = slot % 4
+                if kind == 0:
+                    condition = None
+                elif kind == 1:
+                    condition = HasFlag(flag) | ~HasItem(item)
+                elif kind == 2:
+                    condition = (lambda flag, item: lambda state: not state.has_flag(flag) or state.has_item(item))(flag, item)
+                else:
+                    condition = Var("trust") < rng.randrange(1, 10)
+                choices.append(Choice(f"go {target}", target, condition))
+            self.scenes[f"scene_{index}"] = Scene(id=f"scene_{index}", description="", choices=choices)
+
+
+def uncached(story: Story, scene: Scene):
+    """get_available_choices as it was before the cache"""
+    return [c for c in scene.choices if c.condition is None or c.condition(story.state)]
+
+
+def record_walk(story_class, steps: int, seed: int = 1):
+    """Random walk: the scenes visited and the state writes along the way"""
+    story = story_class()
+    rng = random.Random(seed)
+    scene_id = story.starting_scene
+    path = []
+    for step in range(steps):
+        writes = []
+        if step % WRITE_EVERY == 0:
+            writes = [(f"flag_{rng.randrange(40)}", rng.random() < 0.5), ("trust", rng.randrange(10))]
+            story.state.set_flag(*writes[0])
+            story.state.set_variable(*writes[1])
+        scene = story.get_scene(scene_id)
+        path.append((scene_id, writes))
+        choices = uncached(story, scene) if not scene.is_ending else []
+        scene_id = rng.choice(choices).next_scene if choices else story.starting_scene
+    return path
+
+
+def replay(story: Story, path, available) -> float:
+    """Time the availability lookups along a recorded walk"""
+    path = [(story.get_scene(scene_id), writes) for scene_id, writes in path]
+    state = story.state
+    start = time.perf_counter()
+    for scene, writes in path:
+        if writes:
+            state.set_flag(*writes[0])
+            state.set_variable(*writes[1])
+        available(story, scene)
+    return time.perf_counter() - start
+
+
+def main():
+    print("=" * 70)
+    print(f"CHOICE AVAILABILITY BENCHMARK ({STEPS:,} random-walk steps)")
+    print("=" * 70)
+    for label, story_class in (
+        ("synthetic (conditional)", SyntheticStory),
+        ("noir detective", NoirDetectiveStory),
+        ("blood and neon", BloodAndNeonStory),
+    ):
+        path = record_walk(story_class, STEPS)
+        before = replay(story_class(), path, uncached)
+        story = story_class()
+        after = replay(story, path, lambda story, scene: story.get_available_choices(scene))
+        cache = story.choice_cache
+        print(f"\n{label}")
+        print(f"  uncached   {before * 1e9 / STEPS:7.0f} ns/lookup")
+        print(f"  cached     {after * 1e9 / STEPS:7.0f} ns/lookup   "
+              f"(hit rate {cache.hits / max(cache.hits + cache.misses, 1):.1%})")
+
+
+if __name__ == "__main__":
+    main()
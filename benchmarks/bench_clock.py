@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scene pacing on real, accelerated and virtual clocks
+
+Plays every scene of both stories once through the real Game and plain
+TerminalRenderer (output to a buffer): pauses, typewriter and
+animations all wait on the injected clock. A virtual clock measures the
+pacing a player would sit through; one scene is also played on the real
+clock to check that the two agree.
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.clock import AcceleratedClock, RealClock, VirtualClock
+from engine.game import Game
+from engine.renderer import TerminalRenderer
+from stories.blood_and_neon import BloodAndNeonStory
+from stories.noir_detective import NoirDetectiveStory
+
+
+class BufferRenderer(TerminalRenderer):
+    """Plain renderer that never waits for ENTER"""
+
+    def pause(self, message: str = "", color: str = None):
+        pass
+
+
+class FirstChoiceGame(Game):
+    def _prompt_choice(self, scene, choices):
+        return 0
+
+
+def play_scenes(story_class, clock, limit=None) -> float:
+    """Play the story's scenes in order; returns wall seconds"""
+    story = story_class()
+    game = FirstChoiceGame(story, clock=clock,
+                           renderer=BufferRenderer(use_colors=False, clock=clock))
+    scene_ids = list(story.scenes)[:limit]
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for scene_id in scene_ids:
+            game.play_scene(story.get_scene(scene_id))
+    return time.perf_counter() - started
+
+
+def main():
+    print("=" * 70)
+    print("CLOCK BENCHMARK (every scene played once)")
+    print("=" * 70)
+    print(f"{'story':16} {'clock':12} {'paced time':>11} {'wall time':>10} {'speedup':>9}")
+    for story_class in (NoirDetectiveStory, BloodAndNeonStory):
+        virtual = VirtualClock()
+        wall = play_scenes(story_class, virtual)
+        title = story_class().title
+        paced = virtual.now()
+        print(f"{title:16} {'virtual':12} {paced:10.1f}s {wall:9.3f}s {paced / wall:8.0f}x")
+        wall = play_scenes(story_class, AcceleratedClock(100))
+        print(f"{title:16} {'x100':12} {paced:10.1f}s {wall:9.3f}s {paced / wall:8.0f}x")
+
+    print()
+    virtual = VirtualClock()
+    play_scenes(NoirDetectiveStory, virtual, limit=1)
+    wall = play_scenes(NoirDetectiveStory, RealClock(), limit=1)
+    print(f"first scene: {virtual.now():.2f}s on the virtual clock, "
+          f"{wall:.2f}s on the real clock")
+
+
+if __name__ == "__main__":
+    main()
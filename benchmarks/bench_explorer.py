@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: state-space exploration throughput
+
+Explores the shipped stories, then a generated corridor of rooms that
+each offer a key to take or leave: every room is reached once per set
+of keys taken before it, a few hundred thousand states, explored with
+1, 2 and 4 worker processes.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.explorer import explore
+from engine.logic import Effects, HasFlag, SetFlag
+from engine.story import Choice, Scene, Story
+from stories.blood_and_neon import BloodAndNeonStory
+from stories.noir_detective import NoirDetectiveStory
+
+ROOMS = 16
+
+
+class CorridorStory(Story):
+    """Rooms in a row, each offering a key to take or leave; the exit checks the keys"""
+
+    def __init__(self):
+        super().__init__()
+        self.title = "CORRIDOR"
+        self.starting_scene = "room_0"
+        for room in range(ROOMS):
+            after = f"room_{room + 1}" if room + 1 < ROOMS else "exit"
+            self.scenes[f"room_{room}"] = Scene(
+                id=f"room_{room}",
+                description="",
+                choices=[Choice("Take the key", f"key_{room}"), Choice("Walk on", after)],
+            )
+            self.scenes[f"key_{room}"] = Scene(
+                id=f"key_{room}",
+                description="",
+                on_enter=Effects([SetFlag(f"key_{room}")]),
+                choices=[Choice("Walk on", after)],
+            )
+        self.scenes["exit"] = Scene(
+            id="exit",
+            description="",
+            choices=[
+                Choice("Unlock", "freedom", condition=HasFlag("key_0") & HasFlag(f"key_{ROOMS - 1}")),
+                Choice("Give up", "despair"),
+            ],
+        )
+        self.scenes["freedom"] = Scene(id="freedom", description="", is_ending=True)
+        self.scenes["despair"] = Scene(id="despair", description="", is_ending=True)
+
+
+def main():
+    print("=" * 70)
+    print("EXPLORER BENCHMARK")
+    print("=" * 70)
+    for story_class in (NoirDetectiveStory, BloodAndNeonStory):
+        report = explore(story_class, processes=1)
+        print(f"{report.title:18} {report.states:>9,} states {report.elapsed * 1000:8.1f} ms "
+              f"{len(report.endings):>3} endings")
+    print()
+    print(f"{'corridor, processes':18} {'states':>9} {'seconds':>10} {'states/s':>12}")
+    for processes in (1, 2, 4):
+        report = explore(CorridorStory, processes=processes)
+        print(f"{processes:>18} {report.states:>9,} {report.elapsed:10.2f} "
+              f"{report.states_per_second:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
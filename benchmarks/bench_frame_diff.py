@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bytes written per animation frame, full repaint vs. diff
+
+Renders the multi-frame rain/fire animations and the Blood and Neon art
+through DiffFrameRenderer into an in-memory truecolor console, once with
+every frame forced to a full repaint (the old clear-and-print path) and
+once differentially.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+from engine.animation import AnimationLibrary
+from engine.colors import ColorPalette
+from engine.frame_diff import DiffFrameRenderer
+from stories.blood_and_neon_art import get_all_blood_and_neon_art
+
+
+def play(frames, loops, force_full):
+    """Return bytes per frame, excluding the first (always full) frame"""
+    console = Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=120)
+    renderer = DiffFrameRenderer(stream=console.file, size=lambda: (120, 60))
+    first = None
+    for _ in range(loops):
+        for frame in frames:
+            if force_full:
+                renderer.reset()
+            renderer.draw(frame, style=f"bold {ColorPalette.NOIR_AMBER}", console=console)
+            if first is None:
+                first = renderer.stats.bytes_written
+    stats = renderer.stats
+    return (stats.bytes_written - first) / max(stats.frames - 1, 1)
+
+
+def report(label, frames, loops):
+    full = play(frames, loops, force_full=True)
+    diff = play(frames, loops, force_full=False)
+    ratio = full / max(diff, 1)
+    print(f"  {label:<28} full {full:>8.0f} B/frame   diff {diff:>8.0f} B/frame   {ratio:6.1f}x")
+
+
+def main():
+    print("=" * 78)
+    print("FRAME DIFF BENCHMARK (bytes written per frame after the first)")
+    print("=" * 78)
+    rain = AnimationLibrary.rain_effect()
+    report("rain_colored (3 frames x3)", rain.frames, rain.loop)
+    fire = AnimationLibrary.fire_effect()
+    report("fire_effect (3 frames x3)", fire.frames, fire.loop)
+
+    art = get_all_blood_and_neon_art()
+    # Art pieces played back to back, as scene transitions would
+    frames = [animation.frames[0] for animation in art.values()]
+    report("blood_and_neon art sequence", frames, 1)
+    # A held frame (e.g. a still animation replayed on a timer)
+    report("blood_and_neon art held x10", [frames[0]], 10)
+
+
+if __name__ == "__main__":
+    main()
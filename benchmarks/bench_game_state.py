@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GameState hot operations
+
+Compares the slot/set/array-backed GameState with the previous
+list-backed layout (reproduced below) on visit_scene, has_item and
+record_choice throughput, and on the memory held by a long choice
+history.
+"""
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.story import GameState
+
+SCENES = [f"scene_{index}" for index in range(150)]
+ITEMS = [f"item_{index}" for index in range(40)]
+CHOICES = 100_000
+NUMBER = 100_000
+
+
+class ListGameState:
+    """The list-backed GameState this replaced"""
+
+    def __init__(self):
+        self.current_scene = ""
+        self.visited_scenes = []
+        self.flags = {}
+        self.inventory = []
+        self.variables = {}
+        self.choice_history = []
+
+    def add_item(self, item):
+        if item not in self.inventory:
+            self.inventory.append(item)
+
+    def has_item(self, item):
+        return item in self.inventory
+
+    def visit_scene(self, scene_id):
+        if scene_id not in self.visited_scenes:
+            self.visited_scenes.append(scene_id)
+        self.current_scene = scene_id
+
+    def record_choice(self, scene_id, choice_index, choice_text):
+        self.choice_history.append((scene_id, choice_index, choice_text))
+
+
+def populated(state_class):
+    state = state_class()
+    for scene_id in SCENES:
+        state.visit_scene(scene_id)
+    for item in ITEMS:
+        state.add_item(item)
+    return state
+
+
+def history_memory(state_class) -> int:
+    # Fresh strings per choice, as if they came from decoded saves or input
+    texts = [f"Choice text number {index % 4}" for index in range(8)]
+    tracemalloc.start()
+    state = state_class()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(CHOICES):
+        state.record_choice("".join(["scene_", str(index % 150)]), index % 4, texts[index % 8])
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+def main():
+    print("=" * 70)
+    print(f"GAME STATE BENCHMARK ({NUMBER:,} operations each)")
+    print("=" * 70)
+    print(f"{'operation':32} {'lists':>12} {'slots/sets':>12}")
+    for label, statement in (
+        ("visit_scene (revisit)", "state.visit_scene(SCENES[-1])"),
+        ("has_item (last item)", "state.has_item(ITEMS[-1])"),
+        ("has_item (missing)", "state.has_item('nothing')"),
+        ("record_choice", "state.record_choice('scene_1', 2, 'Go left')"),
+    ):
+        results = []
+        for state_class in (ListGameState, GameState):
+            state = populated(state_class)
+            namespace = {"state": state, "SCENES": SCENES, "ITEMS": ITEMS}
+            seconds = min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=3))
+            results.append(seconds / NUMBER * 1e9)
+        print(f"{label:32} {results[0]:9.0f} ns {results[1]:9.0f} ns")
+
+    legacy, compact = history_memory(ListGameState), history_memory(GameState)
+    print(f"\nchoice history, {CHOICES:,} choices: "
+          f"{legacy / 1024:8.0f} KiB (lists) vs {compact / 1024:8.0f} KiB (arrays)")
+
+
+if __name__ == "__main__":
+    main()
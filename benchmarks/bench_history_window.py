@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: windowed choice history
+
+Records a long endurance-run history with and without a window and
+reports peak memory, record_choice throughput, and the time to iterate
+the full history back (from memory, or from the spill file).
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.containers import ChoiceHistory
+
+CHOICES = 2_000_000
+WINDOW = 10_000
+SCENES = [f"scene_{index}" for index in range(150)]
+TEXTS = [f"Choice {index}" for index in range(7)]
+
+
+def fill(window, traced: bool):
+    """Record CHOICES entries; return (history, seconds, peak bytes)"""
+    history = ChoiceHistory(window=window)
+    if traced:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for index in range(CHOICES):
+        history.record(SCENES[index % 150], index % 3, TEXTS[index % 7])
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return history, elapsed, peak
+
+
+def run(window):
+    _, _, peak = fill(window, traced=True)
+    history, recorded, _ = fill(window, traced=False)
+
+    started = time.perf_counter()
+    count = sum(1 for _ in history)
+    iterated = time.perf_counter() - started
+    assert count == len(history) == CHOICES
+    return peak, recorded, iterated, history.spilled
+
+
+def main():
+    print("=" * 78)
+    print(f"CHOICE HISTORY WINDOW BENCHMARK ({CHOICES:,} choices)")
+    print("=" * 78)
+    print(f"{'layout':22} {'peak memory':>12} {'record':>12} {'iterate all':>12} {'spilled':>11}")
+    for label, window in (("in memory", None), (f"window {WINDOW:,}", WINDOW)):
+        peak, recorded, iterated, spilled = run(window)
+        print(f"{label:22} {peak / 1024 / 1024:8.1f} MiB {recorded / CHOICES * 1e9:8.0f} ns "
+              f"{iterated:10.2f} s {spilled:>11,}")
+
+
+if __name__ == "__main__":
+    main()
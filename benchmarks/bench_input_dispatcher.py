@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: waiting for a key press
+
+Compares the old pattern (a reader thread per wait, with the main
+thread polling its Event every 0.5 s / 0.2 s) against subscribing to
+the shared InputDispatcher, on a pseudo-terminal: how long after the
+key the waiter wakes, and how many threads are left behind by waits
+that end without a key (a cinematic that plays to the end).
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.input_dispatcher import InputDispatcher
+from engine.input_handler import InputHandler
+
+WAITS = 20
+
+
+def polling_wait(period: float, timeout: float = None) -> bool:
+    """The old OpeningSequence pattern"""
+    pressed = threading.Event()
+
+    def listener():
+        try:
+            with InputHandler() as handler:
+                handler.read_key()
+                pressed.set()
+        except Exception:
+            pressed.set()
+
+    threading.Thread(target=listener, daemon=True).start()
+    started = time.perf_counter()
+    while not pressed.is_set():
+        if timeout is not None and time.perf_counter() - started >= timeout:
+            return False
+        time.sleep(period)
+    return True
+
+
+def dispatcher_wait(dispatcher: InputDispatcher, timeout: float = None) -> bool:
+    with dispatcher.subscribe() as keys:
+        return keys.pressed.wait(timeout)
+
+
+def wake_latency(wait, master: int) -> float:
+    """Mean seconds from key press to wake-up"""
+    total = 0.0
+    for _ in range(WAITS):
+        delay = random.uniform(0.05, 0.25)
+        pressed_at = []
+        timer = threading.Timer(delay, lambda: (pressed_at.append(time.perf_counter()),
+                                                os.write(master, b"x")))
+        timer.start()
+        wait()
+        total += time.perf_counter() - pressed_at[0]
+        timer.join()
+    return total / WAITS
+
+
+def main():
+    if os.name == "nt":
+        print("needs a POSIX pseudo-terminal")
+        return
+    random.seed(1)
+    master, slave = os.openpty()
+    sys.stdin = os.fdopen(slave, "r")
+    dispatcher = InputDispatcher()
+
+    print("=" * 70)
+    print(f"INPUT WAIT BENCHMARK ({WAITS} key presses each)")
+    print("=" * 70)
+    patterns = (
+        ("InputDispatcher", lambda: dispatcher_wait(dispatcher),
+         lambda: dispatcher_wait(dispatcher, timeout=0.05)),
+        ("thread + 0.2 s polling", lambda: polling_wait(0.2),
+         lambda: polling_wait(0.2, timeout=0.05)),
+        ("thread + 0.5 s polling", lambda: polling_wait(0.5),
+         lambda: polling_wait(0.5, timeout=0.05)),
+    )
+    latencies = [wake_latency(wait, master) for _, wait, _ in patterns]
+    # Leaked readers would eat the keys of later waits, so count them last
+    print(f"{'pattern':32} {'mean wake latency':>18} {'threads left':>13}")
+    for (label, _, timed_out), latency in zip(patterns, latencies):
+        before = threading.active_count()
+        for _ in range(WAITS):
+            timed_out()
+        left = threading.active_count() - before
+        print(f"{label:32} {latency * 1000:15.1f} ms {left:>13}")
+    dispatcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full-rewrite autosaves vs journal appends
+
+Times one autosave per scene transition (a visit, a choice and a flag)
+as a full save_game rewrite and as an append_journal delta, for
+growing choice histories, plus the cost of replaying the journal when
+the save is loaded.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager
+from engine.story import GameState
+
+HISTORY_SIZES = [1_000, 10_000, 100_000]
+AUTOSAVES = 40
+
+
+def build_state(choices: int) -> GameState:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 150}")
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    state.start_journal()
+    return state
+
+
+def play_scene(state: GameState, step: int):
+    state.visit_scene(f"scene_{step % 150}")
+    state.record_choice(f"scene_{step % 150}", step % 3, f"Choice {step % 7}")
+    state.set_flag(f"flag_{step % 20}", step % 2 == 0)
+
+
+def run(directory: str, choices: int, journal: bool) -> float:
+    """Mean milliseconds per autosave (the first, full write excluded)"""
+    manager = SaveManager(save_dir=directory, journal=journal,
+                          journal_compact_every=AUTOSAVES * 2,
+                          autosave_durability=SaveManager.DURABILITY_NONE)
+    state = build_state(choices)
+    slot = SaveManager.AUTOSAVE_SLOT
+    manager.append_journal(slot, state.drain_journal(), state.to_dict)
+    elapsed = 0.0
+    for step in range(AUTOSAVES):
+        play_scene(state, step)
+        started = time.perf_counter()
+        manager.append_journal(slot, state.drain_journal(), state.to_dict)
+        elapsed += time.perf_counter() - started
+    return elapsed / AUTOSAVES * 1000
+
+
+def main():
+    print("=" * 70)
+    print(f"JOURNAL BENCHMARK ({AUTOSAVES} autosaves, one scene apart)")
+    print("=" * 70)
+    print(f"{'choices':>10} {'full rewrite':>14} {'journal':>11} {'load + replay':>15}")
+    for choices in HISTORY_SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            full = run(directory, choices, journal=False)
+        with tempfile.TemporaryDirectory() as directory:
+            appended = run(directory, choices, journal=True)
+            started = time.perf_counter()
+            SaveManager(save_dir=directory).load_game(SaveManager.AUTOSAVE_SLOT)
+            load = (time.perf_counter() - started) * 1000
+        print(f"{choices:>10,} {full:11.2f} ms {appended:8.3f} ms {load:12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing save slots
+
+Compares SaveManager.list_saves, served from the metadata index, with
+the previous approach of parsing every save file for its metadata
+block, for full slots at several history lengths.
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager
+from engine.story import GameState
+
+REPEAT = 20
+
+
+def build_state(choices: int) -> dict:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 150}")
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    return state.to_dict()
+
+
+def parse_every_file(manager: SaveManager):
+    """The previous list_saves: json.load each slot in full"""
+    return [manager._read_save_metadata(slot) for slot in range(manager.MAX_SAVE_SLOTS)]
+
+
+def main():
+    print("=" * 70)
+    print(f"LIST SAVES BENCHMARK ({SaveManager.MAX_SAVE_SLOTS} full slots)")
+    print("=" * 70)
+    print(f"{'choices per save':>18} {'parse files':>14} {'index':>12}")
+    for choices in (100, 1_000, 10_000):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SaveManager(save_dir=directory, durability=SaveManager.DURABILITY_NONE,
+                                  autosave_durability=SaveManager.DURABILITY_NONE)
+            state = build_state(choices)
+            for slot in range(SaveManager.MAX_SAVE_SLOTS):
+                manager.save_game(slot, state)
+            assert manager.list_saves() == parse_every_file(manager)
+
+            parse = min(timeit.repeat(lambda: parse_every_file(manager), number=REPEAT, repeat=3))
+            # A fresh manager each time, so the index file is read from disk
+            indexed = min(timeit.repeat(lambda: SaveManager(save_dir=directory).list_saves(),
+                                        number=REPEAT, repeat=3))
+            print(f"{choices:>18,} {parse / REPEAT * 1000:11.2f} ms {indexed / REPEAT * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Monte Carlo playthroughs
+
+Plays both shipped stories at random, in one process and in a pool,
+and checks that peak memory does not grow with the number of runs:
+per-run results go straight to the column files.
+"""
+
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.montecarlo import simulate
+from stories.blood_and_neon import BloodAndNeonStory
+from stories.noir_detective import NoirDetectiveStory
+
+RUNS = 200_000
+
+
+def peak_memory(story_class, runs: int, directory: str) -> int:
+    tracemalloc.start()
+    simulate(story_class, runs, processes=1, output=Path(directory) / f"traced_{runs}")
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print("=" * 78)
+    print(f"MONTE CARLO BENCHMARK ({RUNS:,} playthroughs)")
+    print("=" * 78)
+    print(f"{'story':16} {'processes':>9} {'seconds':>9} {'runs/s':>10} {'scenes/s':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for story_class in (NoirDetectiveStory, BloodAndNeonStory):
+            for processes in (1, 4):
+                report = simulate(story_class, RUNS, seed=1, processes=processes,
+                                  output=Path(directory) / f"{story_class.__name__}_{processes}")
+                scenes = report.mean_length() * report.runs
+                print(f"{report.title:16} {processes:>9} {report.elapsed:9.2f} "
+                      f"{report.runs_per_second:10,.0f} {scenes / report.elapsed:11,.0f}")
+        print()
+        for runs in (RUNS // 10, RUNS):
+            peak = peak_memory(BloodAndNeonStory, runs, directory)
+            print(f"peak memory, {runs:>9,} runs {peak / 1024:10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
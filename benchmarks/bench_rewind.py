@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rewind snapshots vs JSON round trips
+
+Plays scenes on a mid-game state (hundreds of flags and visited scenes,
+thousands of choices), keeping one rewind point per scene either as a
+RewindBuffer snapshot or as a JSON string of the state. Reports the
+memory each rewind point costs, the time to capture one, and the time
+to jump back.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.rewind import RewindBuffer
+from engine.story import GameState
+
+SCENES = 50
+CHOICES = [1_000, 10_000, 100_000]
+
+
+def mid_game(choices: int) -> GameState:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 300}")
+        state.record_choice(f"scene_{index % 300}", index % 3, f"Choice {index % 7}")
+        if index % 25 == 0:
+            state.set_flag(f"flag_{index % 5000}")
+        if index % 100 == 0:
+            state.set_variable(f"var_{index % 5000}", index)
+    return state
+
+
+def play(state: GameState, step: int):
+    state.visit_scene(f"scene_{step % 300}")
+    state.set_flag(f"played_{step}")
+    state.record_choice(f"scene_{step % 300}", step % 3, f"Choice {step % 7}")
+
+
+class JsonRewind:
+    """The alternative: a serialized copy of the state per scene"""
+
+    def __init__(self):
+        self.entries = []
+
+    def push(self, state: GameState):
+        self.entries.append(json.dumps(state.to_dict()))
+
+    def rewind(self, state: GameState, steps: int):
+        del self.entries[len(self.entries) - steps:]
+        state.from_dict(json.loads(self.entries.pop()))
+
+
+def measure(choices: int, make_buffer):
+    """(bytes per rewind point, capture ms, rewind ms)"""
+    state = mid_game(choices)
+    buffer = make_buffer()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for step in range(SCENES):
+        buffer.push(state)
+        play(state, step)
+    # What the buffer holds on top of the live state it shares with
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    state = mid_game(choices)
+    buffer = make_buffer()
+    capture = 0.0
+    for step in range(SCENES):
+        started = time.perf_counter()
+        buffer.push(state)
+        capture += time.perf_counter() - started
+        play(state, step)
+    started = time.perf_counter()
+    buffer.rewind(state, 10)
+    rewind = time.perf_counter() - started
+    return held / SCENES, capture / SCENES * 1000, rewind * 1000
+
+
+def main():
+    print("=" * 82)
+    print(f"REWIND BENCHMARK ({SCENES} rewind points, one per scene)")
+    print("=" * 82)
+    print(f"{'choices':>9} {'layout':10} {'per point':>12} {'capture':>11} {'rewind 10':>11}")
+    for choices in CHOICES:
+        for label, make_buffer in (("snapshot", lambda: RewindBuffer(capacity=SCENES + 1)),
+                                   ("json", JsonRewind)):
+            per_point, capture, rewind = measure(choices, make_buffer)
+            print(f"{choices:>9,} {label:10} {per_point / 1024:8.1f} KiB "
+                  f"{capture:8.3f} ms {rewind:8.3f} ms")
+        buffer = RewindBuffer(capacity=SCENES + 1)
+        state = mid_game(choices)
+        for step in range(SCENES):
+            buffer.push(state)
+            play(state, step)
+        print(f"{'':9} {'(budget)':10} {buffer.memory_used / SCENES / 1024:8.1f} KiB "
+              "accounted per snapshot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: save latency per durability mode
+
+Times SaveManager.save_game in each durability mode (strict, batched,
+none) against the previous in-place write (truncate and rewrite), for a
+small and a long-running game state. Numbers depend heavily on the
+filesystem; run it on the disk that holds your saves.
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager
+from engine.story import GameState
+
+SAVES = 100
+
+
+def build_state(choices: int) -> dict:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 150}")
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    return state.to_dict()
+
+
+class InPlaceSaveManager(SaveManager):
+    """The previous write path: truncate the slot file and write into it"""
+
+    def _write_atomic(self, path, payload, durability):
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+
+def time_saves(manager: SaveManager, state: dict, durability: str):
+    timings = []
+    for _ in range(SAVES):
+        started = time.perf_counter()
+        manager.save_game(1, state, durability=durability)
+        timings.append(time.perf_counter() - started)
+    manager.sync()
+    timings.sort()
+    return statistics.mean(timings) * 1000, timings[int(len(timings) * 0.95)] * 1000
+
+
+def main():
+    print("=" * 70)
+    print(f"SAVE DURABILITY BENCHMARK ({SAVES} saves per mode)")
+    print("=" * 70)
+    with tempfile.TemporaryDirectory(dir=Path.home()) as directory:
+        for choices in (100, 5_000):
+            state = build_state(choices)
+            print(f"\n{choices:,} choices")
+            print(f"  {'mode':22} {'mean':>10} {'p95':>10}")
+            cases = [("in-place (old)", InPlaceSaveManager(save_dir=directory), SaveManager.DURABILITY_NONE)]
+            # A long batch interval so batched mode only fsyncs on sync()
+            atomic = SaveManager(save_dir=directory, batch_interval=60)
+            cases += [(f"atomic, {mode}", atomic, mode) for mode in SaveManager.DURABILITY_MODES]
+            for label, manager, mode in cases:
+                mean, p95 = time_saves(manager, state, mode)
+                print(f"  {label:22} {mean:7.2f} ms {p95:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: save file formats
+
+Compares the indented JSON save format with the binary envelope
+(uncompressed, zlib, lzma) on file size, encode and decode time, and
+the time to read just the metadata, for growing choice histories.
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager, decode_save, read_save_metadata
+from engine.story import GameState
+
+HISTORY_SIZES = [1_000, 10_000, 100_000]
+
+
+def build_save(choices: int) -> dict:
+    state = GameState()
+    for index in range(choices):
+        state.visit_scene(f"scene_{index % 150}")
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    with tempfile.TemporaryDirectory() as directory:
+        scratch = SaveManager(save_dir=directory)
+        scratch.save_game(1, state.to_dict())
+        return json.loads((Path(directory) / "save_slot_1.json").read_bytes())
+
+
+def best(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1000
+
+
+def main():
+    print("=" * 86)
+    print("SAVE FORMAT BENCHMARK")
+    print("=" * 86)
+    formats = [("json (indented)", SaveManager.FORMAT_JSON, None)] + [
+        (f"binary, {compression or 'raw'}", SaveManager.FORMAT_BINARY, compression)
+        for compression in (None, "zlib", "lzma")
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for choices in HISTORY_SIZES:
+            print(f"\n{choices:,} choices")
+            print(f"  {'format':18} {'size':>10} {'encode':>11} {'decode':>11} {'metadata':>11}")
+            save_data = build_save(choices)
+            number = max(1, 20_000 // choices)
+            for label, save_format, compression in formats:
+                manager = SaveManager(save_dir=directory, save_format=save_format,
+                                      compression=compression)
+                payload = manager._encode(save_data)
+                path = Path(directory) / f"bench{SaveManager.FORMAT_EXTENSIONS[save_format]}"
+                path.write_bytes(payload)
+                assert decode_save(payload) == save_data
+                encode = best(lambda: manager._encode(save_data), number)
+                decode = best(lambda: decode_save(payload), number)
+                metadata = best(lambda: read_save_metadata(path), number)
+                print(f"  {label:18} {len(payload) / 1024:7.0f} KiB {encode:8.2f} ms "
+                      f"{decode:8.2f} ms {metadata:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: save listings with thousands of saves
+
+Fills one profile with many saves and times paged listings, the
+latest-save lookup and a single save against the previous approach of
+parsing every save file to find the latest one.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager
+from engine.save_store import SORT_COMPLETION, SORT_TIMESTAMP
+
+SAVES = 5_000
+PAGE = 9
+
+
+def timed(function, repeat: int = 20) -> float:
+    """Best of ``repeat`` calls, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def scan_for_latest(manager: SaveManager):
+    """The previous get_last_save_slot: read every slot's metadata"""
+    latest_slot, latest_time = None, None
+    for slot in range(1, SAVES + 1):
+        metadata = manager._read_save_metadata(slot)
+        if metadata and (latest_time is None or metadata.timestamp > latest_time):
+            latest_slot, latest_time = slot, metadata.timestamp
+    return latest_slot
+
+
+def main():
+    print("=" * 70)
+    print(f"SAVE PAGING BENCHMARK ({SAVES:,} saves in one profile)")
+    print("=" * 70)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_dir=directory, profile="bench",
+                              durability=SaveManager.DURABILITY_NONE)
+        started = time.perf_counter()
+        for slot in range(1, SAVES + 1):
+            manager.save_game(slot, {
+                "current_scene": f"scene_{slot % 40}", "visited_scenes": ["opening"],
+                "flags": {}, "story_title": f"Story {slot % 3}", "total_scenes": slot % 50 + 1,
+            })
+        fill = time.perf_counter() - started
+
+        cold_started = time.perf_counter()
+        cold = SaveManager(save_dir=directory, profile="bench")
+        cold.list_page(0, PAGE)
+        cold_ms = (time.perf_counter() - cold_started) * 1000
+
+        rows = [
+            ("save_game (with index)", fill / SAVES * 1000),
+            ("open profile + first page", cold_ms),
+            ("first page (newest)", timed(lambda: manager.list_page(0, PAGE, sort_by=SORT_TIMESTAMP))),
+            ("page 300 (by completion)", timed(lambda: manager.list_page(
+                300 * PAGE, PAGE, sort_by=SORT_COMPLETION))),
+            ("latest save (sorted index)", timed(manager.get_last_save_slot)),
+            ("latest save (scan files)", timed(lambda: scan_for_latest(manager), repeat=1)),
+        ]
+        assert manager.get_last_save_slot() == scan_for_latest(manager)
+        for label, milliseconds in rows:
+            print(f"{label:32} {milliseconds:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
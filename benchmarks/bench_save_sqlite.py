@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: file saves vs the SQLite save store
+
+Fills each backend with 10, 1,000 and 100,000 saves, then times a
+manual save (strict durability) and an autosave (batched), the first
+page of the load menu, the latest-save lookup and loading one save.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.save_manager import SaveManager
+from engine.save_store import SORT_COMPLETION
+from engine.sqlite_store import SqliteSaveStore
+
+SIZES = [10, 1_000, 100_000]
+PAGE = 9
+
+
+def state_for(slot: int) -> dict:
+    return {
+        "current_scene": f"scene_{slot % 40}", "visited_scenes": ["opening", "alley"],
+        "flags": {"met_vera": slot % 2 == 0}, "story_title": f"Story {slot % 3}",
+        "total_scenes": slot % 50 + 1,
+        "choice_history": [[f"scene_{index}", index % 3, "Choice"] for index in range(50)],
+    }
+
+
+def timed(function, repeat: int = 20) -> float:
+    """Median of ``repeat`` calls, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return sorted(times)[len(times) // 2] * 1000
+
+
+def run(store, saves: int) -> dict:
+    state = state_for(1)
+    for slot in range(1, saves + 1):
+        store.save_game(slot, state_for(slot), durability=SaveManager.DURABILITY_NONE)
+    middle = saves // 2 + 1
+    return {
+        "save (strict)": timed(lambda: store.save_game(middle, state)),
+        "autosave (batched)": timed(lambda: store.save_game(SaveManager.AUTOSAVE_SLOT, state)),
+        "first page, newest": timed(lambda: store.list_page(0, PAGE)),
+        "first page, completion": timed(lambda: store.list_page(0, PAGE, SORT_COMPLETION)),
+        "latest save": timed(store.get_last_save_slot),
+        "load": timed(lambda: store.load_game(middle)),
+    }
+
+
+def main():
+    print("=" * 78)
+    print("SAVE BACKEND BENCHMARK (milliseconds, median)")
+    print("=" * 78)
+    for saves in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            files = run(SaveManager(save_dir=Path(directory) / "saves"), saves)
+            store = SqliteSaveStore(Path(directory) / "saves.db")
+            sqlite = run(store, saves)
+            store.close()
+        print(f"\n{saves:,} saves")
+        print(f"  {'operation':26} {'files':>10} {'sqlite':>10}")
+        for operation in files:
+            print(f"  {operation:26} {files[operation]:10.3f} {sqlite[operation]:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: plain-mode scene transition latency
+
+Compares the old subprocess clear (os.system('clear')) with the probed
+in-process clear sequence, and times a full plain-text scene transition
+(clear + instant description) the way Game.play_scene performs it.
+Output is sent to /dev/null at the file-descriptor level so the child
+`clear` process is measured fairly.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.renderer import TerminalRenderer
+from engine.terminal import probe_terminal
+from stories.noir_detective import NoirDetectiveStory
+
+
+def legacy_clear():
+    os.system('cls' if os.name == 'nt' else 'clear')
+
+
+def time_calls(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    os.environ.setdefault("TERM", "xterm-256color")
+    started = time.perf_counter()
+    capabilities = probe_terminal(refresh=True)
+    startup = time.perf_counter() - started
+
+    renderer = TerminalRenderer(use_colors=False)
+    story = NoirDetectiveStory()
+    description = story.get_scene(story.starting_scene).description
+
+    def legacy_transition():
+        legacy_clear()
+        print(description)
+
+    def transition():
+        renderer.clear()
+        print(description)
+
+    saved_stdout = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        sys.stdout.flush()
+        os.dup2(devnull, 1)
+        results = {
+            "legacy clear": time_calls(legacy_clear, 50),
+            "in-process clear": time_calls(renderer.clear, 5000),
+            "legacy transition": time_calls(legacy_transition, 50),
+            "in-process transition": time_calls(transition, 5000),
+        }
+        sys.stdout.flush()
+    finally:
+        os.dup2(saved_stdout, 1)
+        os.close(devnull)
+        os.close(saved_stdout)
+
+    print("=" * 60)
+    print("PLAIN-MODE SCENE TRANSITION BENCHMARK")
+    print("=" * 60)
+    print(f"  TERM={capabilities.term} source={capabilities.source} "
+          f"probe {capabilities.probe_time * 1000:.2f} ms (startup {startup * 1000:.2f} ms)")
+    for label, seconds in results.items():
+        print(f"  {label:<24} {seconds * 1e6:>10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: skip-ahead latency
+
+Plays the longest scene of The Last Case through the real Game with a
+SkipListener reading a pseudo-terminal, presses a key partway through
+the description, and reports how long the rest of the scene took to
+appear compared with sitting through it.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.clock import RealClock
+from engine.game import Game
+from engine.renderer import TerminalRenderer
+from stories.noir_detective import NoirDetectiveStory
+
+PRESS_AFTER = 0.5
+REPEATS = 5
+
+
+def longest_scene(story):
+    return max((story.get_scene(scene_id) for scene_id in story.scenes),
+               key=lambda scene: len(scene.description)
+               + sum(len(text) for _, text in scene.dialogue))
+
+
+def play(scene, master=None) -> tuple:
+    """Play the scene; returns (seconds, seconds after the key press)"""
+    game = Game(NoirDetectiveStory(), clock=RealClock(),
+                renderer=TerminalRenderer(use_colors=False, clock=RealClock()))
+    game._prompt_choice = lambda scene, choices: 0
+    pressed_at = []
+
+    def press():
+        pressed_at.append(time.perf_counter())
+        os.write(master, b" ")
+
+    if master is not None:
+        timer = threading.Timer(PRESS_AFTER, press)
+        timer.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.play_scene(scene)
+    finished = time.perf_counter()
+    return finished - started, finished - pressed_at[0] if pressed_at else 0.0
+
+
+def main():
+    if os.name == "nt":
+        print("needs a POSIX pseudo-terminal")
+        return
+    scene = longest_scene(NoirDetectiveStory())
+    master, slave = os.openpty()
+    sys.stdin = os.fdopen(slave, "r")
+
+    print("=" * 70)
+    print(f"SKIP-AHEAD BENCHMARK (scene {scene.id!r}, key after {PRESS_AFTER}s)")
+    print("=" * 70)
+    full, _ = play(scene)
+    print(f"{'unskipped scene':28} {full:8.2f} s")
+    latencies = []
+    for _ in range(REPEATS):
+        total, after_press = play(scene, master)
+        latencies.append(after_press)
+    print(f"{'skipped scene':28} {total:8.2f} s")
+    print(f"{'key press to scene shown':28} {min(latencies) * 1000:8.1f} ms min, "
+          f"{max(latencies) * 1000:.1f} ms max")
+    os.close(master)
+
+
+if __name__ == "__main__":
+    main()
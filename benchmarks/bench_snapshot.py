@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GameState snapshots vs full serialization
+
+Measures, as the choice history grows to 10k entries, the cost of a
+deep to_dict() (what a save to disk needs), of an immutable snapshot(),
+and of a snapshot followed by the first write (which pays the
+copy-on-write for one container).
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.story import GameState
+
+HISTORY_SIZES = [10, 100, 1_000, 10_000]
+
+
+def build_state(choices: int) -> GameState:
+    state = GameState()
+    for index in range(150):
+        state.visit_scene(f"scene_{index}")
+    for index in range(60):
+        state.set_flag(f"flag_{index}")
+    for index in range(30):
+        state.add_item(f"item_{index}")
+    for index in range(20):
+        state.set_variable(f"var_{index}", index)
+    for index in range(choices):
+        state.record_choice(f"scene_{index % 150}", index % 3, f"Choice {index % 7}")
+    return state
+
+
+def per_call(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    print("=" * 72)
+    print("GAME STATE SNAPSHOT BENCHMARK")
+    print("=" * 72)
+    print(f"{'choices':>8} {'to_dict (deep)':>16} {'snapshot':>12} {'snapshot+write':>16}")
+    for size in HISTORY_SIZES:
+        state = build_state(size)
+        number = max(20, 20_000 // size)
+        deep = per_call(state.to_dict, number)
+        snap = per_call(state.snapshot, 2_000)
+
+        toggle = [False]
+
+        def snapshot_then_write():
+            state.snapshot()
+            toggle[0] = not toggle[0]
+            state.set_flag("flag_0", toggle[0])
+
+        write = per_call(snapshot_then_write, 2_000)
+        print(f"{size:>8} {deep:13.1f} us {snap:9.2f} us {write:13.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: story import and construction cost
+
+For each shipped story, runs a fresh interpreter and measures import
+time, construction time and allocated memory, first with lazy scenes
+(the default) and then with every scene materialized (what the old
+eager constructors paid up front).
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+PROBE = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+tracemalloc.start()
+start = time.perf_counter()
+module = __import__({module!r}, fromlist=[{cls!r}])
+story_class = getattr(module, {cls!r})
+imported = time.perf_counter()
+import_memory = tracemalloc.get_traced_memory()[0]
+story = story_class()
+constructed = time.perf_counter()
+lazy_memory = tracemalloc.get_traced_memory()[0]
+for scene in story.scenes.values():
+    pass
+materialized = time.perf_counter()
+eager_memory = tracemalloc.get_traced_memory()[0]
+print(json.dumps({{
+    "scenes": len(story.scenes),
+    "import": imported - start,
+    "construct": constructed - imported,
+    "materialize": materialized - constructed,
+    "lazy_memory": lazy_memory - import_memory,
+    "eager_memory": eager_memory - import_memory,
+}}))
+"""
+
+STORIES = [
+    ("stories.noir_detective", "NoirDetectiveStory"),
+    ("stories.blood_and_neon", "BloodAndNeonStory"),
+]
+
+
+def main():
+    print("=" * 78)
+    print("STORY CONSTRUCTION BENCHMARK (fresh interpreter per story)")
+    print("=" * 78)
+    for module, cls in STORIES:
+        code = PROBE.format(root=str(ROOT), module=module, cls=cls)
+        result = json.loads(subprocess.check_output([sys.executable, "-c", code]))
+        print(f"\n{cls} ({result['scenes']} scenes)")
+        print(f"  import                  {result['import'] * 1000:8.2f} ms")
+        print(f"  construct (lazy)        {result['construct'] * 1000:8.2f} ms   "
+              f"{result['lazy_memory'] / 1024:8.1f} KiB allocated")
+        print(f"  construct + all scenes  {(result['construct'] + result['materialize']) * 1000:8.2f} ms   "
+              f"{result['eager_memory'] / 1024:8.1f} KiB allocated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-character Rich printing vs. the batched Typewriter
+
+Types the longest Blood and Neon scene description into an in-memory
+truecolor console and reports characters/second and CPU time.
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+from engine.colors import ColorPalette
+from engine.typewriter import Typewriter
+from stories.blood_and_neon import BloodAndNeonStory
+
+
+def make_console() -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=100)
+
+
+def legacy_type(console: Console, text: str, style: str, delay: float):
+    """The original ColorRenderer.print_narration loop"""
+    for char in text:
+        console.print(char, style=style, end="")
+        console.file.flush()
+        time.sleep(delay)
+
+
+def batched_type(console: Console, text: str, style: str, delay: float):
+    Typewriter().type_text(text, delay, style=style, console=console)
+
+
+def measure(label: str, func, text: str, delay: float):
+    console = make_console()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    func(console, text, ColorPalette.NARRATION, delay)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    target = max(len(text) - 1, 0) * delay
+    print(f"  {label:<10} {len(text) / wall:>12,.0f} chars/s   "
+          f"cpu {cpu * 1000:>8.1f} ms   wall {wall:>6.3f}s   drift {wall - target:+.3f}s")
+
+
+def main():
+    story = BloodAndNeonStory()
+    text = max((scene.description for scene in story.scenes.values()), key=len)
+
+    print("=" * 72)
+    print(f"TYPEWRITER BENCHMARK ({len(text)} characters)")
+    print("=" * 72)
+    for delay in (0.0, 0.002, 0.01):
+        print(f"\ndelay = {delay}s per character")
+        measure("legacy", legacy_type, text, delay)
+        measure("batched", batched_type, text, delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,85 @@
 """ASCII animation system with color support"""
 
-import time
-from typing import List, Union
+import statistics
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Union
 from rich.text import Text
 
+from .clock import Clock, get_clock
+
+
+@dataclass
+class FrameStats:
+    """Timing report for one animation run"""
+    frames_total: int = 0
+    frames_rendered: int = 0
+    frames_dropped: int = 0
+    elapsed: float = 0.0
+    target: float = 0.0
+    jitter: float = 0.0  # Std deviation of frame start lateness (seconds)
+    max_lateness: float = 0.0
+    
+    @property
+    def achieved_fps(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.frames_rendered / self.elapsed
+
+
+class FrameScheduler:
+    """
+    Drive frames against absolute deadlines on a monotonic clock.
+    
+    Frame ``i`` is due at ``start + i * period`` no matter how long
+    previous frames took to draw. When drawing falls a full period
+    behind, the frames whose slot has already passed are dropped so the
+    animation catches up instead of stretching out.
+    """
+    
+    def __init__(self, period: float, clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], None]] = None):
+        self.period = max(period, 0.0)
+        default = get_clock()
+        self.clock = clock or default.now
+        self.sleep = sleep or default.sleep
+        self.stats = FrameStats()
+    
+    def _wait_until(self, deadline: float):
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            self.sleep(remaining)
+    
+    def run(self, frames: Sequence, draw: Callable) -> FrameStats:
+        """Draw each frame on schedule and return timing stats"""
+        total = len(frames)
+        stats = FrameStats(frames_total=total, target=total * self.period)
+        lateness: List[float] = []
+        start = self.clock()
+        index = 0
+        
+        while index < total:
+            deadline = start + index * self.period
+            now = self.clock()
+            if self.period > 0 and index < total - 1 and now >= deadline + self.period:
+                # Behind by at least one frame: skip to the newest due frame
+                catch_up = min(total - 1, int((now - start) / self.period))
+                stats.frames_dropped += catch_up - index
+                index = catch_up
+                deadline = start + index * self.period
+            lateness.append(max(now - deadline, 0.0))
+            
+            draw(frames[index])
+            stats.frames_rendered += 1
+            index += 1
+            self._wait_until(start + index * self.period)
+        
+        stats.elapsed = self.clock() - start
+        if lateness:
+            stats.max_lateness = max(lateness)
+            stats.jitter = statistics.pstdev(lateness)
+        self.stats = stats
+        return stats
+
 
 class Animation:
     """Represents an ASCII art animation with color support"""
@@ -23,18 +99,25 @@ class Animation:
         self.frame_delay = frame_delay
         self.loop = loop
         self.color = color
+        self.last_stats: Optional[FrameStats] = None
     
-    def play(self, renderer=None):
-        """Play the animation"""
+    def play(self, renderer=None, scheduler: FrameScheduler = None,
+             clock: Clock = None) -> FrameStats:
+        """Play the animation on a drift-free schedule (on ``clock`` if given)"""
+        if scheduler is None:
+            clock = clock or get_clock()
+            scheduler = FrameScheduler(self.frame_delay, clock=clock.now, sleep=clock.sleep)
+        sequence = list(self.frames) * max(self.loop, 0)
+        
         if renderer:
-            for _ in range(self.loop):
-                for frame in self.frames:
-                    renderer.display_frame(frame, self.frame_delay, color=self.color)
+            if hasattr(renderer, "reset_frames"):
+                renderer.reset_frames()
+            draw = lambda frame: renderer.render_frame(frame, color=self.color)
         else:
-            for _ in range(self.loop):
-                for frame in self.frames:
-                    print(frame)
-                    time.sleep(self.frame_delay)
+            draw = print
+        
+        self.last_stats = scheduler.run(sequence, draw)
+        return self.last_stats
 
 
 class AnimationLibrary:
@@ -0,0 +1,167 @@
+"""Background autosave writer"""
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .save_manager import SaveManager
+
+
+@dataclass
+class AutosaveStats:
+    """Counters for the autosave worker"""
+    queued: int = 0       # Autosaves requested
+    coalesced: int = 0    # Requests replaced by a newer one before being written
+    written: int = 0      # Successful writes
+    failed: int = 0       # Writes that raised or returned False
+    last_latency: float = 0.0   # Request to write finished (seconds)
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    total_write_time: float = 0.0  # Time spent serializing and writing
+
+    @property
+    def mean_latency(self) -> float:
+        if self.written == 0:
+            return 0.0
+        return self.total_latency / self.written
+
+    @property
+    def mean_write_time(self) -> float:
+        if self.written == 0:
+            return 0.0
+        return self.total_write_time / self.written
+
+
+class AutosaveWorker:
+    """
+    Write autosaves on a background thread, keeping only the newest.
+
+    ``submit`` takes a function that builds the save data (typically from
+    an immutable state snapshot), so serialization and disk I/O both
+    happen off the main thread. If a request is still waiting when a new
+    one arrives, the older one is dropped: only the latest state matters
+    for an autosave. ``flush`` blocks until everything requested has been
+    written; it also runs at interpreter exit.
+    """
+
+    def __init__(self, save_manager: SaveManager, slot: int = SaveManager.AUTOSAVE_SLOT,
+                 save_name: str = "Autosave"):
+        self.save_manager = save_manager
+        self.slot = slot
+        self.save_name = save_name
+        self.stats = AutosaveStats()
+        self.last_error: Optional[BaseException] = None
+        self.last_write_failed = False
+        self._condition = threading.Condition()
+        self._pending: Optional[Callable[[], Dict[str, Any]]] = None
+        self._pending_deltas: Optional[List[tuple]] = None
+        self._pending_since = 0.0
+        self._busy = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def submit(self, build_state: Callable[[], Dict[str, Any]],
+               deltas: Optional[List[tuple]] = None):
+        """Queue an autosave, replacing any request not yet started"""
+        with self._condition:
+            self._ensure_started()
+            self.stats.queued += 1
+            if self._pending is not None:
+                self.stats.coalesced += 1
+                if deltas is not None and self._pending_deltas is not None:
+                    deltas = self._pending_deltas + deltas
+                elif deltas is not None:
+                    deltas = [("reset",)]  # Mixed requests: write the full state
+            else:
+                self._pending_since = time.monotonic()
+            self._pending = build_state
+            self._pending_deltas = deltas
+            self._condition.notify_all()
+
+    @property
+    def idle(self) -> bool:
+        """True when nothing is queued or being written"""
+        with self._condition:
+            return self._pending is None and not self._busy
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                build_state, requested = self._pending, self._pending_since
+                deltas = self._pending_deltas
+                self._pending = self._pending_deltas = None
+                self._busy = True
+
+            started = time.monotonic()
+            ok = False
+            try:
+                if deltas is None:
+                    ok = self.save_manager.save_game(self.slot, build_state(), self.save_name)
+                else:
+                    ok = self.save_manager.append_journal(self.slot, deltas, build_state,
+                                                          self.save_name)
+                error = None
+            except Exception as exc:  # Never let a failed autosave kill the worker
+                error = exc
+            finished = time.monotonic()
+
+            with self._condition:
+                if ok:
+                    latency = finished - requested
+                    self.stats.written += 1
+                    self.stats.last_latency = latency
+                    self.stats.max_latency = max(self.stats.max_latency, latency)
+                    self.stats.total_latency += latency
+                    self.stats.total_write_time += finished - started
+                    self.last_error = None
+                else:
+                    self.stats.failed += 1
+                    self.last_error = error
+                self.last_write_failed = not ok
+                self._busy = False
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all requested autosaves are written; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._busy:
+                if self._thread is None or not self._thread.is_alive():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return self._pending is None and not self._busy
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush and stop the worker thread, then sync batched writes to disk"""
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.save_manager.sync()
+        atexit.unregister(self.close)
+        return flushed
+
+    def __enter__(self) -> "AutosaveWorker":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
@@ -0,0 +1,328 @@
+"""Compiled story bundles: a compact, indexed scene file loaded on demand
+
+Layout (little-endian)::
+
+    header   magic "TTSB", version, flags, scene count, art count, meta length
+    meta     UTF-8 JSON: title, description, starting scene, scene ids, palettes
+    index    one (offset, length) entry per scene, then one per art record
+    records  JSON scene and art records, zlib-compressed when flagged
+
+Scenes refer to art (strings, Rich Text, animations) by index into the
+art table, so artwork shared between scenes is stored once. Conditions
+and ``on_enter`` callbacks are stored as declarative ops (see
+``engine.logic``), so a bundle never contains Python code.
+"""
+
+import argparse
+import importlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from rich.text import Span, Text
+
+from .animation import Animation
+from .logic import LogicError, Predicate, condition_from_data, effects_from_data, trace_effects
+from .story import Choice, Scene, Story
+
+
+MAGIC = b"TTSB"
+VERSION = 1
+FLAG_ZLIB = 0x1
+
+HEADER = struct.Struct("<4sHHIII")  # magic, version, flags, scenes, art, meta length
+ENTRY = struct.Struct("<QI")  # record offset, record length
+
+
+class BundleError(Exception):
+    """Raised when a story cannot be compiled or a bundle cannot be read"""
+
+
+# ----------------------------------------------------------------------
+# Compiling
+# ----------------------------------------------------------------------
+class _ArtTable:
+    """Deduplicating table of encoded art records"""
+
+    def __init__(self):
+        self.records: List[bytes] = []
+        self._index: Dict[bytes, int] = {}
+        self._seen: Dict[int, int] = {}  # id(obj) -> index, for shared objects
+
+    def add(self, art) -> Optional[int]:
+        if art is None:
+            return None
+        key = id(art)
+        if key in self._seen:
+            return self._seen[key]
+        record = json.dumps(self._encode(art), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index = self._index.get(record)
+        if index is None:
+            index = len(self.records)
+            self.records.append(record)
+            self._index[record] = index
+        self._seen[key] = index
+        return index
+
+    def _encode(self, art) -> Dict[str, Any]:
+        if isinstance(art, Animation):
+            return {
+                "kind": "animation",
+                "frames": [self.add(frame) for frame in art.frames],
+                "frame_delay": art.frame_delay,
+                "loop": art.loop,
+                "color": art.color,
+            }
+        if isinstance(art, Text):
+            return {
+                "kind": "text",
+                "plain": art.plain,
+                "style": str(art.style),
+                "spans": [[span.start, span.end, str(span.style)] for span in art.spans],
+            }
+        if isinstance(art, str):
+            return {"kind": "str", "value": art}
+        raise BundleError(f"Unsupported art type: {type(art).__name__}")
+
+
+def _encode_condition(scene: Scene, choice: Choice):
+    if choice.condition is None:
+        return None
+    if isinstance(choice.condition, Predicate):
+        try:
+            return choice.condition.to_data()
+        except LogicError as error:
+            raise BundleError(
+                f"Scene {scene.id!r}: condition on {choice.text!r} is not declarative ({error})"
+            ) from None
+    raise BundleError(
+        f"Scene {scene.id!r}: condition on {choice.text!r} is a Python callable; "
+        "use the predicates in engine.logic"
+    )
+
+
+def compile_story(story: Story, path: str, compress: bool = True) -> int:
+    """
+    Write a story's scene graph to a bundle file.
+
+    Returns:
+        Size of the bundle in bytes
+    """
+    art = _ArtTable()
+    palettes: List[Dict[str, str]] = []
+    palette_index: Dict[str, int] = {}
+    scene_ids = list(story.scenes)
+    scene_records: List[bytes] = []
+
+    for scene_id in scene_ids:
+        scene = story.scenes[scene_id]
+        palette_key = json.dumps(scene.palette, sort_keys=True)
+        if palette_key not in palette_index:
+            palette_index[palette_key] = len(palettes)
+            palettes.append(scene.palette)
+        try:
+            on_enter = trace_effects(scene.on_enter)
+        except LogicError as error:
+            raise BundleError(f"Scene {scene_id!r}: on_enter is not declarative ({error})") from None
+        record = {
+            "id": scene.id,
+            "description": scene.description,
+            "dialogue": [list(line) for line in scene.dialogue],
+            "choices": [
+                [choice.text, choice.next_scene, _encode_condition(scene, choice)]
+                for choice in scene.choices
+            ],
+            "is_ending": scene.is_ending,
+            "on_enter": on_enter.to_data() if on_enter is not None else None,
+            "palette": palette_index[palette_key],
+            "art": art.add(scene.ascii_art),
+            "animation": art.add(scene.animation),
+        }
+        scene_records.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    meta = json.dumps({
+        "title": story.title,
+        "description": story.description,
+        "starting_scene": story.starting_scene,
+        "source_class": getattr(story, "source_class", story.__class__.__name__),
+        "scenes": scene_ids,
+        "palettes": palettes,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    records = scene_records + art.records
+    if compress:
+        records = [zlib.compress(record, 9) for record in records]
+
+    offset = HEADER.size + len(meta) + ENTRY.size * len(records)
+    index = bytearray()
+    for record in records:
+        index += ENTRY.pack(offset, len(record))
+        offset += len(record)
+
+    header = HEADER.pack(MAGIC, VERSION, FLAG_ZLIB if compress else 0,
+                         len(scene_records), len(art.records), len(meta))
+    with open(path, "wb") as handle:
+        handle.write(header)
+        handle.write(meta)
+        handle.write(index)
+        for record in records:
+            handle.write(record)
+    return offset
+
+
+# ----------------------------------------------------------------------
+# Loading
+# ----------------------------------------------------------------------
+class BundledStory(Story):
+    """
+    A story backed by a compiled bundle.
+
+    The file is memory-mapped; only the header, metadata and offset table
+    are read up front. Each scene is decoded the first time it is looked
+    up, and art records are decoded once and shared between scenes.
+    Close it (or use it as a context manager) to release the map::
+
+        with BundledStory("noir.ttsb") as story:
+            ...
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        with open(path, "rb") as handle:
+            # mmap cannot map an empty file
+            if os.fstat(handle.fileno()).st_size < HEADER.size:
+                raise BundleError(f"{path}: file too small to be a story bundle")
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except BundleError:
+            self._map.close()
+            raise
+
+    def _read_index(self):
+        """Check the header and record table and declare the scenes"""
+        path = self.path
+        magic, version, flags, scene_count, art_count, meta_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise BundleError(f"{path}: not a story bundle")
+        if version != VERSION:
+            raise BundleError(f"{path}: unsupported bundle version {version}")
+
+        self._compressed = bool(flags & FLAG_ZLIB)
+        self._index_offset = HEADER.size + meta_length
+        self._scene_count = scene_count
+        self._art_count = art_count
+        self._art_cache: Dict[int, Any] = {}
+        size = len(self._map)
+        if self._index_offset + ENTRY.size * (scene_count + art_count) > size:
+            raise BundleError(f"{path}: corrupt bundle (truncated header or index)")
+        for entry in range(scene_count + art_count):
+            offset, length = ENTRY.unpack_from(self._map, self._index_offset + entry * ENTRY.size)
+            if offset + length > size:
+                raise BundleError(f"{path}: corrupt bundle (record {entry} is truncated)")
+
+        try:
+            meta = json.loads(self._map[HEADER.size:self._index_offset].decode("utf-8"))
+            self._palettes = meta["palettes"]
+            self.title = meta["title"]
+            self.description = meta["description"]
+            self.starting_scene = meta["starting_scene"]
+            self.source_class = meta["source_class"]
+            scene_ids = meta["scenes"]
+        except (ValueError, KeyError, TypeError) as error:
+            raise BundleError(f"{path}: corrupt bundle metadata ({error})") from error
+        for index, scene_id in enumerate(scene_ids):
+            self.scenes.declare(scene_id, partial(self._load_scene, index))
+
+    def close(self):
+        """Release the memory map"""
+        self._map.close()
+
+    def __enter__(self) -> "BundledStory":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def _record(self, entry: int) -> Dict[str, Any]:
+        try:
+            offset, length = ENTRY.unpack_from(self._map, self._index_offset + entry * ENTRY.size)
+            data = self._map[offset:offset + length]
+            if self._compressed:
+                data = zlib.decompress(data)
+            return json.loads(data.decode("utf-8"))
+        except (struct.error, zlib.error, ValueError) as error:
+            raise BundleError(f"{self.path}: corrupt bundle record {entry} ({error})") from error
+
+    def _art(self, index: Optional[int]):
+        if index is None:
+            return None
+        art = self._art_cache.get(index)
+        if art is None:
+            record = self._record(self._scene_count + index)
+            kind = record["kind"]
+            if kind == "str":
+                art = record["value"]
+            elif kind == "text":
+                art = Text(record["plain"], style=record["style"],
+                           spans=[Span(start, end, style) for start, end, style in record["spans"]])
+            elif kind == "animation":
+                art = Animation([self._art(frame) for frame in record["frames"]],
+                                frame_delay=record["frame_delay"], loop=record["loop"],
+                                color=record["color"])
+            else:
+                raise BundleError(f"{self.path}: unknown art kind {kind!r}")
+            self._art_cache[index] = art
+        return art
+
+    def _load_scene(self, index: int) -> Scene:
+        record = self._record(index)
+        return Scene(
+            id=record["id"],
+            description=record["description"],
+            ascii_art=self._art(record["art"]),
+            animation=self._art(record["animation"]),
+            dialogue=[tuple(line) for line in record["dialogue"]],
+            choices=[
+                Choice(text, next_scene, condition_from_data(condition))
+                for text, next_scene, condition in record["choices"]
+            ],
+            is_ending=record["is_ending"],
+            on_enter=effects_from_data(record["on_enter"]),
+            palette=dict(self._palettes[record["palette"]]),
+        )
+
+
+def load_story_class(spec: str) -> type:
+    """Resolve ``package.module:ClassName``"""
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise BundleError(f"Expected module:Class, got {spec!r}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile a story into a bundle")
+    parser.add_argument("story", help="Story class, e.g. stories.noir_detective:NoirDetectiveStory")
+    parser.add_argument("output", help="Bundle file to write")
+    parser.add_argument("--no-compress", action="store_true", help="Store records uncompressed")
+    args = parser.parse_args(argv)
+
+    try:
+        story = load_story_class(args.story)()
+        size = compile_story(story, args.output, compress=not args.no_compress)
+    except BundleError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    print(f"Wrote {args.output}: {len(story.scenes)} scenes, {size} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Clocks: the time source and sleep behind every timed effect
+
+Scene pauses, typewriter ticks, animation frames, visual effects and
+the opening sequence all wait through a ``Clock`` instead of calling
+``time.sleep``, so the same code can run at its real pace, N times
+faster, or instantly on virtual time (tests and simulations).
+
+Components take a ``clock`` argument; without one they use the process
+default from ``get_clock()``, which is ``RealClock`` unless set with
+``set_clock()`` or the TERMINAL_THEATRE_CLOCK environment variable
+("real", "virtual" or an acceleration such as "x10").
+"""
+
+import os
+import time
+from threading import Event
+from typing import Optional
+
+
+class Clock:
+    """A monotonic time source and a way to wait on it"""
+
+    def now(self) -> float:
+        """Current time in seconds (only differences are meaningful)"""
+        raise NotImplementedError
+
+    def sleep(self, seconds: float):
+        """Wait until ``seconds`` have passed on this clock"""
+        raise NotImplementedError
+
+    def wait(self, event: Event, seconds: float) -> bool:
+        """Sleep like ``sleep`` but stop early once ``event`` is set; True if it was"""
+        if not event.is_set():
+            self.sleep(seconds)
+        return event.is_set()
+
+
+class RealClock(Clock):
+    """Wall-clock pacing for interactive play"""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, event: Event, seconds: float) -> bool:
+        return event.wait(max(seconds, 0.0))
+
+
+class AcceleratedClock(Clock):
+    """Real time sped up ``factor`` times: a 1 s pause takes 1/factor s"""
+
+    def __init__(self, factor: float):
+        if factor <= 0:
+            raise ValueError(f"acceleration must be positive, not {factor}")
+        self.factor = factor
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        return self._origin + (time.monotonic() - self._origin) * self.factor
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds / self.factor)
+
+    def wait(self, event: Event, seconds: float) -> bool:
+        return event.wait(max(seconds, 0.0) / self.factor)
+
+
+class VirtualClock(Clock):
+    """Time that only passes when slept through; sleeps return at once"""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+        self.slept = 0.0   # Total seconds slept
+        self.sleeps = 0    # Number of sleeps
+
+    def now(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.time += seconds
+            self.slept += seconds
+            self.sleeps += 1
+
+
+def clock_from_spec(spec: str) -> Clock:
+    """A clock from "real", "virtual" or an acceleration like "x10" """
+    name = spec.strip().lower()
+    if name in ("", "real"):
+        return RealClock()
+    if name == "virtual":
+        return VirtualClock()
+    if name.startswith("x"):
+        try:
+            return AcceleratedClock(float(name[1:]))
+        except ValueError:
+            pass
+    raise ValueError(f"unknown clock {spec!r} (expected real, virtual or x<factor>)")
+
+
+_default_clock: Optional[Clock] = None
+
+
+def get_clock() -> Clock:
+    """The process-wide default clock"""
+    global _default_clock
+    if _default_clock is None:
+        _default_clock = clock_from_spec(os.environ.get("TERMINAL_THEATRE_CLOCK", "real"))
+    return _default_clock
+
+
+def set_clock(clock: Optional[Clock]):
+    """Replace the default clock (None goes back to the environment's choice)"""
+    global _default_clock
+    _default_clock = clock
@@ -4,12 +4,15 @@ from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from rich.style import Style
-import time
 from typing import List
 from copy import deepcopy
+from threading import Event
 import sys
 import os
 
+from .clock import Clock, get_clock
+from .typewriter import Typewriter
+
 
 class ColorPalette:
     """Pre-defined color palettes for different moods and scenes"""
@@ -55,32 +58,35 @@ class VisualEffects:
     """Visual effects for enhanced atmosphere"""
     
     @staticmethod
-    def flicker(console: Console, text: str, color: str, duration: float = 1.0, intensity: int = 5):
+    def flicker(console: Console, text: str, color: str, duration: float = 1.0, intensity: int = 5,
+                clock: Clock = None):
         """Create a flickering effect like neon signs"""
-        end_time = time.time() + duration
+        clock = clock or get_clock()
+        end_time = clock.now() + duration
         dim_color = ColorPalette.NOIR_SHADOW
         
-        while time.time() < end_time:
+        while clock.now() < end_time:
             # Bright phase
             console.print(text, style=f"bold {color}", end="\r")
-            time.sleep(0.1)
+            clock.sleep(0.1)
             
             # Dim phase (random intensity)
-            if time.time() % 0.5 < 0.25:
+            if clock.now() % 0.5 < 0.25:
                 console.print(text, style=f"dim {dim_color}", end="\r")
-                time.sleep(0.05)
+                clock.sleep(0.05)
     
     @staticmethod
-    def pulse(console: Console, text: str, color: str, cycles: int = 3):
+    def pulse(console: Console, text: str, color: str, cycles: int = 3, clock: Clock = None):
         """Create a pulsing effect for emphasis"""
+        clock = clock or get_clock()
         for _ in range(cycles):
             # Fade in (bright)
             console.print(text, style=f"bold {color}")
-            time.sleep(0.3)
+            clock.sleep(0.3)
             
             # Fade out (dim)
             console.print(text, style=f"dim {color}", end="\r")
-            time.sleep(0.3)
+            clock.sleep(0.3)
     
     @staticmethod
     def rain_colored() -> List[str]:
@@ -136,17 +142,20 @@ class VisualEffects:
         return frames
     
     @staticmethod
-    def lightning_flash(console: Console, text: str, flashes: int = 2):
+    def lightning_flash(console: Console, text: str, flashes: int = 2, clock: Clock = None):
         """Create lightning flash effect"""
+        clock = clock or get_clock()
         for _ in range(flashes):
             console.print(text, style=f"bold on white {ColorPalette.LIGHTNING_WHITE}")
-            time.sleep(0.05)
+            clock.sleep(0.05)
             console.print(text, style=f"{ColorPalette.NOIR_DARK}")
-            time.sleep(0.2)
+            clock.sleep(0.2)
     
     @staticmethod
-    def color_transition(console: Console, text: str, from_color: str, to_color: str, steps: int = 10):
+    def color_transition(console: Console, text: str, from_color: str, to_color: str, steps: int = 10,
+                         clock: Clock = None):
         """Smooth color transition effect"""
+        clock = clock or get_clock()
         # Note: This is a simplified version - Rich can handle gradients
         for i in range(steps):
             progress = i / steps
@@ -155,15 +164,20 @@ class VisualEffects:
             else:
                 style = to_color
             console.print(text, style=style, end="\r")
-            time.sleep(0.1)
+            clock.sleep(0.1)
 
 
 class ColorRenderer:
     """Enhanced renderer with Rich color support"""
     
-    def __init__(self):
+    def __init__(self, clock: Clock = None, skip: Event = None):
         self.console = Console()
         self.supports_color = self._check_color_support()
+        self.clock = clock or get_clock()
+        sleep = self.clock.sleep
+        if skip is not None:  # Wake mid-tick when a skip comes in
+            sleep = lambda seconds: self.clock.wait(skip, seconds)
+        self.typewriter = Typewriter(clock=self.clock.now, sleep=sleep, skip=skip)
     
     def _check_color_support(self) -> bool:
         """Check if terminal supports colors"""
@@ -198,9 +212,7 @@ class ColorRenderer:
         # Dialogue text with typewriter effect
         text_style = text_color or ColorPalette.DIALOGUE
         if self.supports_color:
-            for char in text:
-                self.console.print(char, style=text_style, end="")
-                time.sleep(delay)
+            self.typewriter.type_text(text, delay, style=text_style, console=self.console)
             self.console.print("\n")
         else:
             # Fast fallback
@@ -211,10 +223,7 @@ class ColorRenderer:
         narration_color = color or ColorPalette.NARRATION
         
         if self.supports_color:
-            for char in text:
-                self.console.print(char, style=narration_color, end="")
-                sys.stdout.flush()
-                time.sleep(delay)
+            self.typewriter.type_text(text, delay, style=narration_color, console=self.console)
             self.console.print()
         else:
             print(text)
@@ -0,0 +1,257 @@
+"""Compact containers used by the game state"""
+
+import sys
+import tempfile
+import threading
+from array import array
+from collections.abc import MutableSet, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class OrderedSet(MutableSet):
+    """
+    Insertion-ordered set with O(1) membership.
+
+    Backed by a dict, so iteration order is the order items were first
+    added, which keeps serialized output identical to the old lists.
+    ``append`` is accepted as an alias of ``add`` for list-style callers.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._items: Dict[Any, None] = dict.fromkeys(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._items.__sizeof__()
+
+    def __getitem__(self, index: int) -> Any:
+        # Positional access for list-style callers (O(n) except at the ends)
+        if index == -1 and self._items:
+            return next(reversed(self._items))
+        return list(self._items)[index]
+
+    def add(self, item: Any):
+        self._items[item] = None
+
+    append = add
+
+    def discard(self, item: Any):
+        self._items.pop(item, None)
+
+    def copy(self) -> "OrderedSet":
+        return OrderedSet(self._items)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, OrderedSet):
+            return list(self._items) == list(other._items)
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"OrderedSet({list(self._items)!r})"
+
+
+class _SpillFile:
+    """
+    Append-only temp file of packed choice history entries.
+    
+    Shared by a history and its copies; each of them knows how long a
+    prefix of the file belongs to it.
+    """
+    
+    __slots__ = ("file", "count", "lock")
+    
+    def __init__(self, directory: Optional[str] = None):
+        self.file = tempfile.TemporaryFile(prefix="choices-", dir=directory)
+        self.count = 0
+        self.lock = threading.Lock()  # Autosaves read from another thread
+    
+    def append(self, entries: array):
+        with self.lock:
+            self.file.seek(self.count * entries.itemsize)
+            entries.tofile(self.file)
+            self.count += len(entries)
+    
+    def read(self, start: int, stop: int) -> array:
+        chunk = array("Q")
+        with self.lock:
+            self.file.seek(start * chunk.itemsize)
+            chunk.frombytes(self.file.read((stop - start) * chunk.itemsize))
+        return chunk
+
+
+class ChoiceHistory(Sequence):
+    """
+    Append-only record of (scene_id, choice_index, choice_text) tuples.
+    
+    Scene ids and choice texts repeat constantly, so each distinct string
+    is stored once in a table and every entry is packed into a single
+    64-bit integer (scene code, text code, choice index) in a typed
+    array, instead of a tuple of three objects. Reading an entry rebuilds
+    the tuple.
+    
+    With a ``window``, at most about twice that many entries stay in
+    memory: older ones are spilled to an anonymous temp file (in
+    ``spill_dir``) and read back on demand, so long runs use bounded
+    memory. Length stays O(1) either way.
+    """
+    
+    __slots__ = ("_strings", "_codes", "_entries", "_view", "_spill", "_limit",
+                 "window", "spill_dir")
+    
+    INDEX_BITS = 16
+    CODE_BITS = 24
+    READ_CHUNK = 65536  # Spilled entries read back per file access
+    
+    def __init__(self, entries: Iterable[Tuple[str, int, str]] = (),
+                 window: Optional[int] = None, spill_dir: Optional[str] = None):
+        self._strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._entries = array("Q")
+        # (spilled count, in-memory array), swapped as one so other threads
+        # reading the history never see the two out of step
+        self._view: Tuple[int, array] = (0, self._entries)
+        self._spill: Optional[_SpillFile] = None
+        if window is not None and window < 1:
+            raise ValueError("history window must be at least 1")
+        self.window = window
+        self.spill_dir = spill_dir
+        self._limit = 2 * window if window else sys.maxsize
+        for scene_id, choice_index, choice_text in entries:
+            self.record(scene_id, choice_index, choice_text)
+    
+    def _code(self, string: str) -> int:
+        code = len(self._strings)
+        if code >> self.CODE_BITS:
+            raise OverflowError("too many distinct strings in choice history")
+        string = sys.intern(string)
+        self._strings.append(string)
+        self._codes[string] = code
+        return code
+    
+    def record(self, scene_id: str, choice_index: int, choice_text: str):
+        """Append one choice"""
+        codes = self._codes
+        scene = codes.get(scene_id)
+        if scene is None:
+            scene = self._code(scene_id)
+        text = codes.get(choice_text)
+        if text is None:
+            text = self._code(choice_text)
+        if choice_index >> self.INDEX_BITS:  # Also catches negatives
+            raise OverflowError(f"choice index out of range: {choice_index}")
+        entries = self._entries
+        entries.append((scene << 40) | (text << 16) | choice_index)
+        if len(entries) > self._limit:
+            self._spill_oldest()
+    
+    def _spill_oldest(self):
+        """Move all but the newest ``window`` entries to the spill file"""
+        spilled, entries = self._view
+        spill = self._spill
+        if spill is None:
+            spill = self._spill = _SpillFile(self.spill_dir)
+        elif spill.count != spilled:
+            # A copy of this history has appended past our prefix: fork
+            fork = _SpillFile(self.spill_dir)
+            for start in range(0, spilled, self.READ_CHUNK):
+                fork.append(spill.read(start, min(start + self.READ_CHUNK, spilled)))
+            spill = self._spill = fork
+        moved = len(entries) - self.window
+        spill.append(entries[:moved])
+        self._entries = entries[moved:]
+        self._view = (spilled + moved, self._entries)
+    
+    def append(self, entry: Tuple[str, int, str]):
+        self.record(*entry)
+    
+    def copy(self, length: Optional[int] = None) -> "ChoiceHistory":
+        """Copy the first ``length`` entries (all by default)"""
+        # The string table only ever grows and the spill file is only
+        # appended to, so copies share both
+        spilled, entries = self._view
+        clone = ChoiceHistory(window=self.window, spill_dir=self.spill_dir)
+        clone._strings = self._strings
+        clone._codes = self._codes
+        clone._spill = self._spill
+        if length is not None and length < spilled:
+            clone._entries = array("Q")
+            clone._view = (length, clone._entries)
+        else:
+            clone._entries = entries[:None if length is None else length - spilled]
+            clone._view = (spilled, clone._entries)
+        return clone
+    
+    def _unpack(self, packed: int) -> Tuple[str, int, str]:
+        strings = self._strings
+        return (strings[packed >> 40], packed & 0xFFFF, strings[(packed >> 16) & 0xFFFFFF])
+    
+    def _packed(self, start: int, stop: int) -> Iterator[int]:
+        """Packed entries in [start, stop), from the spill file then memory"""
+        spilled, entries = self._view
+        for chunk_start in range(start, min(stop, spilled), self.READ_CHUNK):
+            yield from self._spill.read(chunk_start, min(chunk_start + self.READ_CHUNK, stop, spilled))
+        if stop > spilled:
+            yield from entries[max(start - spilled, 0):stop - spilled]
+    
+    def __getitem__(self, position):
+        spilled, entries = self._view
+        if isinstance(position, slice):
+            start, stop, step = position.indices(spilled + len(entries))
+            if step == 1:
+                return [self._unpack(packed) for packed in self._packed(start, stop)]
+            return [self[index] for index in range(start, stop, step)]
+        if position < 0:
+            position += spilled + len(entries)
+        if position >= spilled:
+            return self._unpack(entries[position - spilled])
+        if position < 0:
+            raise IndexError("choice history index out of range")
+        return self._unpack(self._spill.read(position, position + 1)[0])
+    
+    def __len__(self) -> int:
+        spilled, entries = self._view
+        return spilled + len(entries)
+    
+    def __sizeof__(self) -> int:
+        # The string table and spill file are shared with copies
+        return object.__sizeof__(self) + self.nbytes()
+    
+    def __iter__(self) -> Iterator[Tuple[str, int, str]]:
+        unpack = self._unpack
+        for packed in self._packed(0, len(self)):
+            yield unpack(packed)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ChoiceHistory, list, tuple)):
+            return len(self) == len(other) and all(
+                tuple(mine) == tuple(theirs) for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"ChoiceHistory({list(self)!r})"
+    
+    @property
+    def spilled(self) -> int:
+        """Number of entries held in the spill file rather than in memory"""
+        return self._view[0]
+    
+    def nbytes(self) -> int:
+        """Approximate memory held by the entry array"""
+        return self._entries.itemsize * len(self._entries)
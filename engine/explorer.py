@@ -0,0 +1,247 @@
+"""Exhaustive state-space explorer for stories
+
+Walks every reachable (scene, flags, inventory, variables) state of a
+story, running each scene's ``on_enter`` effects and evaluating choice
+conditions against that state, so flag-gated branches are followed
+exactly as a player would reach them. Each state is expanded once; the
+frontier of every breadth-first level is split across a process pool.
+
+Conditions that read anything beyond flags, items and variables (the
+visited scenes, the choice history) see only the current path's scene,
+so such branches are explored as if the scene were the first visit.
+
+Run it from the command line with::
+
+    python -m engine.explorer stories.noir_detective:NoirDetectiveStory
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .containers import OrderedSet
+from .story import GameState, Story
+
+
+# A state on entering a scene, before its on_enter effects:
+# (scene id, set flags, inventory, variables), all sorted tuples
+StateKey = Tuple[str, Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, Any], ...]]
+
+_ENDING = 0
+_DEAD_END = 1
+_MISSING = 2
+_CHOICES = 3
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a variable value"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def state_key(scene_id: str, state: GameState) -> StateKey:
+    """Key of a state about to enter scene_id; equal keys explore identically"""
+    return (
+        scene_id,
+        tuple(sorted(flag for flag, value in state.flags.items() if value)),
+        tuple(sorted(state.inventory)),
+        tuple(sorted(((name, _freeze(value)) for name, value in state.variables.items()),
+                     key=itemgetter(0))),
+    )
+
+
+def state_from_key(key: StateKey) -> GameState:
+    """A fresh GameState matching a key, positioned before its scene"""
+    state = GameState()
+    state.flags = dict.fromkeys(key[1], True)
+    state.inventory = OrderedSet(key[2])
+    state.variables = dict(key[3])
+    return state
+
+
+def expand(story: Story, key: StateKey) -> tuple:
+    """
+    Enter a state's scene and report what happens:
+    (key, _ENDING, None), (key, _DEAD_END, None), (key, _MISSING, None)
+    or (key, _CHOICES, child keys)
+    """
+    scene_id = key[0]
+    scene = story.get_scene(scene_id)
+    if scene is None:
+        return (key, _MISSING, None)
+    state = state_from_key(key)
+    state.visit_scene(scene_id)
+    if scene.on_enter:
+        scene.on_enter(state)
+    if scene.is_ending:
+        return (key, _ENDING, None)
+    choices = story.choice_cache.available(scene, state)
+    if not choices:
+        return (key, _DEAD_END, None)
+    return (key, _CHOICES, [state_key(choice.next_scene, state) for choice in choices])
+
+
+# Story of each pool worker, built once by _init_worker
+_worker_story: Optional[Story] = None
+
+
+def _init_worker(story_factory: Callable[[], Story]):
+    global _worker_story
+    _worker_story = story_factory()
+
+
+def _expand_batch(keys: List[StateKey]) -> List[tuple]:
+    return [expand(_worker_story, key) for key in keys]
+
+
+@dataclass
+class ExplorationReport:
+    """What an exploration found"""
+    title: str
+    states: int = 0                                       # Distinct states expanded
+    scenes_reached: List[str] = field(default_factory=list)
+    endings: Dict[str, int] = field(default_factory=dict)  # Ending -> states reaching it
+    unreachable_scenes: List[str] = field(default_factory=list)
+    dead_ends: List[StateKey] = field(default_factory=list)  # States with no choices
+    missing_scenes: Dict[str, str] = field(default_factory=dict)  # Missing -> a referrer
+    truncated: bool = False                               # Stopped at max_states
+    elapsed: float = 0.0
+
+    @property
+    def states_per_second(self) -> float:
+        return self.states / self.elapsed if self.elapsed else 0.0
+
+    def dead_ends_by_scene(self) -> Dict[str, int]:
+        """Dead-end states per scene"""
+        return dict(Counter(key[0] for key in self.dead_ends))
+
+
+def explore(story_factory: Callable[[], Story], processes: Optional[int] = None,
+            max_states: int = 1_000_000, batch_size: int = 256) -> ExplorationReport:
+    """
+    Explore every reachable state of a story
+
+    Args:
+        story_factory: Builds the story (a Story subclass works); must be
+            picklable when processes > 1
+        processes: Pool size (defaults to the CPU count); 1 explores in
+            this process
+        max_states: Stop after this many states (the report is marked truncated)
+        batch_size: States per task sent to a worker
+    """
+    started = time.perf_counter()
+    story = story_factory()
+    report = ExplorationReport(title=story.title)
+    processes = processes or multiprocessing.cpu_count()
+
+    start = state_key(story.starting_scene, GameState())
+    seen = {start}
+    frontier = [start]
+    reached = set()
+    parents: Dict[str, str] = {}  # Scene -> a scene with a choice leading to it
+    endings: Counter = Counter()
+
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes, initializer=_init_worker,
+                                    initargs=(story_factory,))
+    try:
+        while frontier and not report.truncated:
+            if pool is not None and len(frontier) > batch_size:
+                batches = [frontier[index:index + batch_size]
+                           for index in range(0, len(frontier), batch_size)]
+                results = (result for batch in pool.imap_unordered(_expand_batch, batches)
+                           for result in batch)
+            else:
+                results = (expand(story, key) for key in frontier)
+
+            next_frontier = []
+            for key, outcome, children in results:
+                report.states += 1
+                scene_id = key[0]
+                if outcome == _MISSING:
+                    report.missing_scenes.setdefault(scene_id, parents.get(scene_id, ""))
+                    continue
+                reached.add(scene_id)
+                if outcome == _ENDING:
+                    endings[scene_id] += 1
+                elif outcome == _DEAD_END:
+                    report.dead_ends.append(key)
+                else:
+                    for child in children:
+                        parents.setdefault(child[0], scene_id)
+                        if child not in seen:
+                            seen.add(child)
+                            next_frontier.append(child)
+            frontier = next_frontier
+            if len(seen) > max_states:
+                report.truncated = True
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    report.scenes_reached = sorted(reached)
+    report.endings = dict(sorted(endings.items()))
+    report.unreachable_scenes = sorted(set(story.scenes) - reached)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def print_report(report: ExplorationReport):
+    """Print an exploration report"""
+    print(f"Story: {report.title}")
+    print(f"States explored: {report.states:,} in {report.elapsed:.2f}s "
+          f"({report.states_per_second:,.0f} states/s)"
+          + (" - TRUNCATED" if report.truncated else ""))
+    print(f"Scenes reached: {len(report.scenes_reached)}")
+    print()
+    print(f"Endings reached ({len(report.endings)}):")
+    for ending, states in report.endings.items():
+        print(f"  ✓ {ending} ({states:,} states)")
+    if report.unreachable_scenes:
+        print(f"\nUnreachable scenes ({len(report.unreachable_scenes)}):")
+        for scene_id in report.unreachable_scenes:
+            print(f"  - {scene_id}")
+    if report.dead_ends:
+        print(f"\nDead ends ({len(report.dead_ends):,} states):")
+        for scene_id, states in sorted(report.dead_ends_by_scene().items()):
+            print(f"  ✗ {scene_id} (no choices in {states:,} states)")
+    if report.missing_scenes:
+        print(f"\nMissing scenes ({len(report.missing_scenes)}):")
+        for scene_id, referrer in sorted(report.missing_scenes.items()):
+            print(f"  ✗ {scene_id} (referenced from {referrer or 'the start'})")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .bundle import BundleError, load_story_class
+
+    parser = argparse.ArgumentParser(description="Explore every reachable state of a story")
+    parser.add_argument("story", help="Story class, e.g. stories.noir_detective:NoirDetectiveStory")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes")
+    parser.add_argument("--max-states", type=int, default=1_000_000,
+                        help="Stop after this many states")
+    args = parser.parse_args(argv)
+
+    try:
+        story_class = load_story_class(args.story)
+    except BundleError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    report = explore(story_class, processes=args.processes, max_states=args.max_states)
+    print_report(report)
+    return 1 if report.dead_ends or report.missing_scenes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""Differential frame rendering for animations"""
+
+import shutil
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional, TextIO, Tuple
+
+from rich.cells import cell_len
+
+from .typewriter import ANSI_ESCAPE
+
+
+Cell = Tuple[str, str]  # (character, active SGR escape codes)
+Line = List[Cell]
+
+RESET = "\x1b[0m"
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CURSOR_HOME = "\x1b[H"
+ERASE_TO_EOL = "\x1b[K"
+ERASE_BELOW = "\x1b[J"
+
+
+def move_to(row: int, column: int) -> str:
+    """ANSI cursor position (0-based arguments)"""
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+# SGR parameters that make a blank cell look different (underline, reverse,
+# strike, overline, background colours)
+BLANK_VISIBLE_PARAMS = frozenset(
+    ["4", "7", "9", "21", "53"]
+    + [str(code) for code in range(40, 48)]
+    + [str(code) for code in range(100, 108)]
+)
+
+
+@lru_cache(maxsize=256)
+def visible_on_blank(style: str) -> bool:
+    """Whether an SGR style changes how a space looks"""
+    for code in ANSI_ESCAPE.findall(style):
+        params = code[2:-1].split(";")
+        index = 0
+        while index < len(params):
+            param = params[index]
+            if param == "48":
+                return True
+            if param == "38" and index + 1 < len(params):
+                # Extended foreground colour: 38;5;n or 38;2;r;g;b
+                index += 3 if params[index + 1] == "5" else 5
+                continue
+            if param in BLANK_VISIBLE_PARAMS:
+                return True
+            index += 1
+    return False
+
+
+@dataclass
+class FrameDiffStats:
+    """Output counters for differential rendering"""
+    frames: int = 0
+    full_repaints: int = 0
+    bytes_written: int = 0
+    last_frame_bytes: int = 0
+
+    @property
+    def bytes_per_frame(self) -> float:
+        if self.frames == 0:
+            return 0.0
+        return self.bytes_written / self.frames
+
+
+class DiffFrameRenderer:
+    """
+    Redraw animation frames by rewriting only the cells that changed.
+
+    The previous frame is kept as a grid of (character, style) cells.
+    Each new frame is compared row by row; runs of changed cells are
+    written with absolute cursor addressing, and the whole frame goes
+    out in a single write. The first frame after ``reset()``, any frame
+    after a terminal resize and any frame taller than the screen is a
+    full repaint, which starts with ``clear_sequence`` (the probed one
+    from ``probe_terminal`` in the renderer).
+    """
+
+    # Unchanged cells shorter than this are rewritten rather than skipped,
+    # since a cursor move costs about as many bytes
+    MIN_GAP = 8
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 size: Callable[[], Tuple[int, int]] = shutil.get_terminal_size,
+                 clear_sequence: str = CLEAR_SCREEN):
+        self.stream = stream
+        self.size = size
+        self.clear_sequence = clear_sequence
+        self.previous: Optional[List[Line]] = None
+        self.previous_size = None
+        self.stats = FrameDiffStats()
+
+    def reset(self):
+        """Forget the previous frame so the next draw repaints fully"""
+        self.previous = None
+
+    # ------------------------------------------------------------------
+    # Frame conversion
+    # ------------------------------------------------------------------
+    @staticmethod
+    def to_lines(rendered: str) -> List[Line]:
+        """Convert rendered ANSI text into rows of styled cells"""
+        lines: List[Line] = [[]]
+        active = ""
+        position = 0
+        for match in list(ANSI_ESCAPE.finditer(rendered)) + [None]:
+            end = match.start() if match else len(rendered)
+            for char in rendered[position:end]:
+                if char == "\n":
+                    lines.append([])
+                elif char == " " and active and not visible_on_blank(active):
+                    lines[-1].append((char, ""))
+                else:
+                    lines[-1].append((char, active))
+            if match is None:
+                break
+            code = match.group(0)
+            # Rich resets after every styled segment, so a reset clears state
+            active = "" if code == RESET else active + code
+            position = match.end()
+        if not lines[-1]:
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def render_cells(cells: Line) -> str:
+        """Render a run of cells back to ANSI"""
+        parts = []
+        current = ""
+        for char, style in cells:
+            if char == " " and not style and not visible_on_blank(current):
+                # An unstyled space looks the same in any foreground style
+                parts.append(char)
+                continue
+            if style != current:
+                if current:
+                    parts.append(RESET)
+                parts.append(style)
+                current = style
+            parts.append(char)
+        if current:
+            parts.append(RESET)
+        return "".join(parts)
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def _full_repaint(self, lines: List[Line]) -> str:
+        self.stats.full_repaints += 1
+        body = "\n".join(self.render_cells(line) for line in lines)
+        return self.clear_sequence + body + "\n"
+
+    def _diff_line(self, row: int, old: Line, new: Line) -> str:
+        if old == new:
+            return ""
+        rewrite = move_to(row, 0) + self.render_cells(new) + ERASE_TO_EOL
+        if any(cell_len(char) != 1 for char, _ in new) or any(cell_len(char) != 1 for char, _ in old):
+            # Wide or zero-width glyphs break column math: rewrite the row
+            return rewrite
+
+        runs: List[List[int]] = []
+        for column, cell in enumerate(new):
+            previous = old[column] if column < len(old) else None
+            if cell == previous:
+                continue
+            if runs and column - runs[-1][1] <= self.MIN_GAP:
+                runs[-1][1] = column + 1
+            else:
+                runs.append([column, column + 1])
+
+        parts = [move_to(row, start) + self.render_cells(new[start:end]) for start, end in runs]
+        if len(old) > len(new):
+            if runs and runs[-1][1] == len(new):
+                parts.append(ERASE_TO_EOL)
+            else:
+                parts.append(move_to(row, len(new)) + ERASE_TO_EOL)
+        patch = "".join(parts)
+        return patch if len(patch) < len(rewrite) else rewrite
+
+    def draw_rendered(self, rendered: str):
+        """Draw a frame that has already been rendered to ANSI/plain text"""
+        lines = self.to_lines(rendered)
+        current_size = tuple(self.size())
+
+        # Frames taller than the screen scroll, which invalidates row addressing
+        overflow = len(lines) >= current_size[1]
+        if self.previous is None or current_size != self.previous_size or overflow:
+            output = self._full_repaint(lines)
+        else:
+            parts = []
+            for row, line in enumerate(lines):
+                old = self.previous[row] if row < len(self.previous) else []
+                parts.append(self._diff_line(row, old, line))
+            for row in range(len(lines), len(self.previous)):
+                if self.previous[row]:
+                    parts.append(move_to(row, 0) + ERASE_TO_EOL)
+            # Park the cursor below the frame, where a full repaint leaves it
+            parts.append(move_to(len(lines), 0))
+            output = "".join(parts)
+            # Heavily changed frames: repainting from home is cheaper
+            repaint = [CURSOR_HOME]
+            for row, line in enumerate(lines):
+                repaint.append(self.render_cells(line))
+                if row < len(self.previous) and len(self.previous[row]) > len(line):
+                    repaint.append(ERASE_TO_EOL)
+                repaint.append("\n")
+            if len(self.previous) > len(lines):
+                repaint.append(ERASE_BELOW)
+            repaint = "".join(repaint)
+            if len(repaint) < len(output):
+                output = repaint
+
+        self.previous = lines
+        self.previous_size = current_size
+        self.stats.frames += 1
+        self.stats.last_frame_bytes = len(output.encode("utf-8"))
+        self.stats.bytes_written += self.stats.last_frame_bytes
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+
+    def draw(self, frame, style: Optional[str] = None, console=None):
+        """Render a str or Rich Text frame and draw it"""
+        if console is None:
+            rendered = str(frame)
+        else:
+            from rich.text import Text
+            renderable = frame
+            if not isinstance(frame, Text):
+                renderable = Text(str(frame), style=style or "")
+            with console.capture() as capture:
+                console.print(renderable)
+            rendered = capture.get()
+        if not rendered.endswith("\n"):
+            rendered += "\n"
+        self.draw_rendered(rendered)
@@ -3,30 +3,52 @@
 import time
 from typing import Dict, Any
 from .story import Story, Scene
+from .animation import FrameScheduler
+from .clock import Clock, get_clock
+from .input_dispatcher import SkipListener
 from .renderer import TerminalRenderer
 from .colors import ColorPalette
-from .save_manager import SaveManager
+from .save_store import SaveStore, open_save_store
+from .autosave import AutosaveWorker
+from .rewind import RewindBuffer
 
 
 class Game:
     """Main game controller"""
     
-    def __init__(self, story: Story, settings=None):
+    def __init__(self, story: Story, settings=None, save_manager: SaveStore = None,
+                 renderer=None, clock: Clock = None):
         self.story = story
         self.settings = settings
+        self.clock = clock or get_clock()  # Paces scene pauses and animations
         use_colors = True
         if settings is not None:
             use_colors = getattr(settings, "color_enabled", True)
-        self.renderer = TerminalRenderer(use_colors=use_colors, settings=settings)
+        self.renderer = renderer or TerminalRenderer(use_colors=use_colors, settings=settings,
+                                                     clock=self.clock)
         self.running = False
-        self.save_manager = SaveManager()
+        self.save_manager = save_manager or open_save_store(
+            getattr(settings, "save_backend", "files"),
+            profile=getattr(settings, "save_profile", None))
+        # Choices kept in memory before older ones spill to disk (None for all)
+        self.history_window = getattr(settings, "history_window", None)
+        if self.history_window:
+            self.story.state.limit_history(self.history_window)
+        if self.save_manager.journal:
+            self.story.state.start_journal()
+        self.autosaver = AutosaveWorker(self.save_manager)
         self.autosave_interval = 1  # Autosave at each checkpoint
         self.scenes_since_autosave = 0
+        self.rewind = RewindBuffer()  # Scene entries the player can step back to
+        # Any key while a scene plays out finishes its text and skips its pauses
+        self.skip_listener = SkipListener(getattr(self.renderer, "skip", None),
+                                          enabled=getattr(settings, "skip_enabled", True))
     
     def start(self, loaded_state: dict = None):
         """Start the game"""
         self.running = True
         self.scenes_since_autosave = 0
+        self.rewind.clear()
         
         self.renderer.clear()
         self.renderer.display_title(self.story.title)
@@ -41,12 +63,22 @@ class Game:
             adjusted_delay = 0.02
             if self.settings is not None:
                 adjusted_delay = self.settings.adjust_delay(adjusted_delay)
-            self.renderer.display_text(self.story.description, delay=adjusted_delay, clear_first=False)
+            with self.skip_listener:
+                self.renderer.display_text(self.story.description, delay=adjusted_delay,
+                                           clear_first=False)
             self.renderer.pause()
             current_scene_id = self.story.starting_scene
             # Start tracking playtime
             self.story.state.start_time = time.time()
         
+        try:
+            self._run_scenes(current_scene_id)
+        finally:
+            # Don't lose the latest autosave on exit or Ctrl+C
+            self.autosaver.close()
+    
+    def _run_scenes(self, current_scene_id: str):
+        """Play scenes until an ending or the player quits"""
         while self.running and current_scene_id:
             scene = self.story.get_scene(current_scene_id)
             
@@ -55,6 +87,7 @@ class Game:
                 break
             
             self.story.state.visit_scene(current_scene_id)
+            self.rewind.push(self.story.state)
             
             current_scene_id = self.play_scene(scene)
             
@@ -78,29 +111,8 @@ class Game:
         if scene.on_enter:
             scene.on_enter(self.story.state)
         
-        if scene.animation:
-            scene.animation.play(self.renderer)
-            time.sleep(0.5)
-        
-        if scene.ascii_art:
-            # Handle both Animation objects and plain strings/Text
-            if hasattr(scene.ascii_art, 'frames'):
-                # It's an Animation object - display all frames
-                for frame in scene.ascii_art.frames:
-                    self.renderer.display_ascii_art(frame)
-            else:
-                # It's a plain string or Text object
-                self.renderer.display_ascii_art(scene.ascii_art)
-            time.sleep(1)
-        
-        if scene.description:
-            self.renderer.display_text(scene.description, delay=0.02, clear_first=False)
-            time.sleep(0.5)
-        
-        if scene.dialogue:
-            for speaker, text in scene.dialogue:
-                self.renderer.display_dialogue(speaker, text, delay=0.03)
-                time.sleep(0.3)
+        with self.skip_listener:
+            self._present_scene(scene)
         
         if scene.is_ending:
             self.renderer.display_ending(scene.id)
@@ -114,6 +126,9 @@ class Game:
             return None
         
         selected_index = self._prompt_choice(scene, available_choices)
+        if selected_index is None:
+            # Rewound: replay the scene the state was restored to
+            return self.story.state.current_scene
         
         # Record the choice
         selected_choice = available_choices[selected_index]
@@ -121,17 +136,78 @@ class Game:
         
         return selected_choice.next_scene
     
+    def _present_scene(self, scene: Scene):
+        """Show a scene's animation, art, description and dialogue"""
+        if scene.animation:
+            self._play_animation(scene.animation)
+            self._pause(0.5)
+        
+        if scene.ascii_art:
+            # Handle both Animation objects and plain strings/Text
+            if hasattr(scene.ascii_art, 'frames'):
+                # It's an Animation object - display all frames
+                for frame in scene.ascii_art.frames:
+                    self.renderer.display_ascii_art(frame)
+            else:
+                # It's a plain string or Text object
+                self.renderer.display_ascii_art(scene.ascii_art)
+            self._pause(1)
+        
+        if scene.description:
+            self.renderer.display_text(scene.description, delay=0.02, clear_first=False)
+            self._pause(0.5)
+        
+        if scene.dialogue:
+            for speaker, text in scene.dialogue:
+                self.renderer.display_dialogue(speaker, text, delay=0.03)
+                self._pause(0.3)
+    
+    def _pause(self, seconds: float):
+        """Dramatic pause between the parts of a scene; a skip cuts it short"""
+        self.clock.wait(self.skip_listener.pressed, seconds)
+    
+    def _play_animation(self, animation):
+        skip = self.skip_listener.pressed
+        scheduler = FrameScheduler(animation.frame_delay, clock=self.clock.now,
+                                   sleep=lambda seconds: self.clock.wait(skip, seconds))
+        animation.play(self.renderer, scheduler=scheduler)
+    
     def _prompt_choice(self, scene: Scene, choices):
-        """Prompt the player for a choice, allowing saves mid-scene"""
+        """
+        Prompt the player for a choice, allowing saves mid-scene; None if
+        the player rewound to an earlier scene instead
+        """
         while True:
             choice_texts = [choice.text for choice in choices]
             choice_texts.append("[Save Game]")
+            can_rewind = len(self.rewind) > 1
+            if can_rewind:
+                choice_texts.append("[Rewind]")
             selected_index = self.renderer.display_choices(choice_texts)
             if selected_index == len(choices):
                 self.handle_save_menu()
                 continue
+            if can_rewind and selected_index == len(choices) + 1:
+                if self.handle_rewind_menu():
+                    return None
+                continue
             return selected_index
     
+    def handle_rewind_menu(self) -> bool:
+        """Let the player step back to a recent scene; True if they did"""
+        # Newest first, without the scene being played
+        scenes = self.rewind.scenes()[-2::-1]
+        options = [f"Back {steps} - {scene_id.replace('_', ' ').title()}"
+                   for steps, scene_id in enumerate(scenes, 1)]
+        options.append("[Cancel]")
+        try:
+            selected_index = self.renderer.display_choices(options)
+        except KeyboardInterrupt:
+            return False
+        if selected_index == len(scenes):
+            return False
+        return self.rewind.rewind(self.story.state, selected_index + 1) is not None
+    
     def handle_save_menu(self):
         """Handle the save game menu"""
         self.renderer.clear()
@@ -143,6 +219,9 @@ class Game:
         
         # Show available slots
         saves = self.save_manager.list_saves()
+        new_slot = self.save_manager.next_free_slot()
+        if new_slot < self.save_manager.MAX_SAVE_SLOTS:
+            new_slot = None  # Already listed as an empty slot
         
         if self.renderer.use_colors and self.renderer.color_renderer:
             for i in range(1, min(10, self.save_manager.MAX_SAVE_SLOTS)):
@@ -161,6 +240,11 @@ class Game:
                         f"{i}. [Empty Slot]",
                         style=ColorPalette.NEUTRAL_GRAY
                     )
+            if new_slot is not None:
+                self.renderer.color_renderer.console.print(
+                    f"{new_slot}. [New Slot]",
+                    style=ColorPalette.NEUTRAL_GRAY
+                )
             
             self.renderer.color_renderer.console.print("\n0. Cancel", 
                                                        style=ColorPalette.ALERT_ORANGE)
@@ -175,6 +259,8 @@ class Game:
                     print(f"   {metadata.timestamp[:19]} | Playtime: {self._format_playtime(metadata.playtime)}")
                 else:
                     print(f"{i}. [Empty Slot]")
+            if new_slot is not None:
+                print(f"{new_slot}. [New Slot]")
             
             print("\n0. Cancel")
             print("\nSelect save slot: ", end="")
@@ -183,7 +269,7 @@ class Game:
             slot = int(input().strip())
             if slot == 0:
                 return
-            if 1 <= slot < self.save_manager.MAX_SAVE_SLOTS:
+            if slot >= 1:  # Any slot number; only the first few are listed
                 # Get save name
                 if self.renderer.use_colors and self.renderer.color_renderer:
                     self.renderer.color_renderer.console.print(
@@ -240,24 +326,26 @@ class Game:
             pass
     
     def autosave(self):
-        """Perform an autosave"""
-        game_state = self.get_save_state()
-        if self.save_manager.save_game(self.save_manager.AUTOSAVE_SLOT, game_state, "Autosave"):
-            if self.renderer.use_colors and self.renderer.color_renderer:
-                self.renderer.color_renderer.console.print(
-                    "\n[Autosaved]",
-                    style=ColorPalette.NEUTRAL_GRAY
-                )
-            else:
-                print("\n[Autosaved]")
+        """Queue an autosave; the snapshot is serialized and written in the background"""
+        snapshot = self.story.state.snapshot()
+        deltas = self.story.state.drain_journal()
+        # Writes finish later, so report how the previous autosave went
+        previous_failed = self.autosaver.last_write_failed
+        self.autosaver.submit(lambda: self.get_save_state(snapshot), deltas)
+        message, style = "\n[Autosaved]", ColorPalette.NEUTRAL_GRAY
+        if previous_failed:
+            message, style = "\n[Autosave failed - retrying]", ColorPalette.ALERT_ORANGE
+        self.renderer.display_status(message, style)
     
-    def get_save_state(self) -> dict:
-        """Get current game state for saving"""
-        state_dict = self.story.state.to_dict()
+    def get_save_state(self, snapshot=None) -> dict:
+        """Get current (or snapshotted) game state for saving"""
+        if snapshot is None:
+            snapshot = self.story.state.snapshot()
+        state_dict = snapshot.to_dict()
         
         # Add story information
         state_dict['story_title'] = self.story.title
-        state_dict['story_class'] = self.story.__class__.__name__
+        state_dict['story_class'] = getattr(self.story, 'source_class', self.story.__class__.__name__)
         state_dict['total_scenes'] = len(self.story.scenes)
         
         return state_dict
@@ -0,0 +1,321 @@
+"""Headless game driver: the real engine loop at machine speed
+
+``HeadlessGame`` runs ``Game.start`` unchanged -- scene entry, ``on_enter``
+effects, choice conditions, autosaves and endings -- with a renderer
+that draws nothing, pauses on a virtual clock, and a choice policy
+instead of the player. It is what the soak tests drive::
+
+    python -m engine.headless stories.noir_detective:NoirDetectiveStory --runs 1000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Union
+
+from .clock import Clock, VirtualClock
+from .game import Game
+from .save_manager import SaveManager
+from .save_store import SaveStore
+from .story import Choice, GameState, Scene, Story
+
+
+class HeadlessError(RuntimeError):
+    """Raised when a policy cannot pick a choice"""
+
+
+class NullRenderer:
+    """Renderer with the TerminalRenderer interface that draws nothing"""
+
+    use_colors = False
+    color_renderer = None
+
+    def __init__(self):
+        self.current_mood = {}
+
+    def set_mood(self, mood_colors: dict):
+        self.current_mood = mood_colors
+
+    def clear(self):
+        pass
+
+    def display_frame(self, frame, delay: float = 0.05, color: str = None):
+        pass
+
+    def render_frame(self, frame, color: str = None):
+        pass
+
+    def reset_frames(self):
+        pass
+
+    def display_text(self, text: str, delay: float = 0.03, clear_first: bool = True,
+                     color: str = None):
+        pass
+
+    def display_dialogue(self, speaker: str, text: str, delay: float = 0.03, **kwargs):
+        pass
+
+    def display_choices(self, choices: List[str]) -> int:
+        raise HeadlessError("a headless game has no player to prompt")
+
+    def display_ascii_art(self, art, color: str = None, style: str = None):
+        pass
+
+    def pause(self, message: str = "", color: str = None):
+        pass
+
+    def display_status(self, message: str, style: str = None):
+        pass
+
+    def display_title(self, title: str, subtitle: str = None, color: str = None):
+        pass
+
+    def display_ending(self, scene_id: str):
+        pass
+
+
+# ----------------------------------------------------------------------
+# Choice policies
+# ----------------------------------------------------------------------
+class ChoicePolicy:
+    """Picks a choice for the player"""
+
+    def reset(self):
+        """Called before each playthrough"""
+
+    def choose(self, scene: Scene, choices: List[Choice], state: GameState) -> int:
+        """Index into ``choices`` (never empty)"""
+        raise NotImplementedError
+
+
+class FirstAvailablePolicy(ChoicePolicy):
+    """Always the first available choice"""
+
+    def choose(self, scene: Scene, choices: List[Choice], state: GameState) -> int:
+        return 0
+
+
+class RandomPolicy(ChoicePolicy):
+    """A uniformly random choice, reproducible from the seed"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.random = random.Random(seed)
+
+    def choose(self, scene: Scene, choices: List[Choice], state: GameState) -> int:
+        return self.random.randrange(len(choices))
+
+
+class ScriptedPolicy(ChoicePolicy):
+    """
+    Choices from a script of indexes or choice texts, replayed from the
+    start of each playthrough; ``then`` takes over when the script runs
+    out (otherwise that is an error)
+    """
+
+    def __init__(self, script: Sequence[Union[int, str]], then: Optional[ChoicePolicy] = None):
+        self.script = list(script)
+        self.then = then
+        self.position = 0
+
+    def reset(self):
+        self.position = 0
+        if self.then is not None:
+            self.then.reset()
+
+    def choose(self, scene: Scene, choices: List[Choice], state: GameState) -> int:
+        if self.position >= len(self.script):
+            if self.then is None:
+                raise HeadlessError(f"script ran out in scene {scene.id!r}")
+            return self.then.choose(scene, choices, state)
+        step = self.script[self.position]
+        self.position += 1
+        if isinstance(step, str):
+            for index, choice in enumerate(choices):
+                if choice.text == step:
+                    return index
+            raise HeadlessError(f"no choice {step!r} in scene {scene.id!r}")
+        if not 0 <= step < len(choices):
+            raise HeadlessError(f"choice {step} out of range in scene {scene.id!r}")
+        return step
+
+
+class CoveragePolicy(ChoicePolicy):
+    """
+    Head for the least-visited scene; over many playthroughs this walks
+    every branch instead of the same popular ones (ties are random)
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.random = random.Random(seed)
+        self.visits: Counter = Counter()  # Scene -> times chosen as a destination
+
+    def choose(self, scene: Scene, choices: List[Choice], state: GameState) -> int:
+        visits = self.visits
+        fewest = min(visits[choice.next_scene] for choice in choices)
+        candidates = [index for index, choice in enumerate(choices)
+                      if visits[choice.next_scene] == fewest]
+        index = self.random.choice(candidates)
+        visits[choices[index].next_scene] += 1
+        return index
+
+
+POLICIES = {
+    "first": FirstAvailablePolicy,
+    "random": RandomPolicy,
+    "coverage": CoveragePolicy,
+}
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+@dataclass
+class HeadlessReport:
+    """Totals over headless playthroughs"""
+    runs: int = 0
+    scenes: int = 0
+    endings: Counter = field(default_factory=Counter)
+    unfinished: int = 0      # Runs stopped at max_scenes or without an ending
+    autosaves: int = 0       # Autosaves written
+    autosaves_failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def scenes_per_second(self) -> float:
+        return self.scenes / self.elapsed if self.elapsed else 0.0
+
+
+class HeadlessGame(Game):
+    """
+    A Game that plays itself
+
+    Pauses pass on a ``VirtualClock`` unless another clock is given, so
+    ``clock.slept`` is the pause time an interactive game would have
+    spent. Without a save store it autosaves to a private temporary
+    directory (removed by ``close``), so soak tests never touch the
+    player's saves. ``history_window`` bounds the choice history kept
+    in memory over long runs (overriding the settings).
+    """
+
+    def __init__(self, story: Story, policy: Optional[ChoicePolicy] = None,
+                 save_manager: Optional[SaveStore] = None, settings=None,
+                 max_scenes: int = 10_000, clock: Optional[Clock] = None,
+                 history_window: Optional[int] = None):
+        self._save_dir = None
+        if save_manager is None:
+            self._save_dir = tempfile.TemporaryDirectory(prefix="headless-")
+            save_manager = SaveManager(save_dir=self._save_dir.name, journal=True,
+                                       durability=SaveManager.DURABILITY_NONE,
+                                       autosave_durability=SaveManager.DURABILITY_NONE)
+        super().__init__(story, settings=settings, save_manager=save_manager,
+                         renderer=NullRenderer(), clock=clock or VirtualClock())
+        self.skip_listener.enabled = False  # Nothing to skip, and no keyboard to own
+        if history_window is not None:
+            self.history_window = history_window
+        self.policy = policy or FirstAvailablePolicy()
+        self.max_scenes = max_scenes
+        self.scenes_played = 0
+        self.ending: Optional[str] = None
+
+    def _play_animation(self, animation):
+        pass
+
+    def _prompt_choice(self, scene: Scene, choices):
+        return self.policy.choose(scene, choices, self.story.state)
+
+    def play_scene(self, scene: Scene) -> str:
+        self.scenes_played += 1
+        if scene.is_ending:
+            self.ending = scene.id
+        next_scene = super().play_scene(scene)
+        if self.scenes_played >= self.max_scenes:
+            self.running = False
+        return next_scene
+
+    def play(self) -> Optional[str]:
+        """One playthrough from a fresh state; the ending reached, or None"""
+        self.story.state = GameState()
+        if self.history_window:
+            self.story.state.limit_history(self.history_window)
+        if self.save_manager.journal:
+            self.story.state.start_journal()
+        self.policy.reset()
+        self.scenes_played = 0
+        self.ending = None
+        self.start()
+        return self.ending
+
+    def run(self, runs: int = 1) -> HeadlessReport:
+        """Several playthroughs, with totals and throughput"""
+        report = HeadlessReport()
+        written, failed = self.autosaver.stats.written, self.autosaver.stats.failed
+        started = time.perf_counter()
+        for _ in range(runs):
+            ending = self.play()
+            report.runs += 1
+            report.scenes += self.scenes_played
+            if ending is None:
+                report.unfinished += 1
+            else:
+                report.endings[ending] += 1
+        report.elapsed = time.perf_counter() - started
+        report.autosaves = self.autosaver.stats.written - written
+        report.autosaves_failed = self.autosaver.stats.failed - failed
+        return report
+
+    def close(self):
+        """Finish autosaving and remove the private save directory"""
+        self.autosaver.close()
+        if self._save_dir is not None:
+            self._save_dir.cleanup()
+            self._save_dir = None
+
+    def __enter__(self) -> "HeadlessGame":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def print_report(report: HeadlessReport):
+    print(f"Playthroughs: {report.runs:,} ({report.unfinished:,} unfinished)")
+    print(f"Scenes played: {report.scenes:,} in {report.elapsed:.2f}s "
+          f"({report.scenes_per_second:,.0f} scenes/s)")
+    print(f"Autosaves: {report.autosaves:,} written, {report.autosaves_failed:,} failed")
+    print(f"\nEndings ({len(report.endings)}):")
+    for ending, count in report.endings.most_common():
+        print(f"  {ending:40} {count:>8,}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .bundle import BundleError, load_story_class
+
+    parser = argparse.ArgumentParser(description="Play a story headless at machine speed")
+    parser.add_argument("story", help="Story class, e.g. stories.noir_detective:NoirDetectiveStory")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random",
+                        help="How choices are made")
+    parser.add_argument("--runs", type=int, default=100, help="Playthroughs")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for random policies")
+    parser.add_argument("--history-window", type=int, default=None,
+                        help="Choices kept in memory per run (older ones spill to disk)")
+    args = parser.parse_args(argv)
+
+    try:
+        story = load_story_class(args.story)()
+    except BundleError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    policy_class = POLICIES[args.policy]
+    policy = policy_class() if policy_class is FirstAvailablePolicy else policy_class(args.seed)
+    with HeadlessGame(story, policy, history_window=args.history_window) as game:
+        report = game.run(args.runs)
+    print_report(report)
+    return 1 if report.unfinished or report.autosaves_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Event-driven keyboard input shared by menus, cinematics and scenes
+
+One long-lived ``InputDispatcher`` thread waits on stdin and a wake pipe
+with a selector and hands each key to the newest subscriber, so screens
+block on a queue or an Event instead of starting their own reader
+threads and polling for them. The terminal is in cbreak mode only while
+someone is subscribed; between subscriptions stdin is left alone for
+``input()`` prompts::
+
+    with get_dispatcher().subscribe() as keys:
+        key = keys.get()                 # Block for the next key
+        skipped = keys.pressed.wait(2.0)  # Or wake on any key
+
+Without a terminal every subscription sees ENTER at once, as
+``InputHandler.read_key`` does.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import queue
+import selectors
+import sys
+import time
+from threading import Event, Lock, Thread
+from typing import List, Optional
+
+from .input_handler import InputHandler
+
+if os.name == "nt":  # pragma: no cover - platform specific
+    import msvcrt  # type: ignore
+
+
+class KeySubscription:
+    """Keys delivered to one screen while it is subscribed"""
+
+    def __init__(self, dispatcher: "InputDispatcher", pressed: Optional[Event] = None):
+        self.dispatcher = dispatcher
+        self.keys: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self.pressed = pressed if pressed is not None else Event()  # Set on the first key
+
+    def deliver(self, key: str) -> None:
+        self.keys.put(key)
+        self.pressed.set()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """The next key, or None if ``timeout`` passes first"""
+        try:
+            return self.keys.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __enter__(self) -> "KeySubscription":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.dispatcher.unsubscribe(self)
+
+
+class InputDispatcher:
+    """A single background reader for the keyboard"""
+
+    def __init__(self):
+        self.enabled = not InputHandler().disabled
+        self._subscribers: List[KeySubscription] = []
+        self._lock = Lock()  # Guards _subscribers, _handler and reads from stdin
+        self._handler: Optional[InputHandler] = None  # Terminal mode while subscribed
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._thread: Optional[Thread] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_read = self._wake_write = None
+        self._closing = False
+        self._at_eof = False  # stdin closed: every key read is ENTER from now on
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def subscribe(self, pressed: Optional[Event] = None) -> KeySubscription:
+        """
+        Start receiving keys (in preference to earlier subscribers)
+
+        Args:
+            pressed: Event to set on the first key (a new one by default)
+        """
+        subscription = KeySubscription(self, pressed)
+        if not self.enabled or self._at_eof:
+            subscription.deliver("ENTER")
+            return subscription
+        with self._lock:
+            if not self._subscribers:
+                self._handler = InputHandler(cbreak=True).__enter__()
+            self._subscribers.append(subscription)
+        self._ensure_thread()
+        self._wake()
+        return subscription
+
+    def unsubscribe(self, subscription: KeySubscription) -> None:
+        with self._lock:
+            if subscription not in self._subscribers:
+                return
+            self._subscribers.remove(subscription)
+            if not self._subscribers and self._handler is not None:
+                self._handler.__exit__(None, None, None)
+                self._handler = None
+        self._wake()
+
+    def close(self) -> None:
+        """Stop the reader thread (subscriptions get no more keys)"""
+        with self._lock:
+            self._closing = True
+            self._subscribers = []
+            if self._handler is not None:
+                self._handler.__exit__(None, None, None)
+                self._handler = None
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._wake_read, self._wake_write):
+            if fd is not None:
+                os.close(fd)
+        self._wake_read = self._wake_write = None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    # ------------------------------------------------------------------
+    # Reader thread
+    # ------------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        self._closing = False
+        if os.name == "nt":  # pragma: no cover - platform specific
+            target = self._run_windows
+        else:
+            self._wake_read, self._wake_write = os.pipe()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._wake_read, selectors.EVENT_READ)
+            target = self._run_posix
+        self._thread = Thread(target=target, name="input-dispatcher", daemon=True)
+        self._thread.start()
+
+    def _wake(self) -> None:
+        if self._wake_write is not None:
+            os.write(self._wake_write, b"x")
+
+    def _dispatch(self, keys: List[str]) -> None:
+        """Hand keys to the newest subscriber (lock held)"""
+        target = self._subscribers[-1]
+        for key in keys:
+            target.deliver(key)
+
+    def _run_posix(self) -> None:
+        stdin = sys.stdin.fileno()
+        watching = False
+        while True:
+            with self._lock:
+                if self._closing:
+                    return
+                want = bool(self._subscribers) and not self._at_eof
+            if want != watching:
+                if want:
+                    self._selector.register(stdin, selectors.EVENT_READ)
+                else:
+                    self._selector.unregister(stdin)
+                watching = want
+            for key, _ in self._selector.select():
+                if key.fd == self._wake_read:
+                    os.read(self._wake_read, 512)
+                    continue
+                with self._lock:
+                    # Unsubscribed since the select: leave the input to input()
+                    if not self._subscribers:
+                        continue
+                    try:
+                        data = os.read(stdin, 1024)
+                    except OSError:
+                        data = b""
+                    if not data:
+                        self._at_eof = True
+                        self._dispatch(["ENTER"])  # End of input, as read_key
+                        continue
+                    self._dispatch(InputHandler.parse_keys(self._decoder.decode(data)))
+
+    def _run_windows(self) -> None:  # pragma: no cover - platform specific
+        # The console cannot be waited on with select; check it every 10 ms
+        handler = InputHandler()
+        while True:
+            with self._lock:
+                if self._closing:
+                    return
+                if self._subscribers and msvcrt.kbhit():
+                    self._dispatch([handler.read_key()])
+                    continue
+            time.sleep(0.01)
+
+
+_dispatcher: Optional[InputDispatcher] = None
+
+
+def get_dispatcher() -> InputDispatcher:
+    """The process-wide dispatcher, created on first use"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = InputDispatcher()
+    return _dispatcher
+
+
+class SkipListener:
+    """
+    Watch for any key press while output is playing.
+
+    Inside ``with listener:`` the block is subscribed to the dispatcher
+    and ``pressed`` is set on the first key; the keys are consumed, so
+    they never reach the next prompt. Typewriters and pauses given the
+    same event finish at once when it is set. Outside a terminal (or
+    when disabled) the block runs without listening.
+    """
+
+    def __init__(self, pressed: Optional[Event] = None, enabled: bool = True,
+                 dispatcher: Optional[InputDispatcher] = None):
+        self.pressed = pressed if pressed is not None else Event()
+        self.enabled = enabled
+        self.dispatcher = dispatcher
+        self._subscription: Optional[KeySubscription] = None
+
+    def __enter__(self) -> "SkipListener":
+        self.pressed.clear()
+        if not self.enabled:
+            return self
+        dispatcher = self.dispatcher or get_dispatcher()
+        if not dispatcher.enabled:
+            return self
+        self._subscription = dispatcher.subscribe(self.pressed)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._subscription is not None:
+            self._subscription.dispatcher.unsubscribe(self._subscription)
+            self._subscription = None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sys
 import select
+from typing import List
 
 if os.name == "nt":  # pragma: no cover - platform specific
     import msvcrt  # type: ignore
@@ -34,8 +35,15 @@ class InputHandler:
         b"O": "END",
     }
 
-    def __init__(self):
+    def __init__(self, cbreak: bool = False):
+        """
+        Args:
+            cbreak: Use cbreak instead of raw mode: keys still arrive one at
+                a time, but output newlines and Ctrl+C keep working, so the
+                handler can stay active while text is being printed
+        """
         self.is_windows = os.name == "nt"
+        self.cbreak = cbreak
         self.is_tty = sys.stdin.isatty()
         self.disabled = False
 
@@ -57,7 +65,10 @@ class InputHandler:
 
     def __enter__(self) -> "InputHandler":
         if not self.is_windows and not self.disabled and self.fd is not None:
-            tty.setraw(self.fd)
+            if self.cbreak:
+                tty.setcbreak(self.fd)
+            else:
+                tty.setraw(self.fd)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -143,7 +154,31 @@ class InputHandler:
         except (EOFError, OSError):
             return "ENTER"
 
+    @classmethod
+    def parse_keys(cls, text: str) -> List[str]:
+        """Split raw POSIX terminal input into normalized keys."""
+        keys: List[str] = []
+        index = 0
+        while index < len(text):
+            ch = text[index]
+            index += 1
+            if ch in ("\r", "\n"):
+                keys.append("ENTER")
+            elif ch == "\x7f":
+                keys.append("BACKSPACE")
+            elif ch == "\x1b":
+                # CSI ("\x1b[A") and application mode ("\x1bOA") arrows
+                if text[index:index + 1] in ("[", "O") and index + 1 < len(text):
+                    keys.append(cls.SPECIAL_KEYS_POSIX.get(text[index + 1], "ESC"))
+                    index += 2
+                else:
+                    keys.append("ESC")
+            else:
+                keys.append(ch)
+        return keys
+
     def _input_available(self, timeout: float = 0.0001) -> bool:
         """Check if more characters are waiting in the input buffer."""
         readable, _, _ = select.select([sys.stdin], [], [], timeout)
         return bool(readable)
+
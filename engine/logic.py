@@ -0,0 +1,632 @@
+"""Declarative conditions and effects for scenes and choices
+
+Conditions are small predicate trees (flag, item and variable tests
+combined with and/or/not) and effects are lists of state changes. Both
+are plain data: they serialize to nested lists, can be parsed from a
+short text form, report which state keys they read or write, and
+compile to a single Python function each. Any Python callable still works
+as a condition or ``on_enter`` callback; wrap it in ``Call`` to combine
+it with predicates.
+
+    condition = HasItem("key") & ~HasFlag("alarm") | (Var("trust") >= 2)
+    condition = parse_condition('has_item(key) and not has_flag(alarm) or trust >= 2')
+    on_enter = parse_effects('set_flag(arrived); increment(trust)')
+"""
+
+import operator
+import re
+from dataclasses import dataclass, astuple
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+
+Key = Tuple[str, str]  # ("flag" | "item" | "var", name)
+
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_MISSING = object()
+
+
+class LogicError(ValueError):
+    """Raised when a condition or effect cannot be represented declaratively"""
+
+
+# ----------------------------------------------------------------------
+# Conditions
+# ----------------------------------------------------------------------
+class Predicate:
+    """A condition on the game state; callable like a ``Choice.condition``"""
+    op = ""
+
+    def __call__(self, state) -> bool:
+        return self.evaluate(state)
+
+    @cached_property
+    def evaluate(self) -> Callable[[Any], bool]:
+        """The predicate compiled to a function (built once)"""
+        return self.compile()
+
+    def compile(self) -> Callable[[Any], bool]:
+        """Generate a single Python function for the whole predicate tree"""
+        namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+
+        def bind(value: Any) -> str:
+            name = f"_c{len(namespace)}"
+            namespace[name] = value
+            return name
+
+        return eval(f"lambda state: {self.expression(bind)}", namespace)
+
+    def expression(self, bind: Callable[[Any], str]) -> str:
+        """Python source for the predicate; ``bind`` names a constant"""
+        raise NotImplementedError
+
+    @cached_property
+    def reads(self) -> Optional[FrozenSet[Key]]:
+        """State keys the predicate depends on (None if unknown)"""
+        raise NotImplementedError
+
+    def to_data(self) -> List[Any]:
+        """Serialize as ``[op, *args]``"""
+        return [self.op, *astuple(self)]
+
+    @classmethod
+    def from_args(cls, args: Sequence[Any]) -> "Predicate":
+        return cls(*args)
+
+    def __and__(self, other) -> "Predicate":
+        return And((self, as_predicate(other)))
+
+    def __rand__(self, other) -> "Predicate":
+        return And((as_predicate(other), self))
+
+    def __or__(self, other) -> "Predicate":
+        return Or((self, as_predicate(other)))
+
+    def __ror__(self, other) -> "Predicate":
+        return Or((as_predicate(other), self))
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+@dataclass(frozen=True)
+class HasFlag(Predicate):
+    """True when a story flag is set"""
+    name: str
+    op = "has_flag"
+
+    def expression(self, bind):
+        return f"bool(state.flags.get({bind(self.name)}, False))"
+
+    @cached_property
+    def reads(self):
+        return frozenset([("flag", self.name)])
+
+
+@dataclass(frozen=True)
+class HasItem(Predicate):
+    """True when the player carries an item"""
+    name: str
+    op = "has_item"
+
+    def expression(self, bind):
+        return f"({bind(self.name)} in state.inventory)"
+
+    @cached_property
+    def reads(self):
+        return frozenset([("item", self.name)])
+
+
+@dataclass(frozen=True)
+class Compare(Predicate):
+    """Compare a story variable with a constant (unset variables only match ``!=``)"""
+    name: str
+    comparison: str
+    value: Any
+    op = "var"
+
+    def __post_init__(self):
+        if self.comparison not in COMPARISONS:
+            raise LogicError(f"Unknown comparison: {self.comparison!r}")
+
+    def expression(self, bind):
+        compare = COMPARISONS[self.comparison]
+        unset = self.comparison == "!="
+
+        def test(current, value=self.value):
+            if current is _MISSING:
+                return unset
+            try:
+                return bool(compare(current, value))
+            except TypeError:
+                return False
+        return f"{bind(test)}(state.variables.get({bind(self.name)}, _MISSING))"
+
+    @cached_property
+    def reads(self):
+        return frozenset([("var", self.name)])
+
+
+@dataclass(frozen=True)
+class And(Predicate):
+    """True when every term is true"""
+    terms: Tuple[Predicate, ...]
+    op = "and"
+
+    def expression(self, bind):
+        return "(" + " and ".join(term.expression(bind) for term in self.terms) + ")"
+
+    @cached_property
+    def reads(self):
+        return _union(term.reads for term in self.terms)
+
+    def to_data(self):
+        return [self.op, *(term.to_data() for term in self.terms)]
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(tuple(condition_from_data(term) for term in args))
+
+    def __and__(self, other):
+        return And(self.terms + (as_predicate(other),))
+
+
+@dataclass(frozen=True)
+class Or(Predicate):
+    """True when any term is true"""
+    terms: Tuple[Predicate, ...]
+    op = "or"
+
+    def expression(self, bind):
+        return "(" + " or ".join(term.expression(bind) for term in self.terms) + ")"
+
+    @cached_property
+    def reads(self):
+        return _union(term.reads for term in self.terms)
+
+    def to_data(self):
+        return [self.op, *(term.to_data() for term in self.terms)]
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(tuple(condition_from_data(term) for term in args))
+
+    def __or__(self, other):
+        return Or(self.terms + (as_predicate(other),))
+
+
+@dataclass(frozen=True)
+class Not(Predicate):
+    """Negation of a term"""
+    term: Predicate
+    op = "not"
+
+    def expression(self, bind):
+        return f"(not {self.term.expression(bind)})"
+
+    @cached_property
+    def reads(self):
+        return self.term.reads
+
+    def to_data(self):
+        return [self.op, self.term.to_data()]
+
+    @classmethod
+    def from_args(cls, args):
+        (term,) = args
+        return cls(condition_from_data(term))
+
+    def __invert__(self):
+        return self.term
+
+
+@dataclass(frozen=True)
+class Call(Predicate):
+    """Escape hatch: an arbitrary Python condition inside a predicate tree"""
+    function: Callable[[Any], bool]
+    op = "call"
+
+    def expression(self, bind):
+        return f"bool({bind(self.function)}(state))"
+
+    @cached_property
+    def reads(self):
+        return None
+
+    def to_data(self):
+        raise LogicError(f"{getattr(self.function, '__name__', self.function)!s} is a Python callable")
+
+
+class Var:
+    """Builder for variable comparisons: ``Var("trust") >= 2``"""
+
+    __hash__ = None
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __eq__(self, value):
+        return Compare(self.name, "==", value)
+
+    def __ne__(self, value):
+        return Compare(self.name, "!=", value)
+
+    def __lt__(self, value):
+        return Compare(self.name, "<", value)
+
+    def __le__(self, value):
+        return Compare(self.name, "<=", value)
+
+    def __gt__(self, value):
+        return Compare(self.name, ">", value)
+
+    def __ge__(self, value):
+        return Compare(self.name, ">=", value)
+
+
+def _union(parts) -> Optional[FrozenSet[Key]]:
+    keys = set()
+    for part in parts:
+        if part is None:
+            return None
+        keys |= part
+    return frozenset(keys)
+
+
+def as_predicate(condition) -> Predicate:
+    """Wrap a plain callable so it can be combined with predicates"""
+    if isinstance(condition, Predicate):
+        return condition
+    if callable(condition):
+        return Call(condition)
+    raise LogicError(f"Not a condition: {condition!r}")
+
+
+def condition_reads(condition) -> Optional[FrozenSet[Key]]:
+    """State keys a choice condition reads: empty for None, None if unknown"""
+    if condition is None:
+        return frozenset()
+    if isinstance(condition, Predicate):
+        return condition.reads
+    return None
+
+
+# ----------------------------------------------------------------------
+# Effects
+# ----------------------------------------------------------------------
+class Effect:
+    """A single state change; callable like an ``on_enter`` callback"""
+    op = ""
+
+    def __call__(self, state):
+        raise NotImplementedError
+
+    @property
+    def writes(self) -> FrozenSet[Key]:
+        raise NotImplementedError
+
+    def to_data(self) -> List[Any]:
+        """Serialize as ``[op, *args]``"""
+        return [self.op, *astuple(self)]
+
+
+@dataclass(frozen=True)
+class SetFlag(Effect):
+    """Set (or clear) a story flag"""
+    name: str
+    value: bool = True
+    op = "set_flag"
+
+    def __call__(self, state):
+        state.set_flag(self.name, self.value)
+
+    @property
+    def writes(self):
+        return frozenset([("flag", self.name)])
+
+
+@dataclass(frozen=True)
+class AddItem(Effect):
+    """Put an item in the inventory"""
+    name: str
+    op = "add_item"
+
+    def __call__(self, state):
+        state.add_item(self.name)
+
+    @property
+    def writes(self):
+        return frozenset([("item", self.name)])
+
+
+@dataclass(frozen=True)
+class SetVar(Effect):
+    """Assign a story variable"""
+    name: str
+    value: Any
+    op = "set_var"
+
+    def __call__(self, state):
+        state.set_variable(self.name, self.value)
+
+    @property
+    def writes(self):
+        return frozenset([("var", self.name)])
+
+
+@dataclass(frozen=True)
+class Increment(Effect):
+    """Add to a numeric story variable (unset counts as 0)"""
+    name: str
+    amount: float = 1
+    op = "increment"
+
+    def __call__(self, state):
+        state.set_variable(self.name, state.get_variable(self.name, 0) + self.amount)
+
+    @property
+    def writes(self):
+        return frozenset([("var", self.name)])
+
+
+class Effects:
+    """An ordered list of effects applied together, usable as ``Scene.on_enter``"""
+
+    def __init__(self, effects: Sequence[Effect]):
+        self.effects: Tuple[Effect, ...] = tuple(effects)
+
+    def __call__(self, state):
+        for effect in self.effects:
+            effect(state)
+
+    def __iter__(self):
+        return iter(self.effects)
+
+    def __len__(self) -> int:
+        return len(self.effects)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Effects) and self.effects == other.effects
+
+    def __repr__(self) -> str:
+        return f"Effects({list(self.effects)!r})"
+
+    @property
+    def writes(self) -> FrozenSet[Key]:
+        return frozenset().union(*(effect.writes for effect in self.effects))
+
+    def to_data(self) -> List[List[Any]]:
+        return [effect.to_data() for effect in self.effects]
+
+
+PREDICATES: Dict[str, type] = {cls.op: cls for cls in (HasFlag, HasItem, Compare, And, Or, Not)}
+EFFECTS: Dict[str, type] = {cls.op: cls for cls in (SetFlag, AddItem, SetVar, Increment)}
+
+
+def condition_from_data(data: Optional[Sequence[Any]]) -> Optional[Predicate]:
+    """Rebuild a condition serialized with ``to_data``"""
+    if data is None:
+        return None
+    op, *args = data
+    try:
+        cls = PREDICATES[op]
+    except KeyError:
+        raise LogicError(f"Unknown condition: {op!r}") from None
+    try:
+        return cls.from_args(args)
+    except (TypeError, ValueError) as error:
+        raise LogicError(f"Bad arguments for {op!r}: {args!r}") from error
+
+
+def effects_from_data(data: Optional[Sequence[Sequence[Any]]]) -> Optional[Effects]:
+    """Rebuild an effect list serialized with ``to_data``"""
+    if data is None:
+        return None
+    effects = []
+    for op, *args in data:
+        try:
+            effects.append(EFFECTS[op](*args))
+        except KeyError:
+            raise LogicError(f"Unknown effect: {op!r}") from None
+        except TypeError as error:
+            raise LogicError(f"Bad arguments for {op!r}: {args!r}") from error
+    return Effects(effects)
+
+
+# ----------------------------------------------------------------------
+# Text form
+# ----------------------------------------------------------------------
+TOKEN = re.compile(r"""\s*(?:
+    (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<string>"[^"]*"|'[^']*')
+  | (?P<symbol>==|!=|<=|>=|<|>|\(|\)|,|;)
+  | (?P<name>[A-Za-z_][\w.]*)
+)""", re.VERBOSE)
+
+CONDITION_CALLS = {"has_flag": HasFlag, "flag": HasFlag, "has_item": HasItem, "item": HasItem}
+LITERALS = {"true": True, "false": False, "none": None}
+
+
+class _Parser:
+    """Recursive-descent parser for the text form of conditions and effects"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[Tuple[str, str, int]] = []
+        position = 0
+        while position < len(text):
+            if text[position:].strip() == "":
+                break
+            match = TOKEN.match(text, position)
+            if not match or match.end() == position:
+                raise LogicError(f"Unexpected character at {position} in {text!r}")
+            kind = match.lastgroup
+            self.tokens.append((kind, match.group(kind), match.start(kind)))
+            position = match.end()
+        self.index = 0
+
+    def peek(self) -> Tuple[str, str, int]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return ("end", "", len(self.text))
+
+    def take(self, value: Optional[str] = None) -> Tuple[str, str, int]:
+        token = self.peek()
+        if token[0] == "end" or (value is not None and token[1] != value):
+            raise LogicError(f"Expected {value or 'more input'} at {token[2]} in {self.text!r}")
+        self.index += 1
+        return token
+
+    def accept(self, value: str) -> bool:
+        if self.peek()[1] == value and self.peek()[0] != "string":
+            self.index += 1
+            return True
+        return False
+
+    def done(self):
+        kind, value, position = self.peek()
+        if kind != "end":
+            raise LogicError(f"Unexpected {value!r} at {position} in {self.text!r}")
+
+    # -- values ---------------------------------------------------------
+    def name(self) -> str:
+        kind, value, position = self.take()
+        if kind == "string":
+            return value[1:-1]
+        if kind != "name":
+            raise LogicError(f"Expected a name at {position} in {self.text!r}")
+        return value
+
+    def literal(self) -> Any:
+        kind, value, position = self.take()
+        if kind == "number":
+            return float(value) if "." in value else int(value)
+        if kind == "string":
+            return value[1:-1]
+        if kind == "name" and value.lower() in LITERALS:
+            return LITERALS[value.lower()]
+        raise LogicError(f"Expected a value at {position} in {self.text!r}")
+
+    # -- conditions -----------------------------------------------------
+    def condition(self) -> Predicate:
+        terms = [self.conjunction()]
+        while self.accept("or"):
+            terms.append(self.conjunction())
+        return terms[0] if len(terms) == 1 else Or(tuple(terms))
+
+    def conjunction(self) -> Predicate:
+        terms = [self.negation()]
+        while self.accept("and"):
+            terms.append(self.negation())
+        return terms[0] if len(terms) == 1 else And(tuple(terms))
+
+    def negation(self) -> Predicate:
+        if self.accept("not"):
+            return Not(self.negation())
+        return self.atom()
+
+    def atom(self) -> Predicate:
+        if self.accept("("):
+            inner = self.condition()
+            self.take(")")
+            return inner
+        name = self.name()
+        if name in CONDITION_CALLS and self.accept("("):
+            argument = self.name()
+            self.take(")")
+            return CONDITION_CALLS[name](argument)
+        kind, comparison, position = self.take()
+        if comparison not in COMPARISONS:
+            raise LogicError(f"Expected a comparison at {position} in {self.text!r}")
+        return Compare(name, comparison, self.literal())
+
+    # -- effects --------------------------------------------------------
+    def effects(self) -> List[Effect]:
+        effects = [self.effect()]
+        while self.accept(";"):
+            if self.peek()[0] == "end":
+                break
+            effects.append(self.effect())
+        return effects
+
+    def effect(self) -> Effect:
+        kind, op, position = self.take()
+        if op not in EFFECTS:
+            raise LogicError(f"Unknown effect {op!r} at {position} in {self.text!r}")
+        self.take("(")
+        args = [self.name()]
+        while self.accept(","):
+            args.append(self.literal())
+        self.take(")")
+        try:
+            return EFFECTS[op](*args)
+        except TypeError:
+            raise LogicError(f"Bad arguments for {op!r} in {self.text!r}") from None
+
+
+def parse_condition(text: str) -> Predicate:
+    """Parse e.g. ``has_item(key) and not has_flag(alarm) or trust >= 2``"""
+    parser = _Parser(text)
+    condition = parser.condition()
+    parser.done()
+    return condition
+
+
+def parse_effects(text: str) -> Effects:
+    """Parse e.g. ``set_flag(arrived); add_item("Queen of Swords"); increment(trust, 2)``"""
+    parser = _Parser(text)
+    effects = parser.effects()
+    parser.done()
+    return Effects(effects)
+
+
+# ----------------------------------------------------------------------
+# Converting legacy callbacks
+# ----------------------------------------------------------------------
+class _RecordingState:
+    """Stand-in game state that records writes and refuses everything else"""
+
+    def __init__(self):
+        self.effects: List[Effect] = []
+
+    def set_flag(self, flag: str, value: bool = True):
+        self.effects.append(SetFlag(flag, value))
+
+    def add_item(self, item: str):
+        self.effects.append(AddItem(item))
+
+    def set_variable(self, name: str, value: Any):
+        self.effects.append(SetVar(name, value))
+
+    def __getattr__(self, name: str):
+        # Reads make the callback's effects depend on state
+        raise LogicError(f"callback uses state.{name}")
+
+
+def trace_effects(callback: Optional[Callable]) -> Optional[Effects]:
+    """
+    Convert an ``on_enter`` callback into declarative effects.
+
+    The callback is run once against a recording state. This works for
+    the common case of unconditional ``set_flag``/``add_item``/
+    ``set_variable`` calls; anything else (reading state, other methods)
+    raises ``LogicError``.
+    """
+    if callback is None or isinstance(callback, Effects):
+        return callback
+    if isinstance(callback, Effect):
+        return Effects([callback])
+    recorder = _RecordingState()
+    try:
+        callback(recorder)
+    except LogicError as error:
+        raise LogicError(f"{getattr(callback, '__name__', callback)!s}: {error}") from None
+    return Effects(recorder.effects)
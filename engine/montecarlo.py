@@ -0,0 +1,288 @@
+"""Monte Carlo playthroughs: ending and path statistics for balancing
+
+Plays a story to an ending many times with uniformly random choices,
+directly on ``Story``/``GameState`` (no renderer, no saves), across a
+process pool. Work is split into fixed-size chunks, each with its own
+RNG seeded from the base seed and the chunk number, so results do not
+depend on the number of workers.
+
+Statistics are kept in typed arrays indexed by scene, ending and path
+length, so memory stays flat however many runs are made. With an
+output directory, the per-run columns are streamed to it as raw
+little-endian files readable with ``numpy.fromfile``::
+
+    endings.u16   ending code of each run (UNFINISHED if none was reached)
+    lengths.u32   scenes played in each run
+    summary.json  code tables and the aggregated statistics
+
+Run it from the command line with::
+
+    python -m engine.montecarlo stories.blood_and_neon:BloodAndNeonStory --runs 1000000
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .story import GameState, Story
+
+
+UNFINISHED = 0xFFFF  # Ending code of runs stopped at max_length or at a dead end
+CHUNK_RUNS = 2_000
+
+
+def _scene_table(story: Story) -> List[str]:
+    """Scene ids in declaration order: the codes shared by every worker"""
+    return list(story.scenes)
+
+
+def play_chunk(story: Story, scene_ids: List[str], seed: int, runs: int,
+               max_length: int) -> tuple:
+    """
+    Play ``runs`` random playthroughs; returns per-run columns (ending
+    codes, lengths) and the chunk's scene visits and flag coverage
+    """
+    codes = {scene_id: code for code, scene_id in enumerate(scene_ids)}
+    uniform = random.Random(seed).random  # Cheaper than randrange
+    endings = array("H")
+    lengths = array("I")
+    visits = array("Q", bytes(8 * len(scene_ids)))
+    flags: Counter = Counter()
+    available = story.choice_cache.available
+
+    for _ in range(runs):
+        state = GameState()
+        story.state = state
+        scene_id = story.starting_scene
+        ending = UNFINISHED
+        length = 0
+        while length < max_length:
+            scene = story.get_scene(scene_id)
+            if scene is None:
+                break
+            length += 1
+            visits[codes[scene_id]] += 1
+            state.visit_scene(scene_id)
+            if scene.on_enter:
+                scene.on_enter(state)
+            if scene.is_ending:
+                ending = codes[scene_id]
+                break
+            choices = available(scene, state)
+            if not choices:
+                break
+            scene_id = choices[int(uniform() * len(choices))].next_scene
+        endings.append(ending)
+        lengths.append(length)
+        flags.update(flag for flag, value in state.flags.items() if value)
+    return endings, lengths, visits, flags
+
+
+# Story and scene table of each pool worker, built once by _init_worker
+_worker = None
+
+
+def _init_worker(story_factory: Callable[[], Story]):
+    global _worker
+    story = story_factory()
+    _worker = (story, _scene_table(story))
+
+
+def _play_task(task: tuple) -> tuple:
+    seed, runs, max_length = task
+    story, scene_ids = _worker
+    return play_chunk(story, scene_ids, seed, runs, max_length)
+
+
+@dataclass
+class MonteCarloReport:
+    """Aggregated statistics of a batch of random playthroughs"""
+    title: str
+    scene_ids: List[str]
+    runs: int = 0
+    ending_counts: array = field(default_factory=lambda: array("Q"))   # By scene code
+    unfinished: int = 0
+    length_counts: array = field(default_factory=lambda: array("Q"))   # By path length
+    scene_visits: array = field(default_factory=lambda: array("Q"))    # By scene code
+    flag_runs: Counter = field(default_factory=Counter)  # Flag -> runs ending with it set
+    elapsed: float = 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.elapsed if self.elapsed else 0.0
+
+    def endings(self) -> Dict[str, int]:
+        """Runs per ending reached, most frequent first"""
+        counts = {self.scene_ids[code]: count
+                  for code, count in enumerate(self.ending_counts) if count}
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def visits(self) -> Dict[str, int]:
+        """Visits per scene (every scene, including unvisited ones)"""
+        return dict(zip(self.scene_ids, self.scene_visits))
+
+    def flag_coverage(self) -> Dict[str, float]:
+        """Share of runs ending with each flag set"""
+        return {flag: count / self.runs for flag, count in sorted(self.flag_runs.items())}
+
+    def mean_length(self) -> float:
+        total = sum(length * count for length, count in enumerate(self.length_counts))
+        return total / self.runs if self.runs else 0.0
+
+    def length_percentile(self, percent: float) -> int:
+        """Smallest path length covering ``percent`` of the runs"""
+        target = self.runs * percent / 100
+        seen = 0
+        for length, count in enumerate(self.length_counts):
+            seen += count
+            if count and seen >= target:
+                return length
+        return 0
+
+    def add_chunk(self, endings: array, lengths: array, visits: array, flags: Counter):
+        """Fold one chunk's results in"""
+        self.runs += len(endings)
+        ending_counts, length_counts = self.ending_counts, self.length_counts
+        for code in endings:
+            if code == UNFINISHED:
+                self.unfinished += 1
+            else:
+                ending_counts[code] += 1
+        longest = max(lengths, default=0)
+        if longest >= len(length_counts):
+            length_counts.extend(bytes(8 * (longest + 1 - len(length_counts))))
+        for length in lengths:
+            length_counts[length] += 1
+        for code, count in enumerate(visits):
+            self.scene_visits[code] += count
+        self.flag_runs.update(flags)
+
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "runs": self.runs,
+            "unfinished": self.unfinished,
+            "elapsed": self.elapsed,
+            "scene_ids": self.scene_ids,
+            "unfinished_code": UNFINISHED,
+            "endings": self.endings(),
+            "length_counts": list(self.length_counts),
+            "scene_visits": self.visits(),
+            "flag_coverage": self.flag_coverage(),
+        }
+
+
+def simulate(story_factory: Callable[[], Story], runs: int, seed: int = 0,
+             processes: Optional[int] = None, output: Optional[Path] = None,
+             max_length: int = 1_000, chunk_runs: int = CHUNK_RUNS) -> MonteCarloReport:
+    """
+    Play ``runs`` random playthroughs
+
+    Args:
+        story_factory: Builds the story (a Story subclass works); must be
+            picklable when processes > 1
+        runs: Number of playthroughs
+        seed: Base seed; the same seed gives the same results for any
+            number of processes
+        processes: Pool size (defaults to the CPU count); 1 plays in this process
+        output: Directory to stream the per-run columns and summary to
+        max_length: Scenes after which a run counts as unfinished
+        chunk_runs: Runs per task (and per RNG seed)
+    """
+    started = time.perf_counter()
+    story = story_factory()
+    scene_ids = _scene_table(story)
+    if len(scene_ids) >= UNFINISHED:
+        raise ValueError("too many scenes for 16-bit ending codes")
+    report = MonteCarloReport(title=story.title, scene_ids=scene_ids,
+                              ending_counts=array("Q", bytes(8 * len(scene_ids))),
+                              scene_visits=array("Q", bytes(8 * len(scene_ids))))
+    tasks = [(seed * 1_000_003 + chunk, min(chunk_runs, runs - start), max_length)
+             for chunk, start in enumerate(range(0, runs, chunk_runs))]
+    processes = processes or multiprocessing.cpu_count()
+
+    columns = None
+    if output is not None:
+        output = Path(output)
+        output.mkdir(parents=True, exist_ok=True)
+        columns = (open(output / "endings.u16", "wb"), open(output / "lengths.u32", "wb"))
+    pool = None
+    try:
+        if processes > 1 and len(tasks) > 1:
+            pool = multiprocessing.Pool(processes, initializer=_init_worker,
+                                        initargs=(story_factory,))
+            results = pool.imap(_play_task, tasks)  # In order, so the columns are too
+        else:
+            results = (play_chunk(story, scene_ids, *task) for task in tasks)
+        for endings, lengths, visits, flags in results:
+            report.add_chunk(endings, lengths, visits, flags)
+            if columns is not None:
+                for column, values in zip(columns, (endings, lengths)):
+                    if sys.byteorder != "little":
+                        values.byteswap()
+                    values.tofile(column)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        if columns is not None:
+            for column in columns:
+                column.close()
+
+    report.elapsed = time.perf_counter() - started
+    if output is not None:
+        (output / "summary.json").write_text(json.dumps(report.to_dict(), indent=2))
+    return report
+
+
+def print_report(report: MonteCarloReport):
+    print(f"Story: {report.title}")
+    print(f"Playthroughs: {report.runs:,} in {report.elapsed:.2f}s "
+          f"({report.runs_per_second:,.0f} runs/s), {report.unfinished:,} unfinished")
+    print(f"Path length: mean {report.mean_length():.1f}, median "
+          f"{report.length_percentile(50)}, 95th percentile {report.length_percentile(95)}")
+    print("\nEndings:")
+    for ending, count in report.endings().items():
+        print(f"  {ending:40} {count:>10,} {count / report.runs:8.2%}")
+    never = [scene_id for scene_id, count in report.visits().items() if not count]
+    if never:
+        print(f"\nScenes never visited ({len(never)}):")
+        for scene_id in never:
+            print(f"  - {scene_id}")
+    print("\nFlag coverage:")
+    for flag, share in report.flag_coverage().items():
+        print(f"  {flag:40} {share:8.2%}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .bundle import BundleError, load_story_class
+
+    parser = argparse.ArgumentParser(description="Play a story many times at random")
+    parser.add_argument("story", help="Story class, e.g. stories.noir_detective:NoirDetectiveStory")
+    parser.add_argument("--runs", type=int, default=100_000, help="Playthroughs")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes")
+    parser.add_argument("--output", default=None, help="Directory for the per-run columns")
+    args = parser.parse_args(argv)
+
+    try:
+        story_class = load_story_class(args.story)
+    except BundleError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    report = simulate(story_class, args.runs, seed=args.seed, processes=args.processes,
+                      output=args.output)
+    print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import random
-import time
 from dataclasses import dataclass
-from threading import Event, Thread
 from typing import Any, Callable, List, Optional, Sequence
 
 try:  # Rich is optional; fall back to SimpleOpening when unavailable
@@ -45,7 +43,8 @@ except ImportError:
         ALERT_ORANGE = "#ffa500"
         CALM_CYAN = "#00ffff"
 
-from .input_handler import InputHandler
+from .clock import Clock, get_clock
+from .input_dispatcher import InputDispatcher, get_dispatcher
 from .settings import GameSettings
 
 
@@ -267,6 +266,8 @@ class OpeningSequence:
         stories: Sequence[StoryOption],
         use_colors: bool = True,
         version: str = VERSION,
+        clock: Optional[Clock] = None,
+        input_dispatcher: Optional[InputDispatcher] = None,
     ):
         if not RICH_AVAILABLE:
             raise RuntimeError(
@@ -280,6 +281,8 @@ class OpeningSequence:
         self.settings = settings
         self.stories = list(stories)
         self.version = version
+        self.clock = clock or get_clock()
+        self.input = input_dispatcher or get_dispatcher()  # Keys for menus and cinematics
         self.tagline = random.choice(self.TAGLINES)
         self.quote = random.choice(self.ATMOSPHERIC_QUOTES)
         self.konami_progress = 0
@@ -330,17 +333,17 @@ class OpeningSequence:
         with Live(console=self.console, refresh_per_second=30, screen=True) as live:
             for step in range(max_chars + 1):
                 live.update(self._render_title_frame(step, accent_cycle[step % 2]))
-                time.sleep(0.03)
+                self.clock.sleep(0.03)
 
         # Neon flicker for dramatic flair
         for _ in range(3):
             frame = self._render_title_frame(max_chars, ColorPalette.NOIR_NEON_RED)
             self.console.print(frame)
-            time.sleep(0.12)
+            self.clock.sleep(0.12)
             frame = self._render_title_frame(max_chars, ColorPalette.NOIR_NEON_BLUE)
             self.console.print(frame)
-            time.sleep(0.12)
-        time.sleep(0.3)
+            self.clock.sleep(0.12)
+        self.clock.sleep(0.3)
 
     def _render_title_frame(self, progress: int, accent_color: str) -> Layout:
         """Construct a title frame for the given progress point."""
@@ -403,26 +406,17 @@ class OpeningSequence:
             (f"dim {ColorPalette.NEUTRAL_GRAY}", "Press any key to start"),
         ]
 
-        stop_event = Event()
-
-        def listener() -> None:
-            try:
-                with InputHandler() as handler:
-                    handler.read_key()
-                    stop_event.set()
-            except (KeyboardInterrupt, EOFError, Exception):
-                stop_event.set()
-
-        Thread(target=listener, daemon=True).start()
-
         variant_index = 0
-        with Live(console=self.console, refresh_per_second=10) as live:
-            while not stop_event.is_set():
-                style, text = message_variants[variant_index % len(message_variants)]
-                prompt = Text(f"\n{text}...", style=style)
-                live.update(Align.center(prompt))
-                time.sleep(0.5)
-                variant_index += 1
+        with self.input.subscribe() as keys:
+            with Live(console=self.console, refresh_per_second=10) as live:
+                while True:
+                    style, text = message_variants[variant_index % len(message_variants)]
+                    prompt = Text(f"\n{text}...", style=style)
+                    live.update(Align.center(prompt))
+                    # Pulse every half second, but return the moment a key arrives
+                    if self.clock.wait(keys.pressed, 0.5):
+                        break
+                    variant_index += 1
 
     # ------------------------------------------------------------------
     # Main menu
@@ -440,11 +434,11 @@ class OpeningSequence:
         selected = 0
         konami_progress = 0
 
-        with InputHandler() as handler:
+        with self.input.subscribe() as keys:
             with Live(console=self.console, refresh_per_second=30) as live:
                 while True:
                     live.update(self._render_menu(options, selected))
-                    key = handler.read_key()
+                    key = keys.get()
 
                     if key in ("UP", "k", "K"):
                         selected = (selected - 1) % len(options)
@@ -529,36 +523,21 @@ class OpeningSequence:
             box=HEAVY,
         )
         self.console.print(panel)
-        time.sleep(2.2)
+        self.clock.sleep(2.2)
 
     # ------------------------------------------------------------------
     # Cinematic
     # ------------------------------------------------------------------
     def _play_cinematic(self) -> None:
-        skip_event = Event()
-
-        def listener() -> None:
-            try:
-                with InputHandler() as handler:
-                    handler.read_key()
-                    skip_event.set()
-            except (KeyboardInterrupt, EOFError, Exception):
-                skip_event.set()
-
-        Thread(target=listener, daemon=True).start()
-
-        with Live(console=self.console, refresh_per_second=24) as live:
-            for frame in self.CINEMATIC_FRAMES:
-                start_time = time.time()
-                while time.time() - start_time < frame.duration:
+        with self.input.subscribe() as keys:
+            with Live(console=self.console, refresh_per_second=24) as live:
+                for frame in self.CINEMATIC_FRAMES:
                     live.update(self._render_cinematic_frame(frame))
-                    if skip_event.is_set():
+                    if self.clock.wait(keys.pressed, frame.duration):
                         break
-                    time.sleep(0.2)
-                if skip_event.is_set():
-                    break
+            skipped = keys.pressed.is_set()
 
-        if skip_event.is_set():
+        if skipped:
             self.console.print(
                 Align.center(
                     Text(
@@ -567,7 +546,7 @@ class OpeningSequence:
                     )
                 )
             )
-            time.sleep(1.2)
+            self.clock.sleep(1.2)
 
     def _render_cinematic_frame(self, frame: CinematicFrame) -> Layout:
         art_panel = Panel(
@@ -608,11 +587,11 @@ class OpeningSequence:
             return self.stories[0]
 
         selected = 0
-        with InputHandler() as handler:
+        with self.input.subscribe() as keys:
             with Live(console=self.console, refresh_per_second=30) as live:
                 while True:
                     live.update(self._render_story_menu(selected))
-                    key = handler.read_key()
+                    key = keys.get()
 
                     if key in ("UP", "k", "K"):
                         selected = (selected - 1) % len(self.stories)
@@ -729,6 +708,11 @@ class OpeningSequence:
                 lambda: "Enabled" if self.settings.typewriter_enabled else "Disabled",
                 self.settings.toggle_typewriter,
             ),
+            (
+                "Skip With Any Key",
+                lambda: "Enabled" if self.settings.skip_enabled else "Disabled",
+                self.settings.toggle_skip,
+            ),
             (
                 "Sound Effects",
                 lambda: "Coming Soon" if not self.settings.sound_enabled else "Coming Soon",
@@ -738,11 +722,11 @@ class OpeningSequence:
         ]
 
         selected = 0
-        with InputHandler() as handler:
+        with self.input.subscribe() as keys:
             with Live(console=self.console, refresh_per_second=30) as live:
                 while True:
                     live.update(self._render_settings_menu(settings_options, selected))
-                    key = handler.read_key()
+                    key = keys.get()
 
                     if key in ("UP", "k", "K"):
                         selected = (selected - 1) % len(settings_options)
@@ -1,22 +1,27 @@
 """Terminal rendering utilities with Rich color support"""
 
-import os
 import sys
-import time
+from threading import Event
 from typing import List, Union
 from rich.text import Text
+from .clock import Clock, get_clock
 from .colors import ColorRenderer, ColorPalette, MoodColors, CharacterColors
+from .frame_diff import CLEAR_SCREEN, DiffFrameRenderer
+from .terminal import clear_screen, probe_terminal
+from .typewriter import Typewriter
 
 
 class TerminalRenderer:
     """Handles terminal rendering with color support"""
     
-    def __init__(self, use_colors: bool = True, settings=None):
+    def __init__(self, use_colors: bool = True, settings=None, clock: Clock = None):
         self.use_colors = use_colors
         self.settings = settings
+        self.clock = clock or get_clock()  # Paces the typewriter and frame delays
+        self.skip = Event()  # Set to finish the current text at once (see SkipListener)
         if use_colors:
             try:
-                self.color_renderer = ColorRenderer()
+                self.color_renderer = ColorRenderer(clock=self.clock, skip=self.skip)
             except ImportError:
                 self.use_colors = False
                 self.color_renderer = None
@@ -24,6 +29,12 @@ class TerminalRenderer:
             self.color_renderer = None
         
         self.current_mood = MoodColors.NOIR_DETECTIVE
+        self.typewriter = Typewriter(clock=self.clock.now, skip=self.skip,
+                                     sleep=lambda seconds: self.clock.wait(self.skip, seconds))
+        # Resolve the clear sequence once instead of per clear() call
+        self.terminal = probe_terminal()
+        self.frame_renderer = DiffFrameRenderer(
+            clear_sequence=self.terminal.clear_sequence or CLEAR_SCREEN)
     
     def set_mood(self, mood_colors: dict):
         """Set the color mood for the scene"""
@@ -31,26 +42,53 @@ class TerminalRenderer:
     
     def clear(self):
         """Clear the terminal screen"""
+        self.frame_renderer.reset()
         if self.use_colors and self.color_renderer:
             self.color_renderer.clear()
         else:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen(sys.stdout)
     
     def display_frame(self, frame: Union[str, Text], delay: float = 0.05, color: str = None):
-        """Display a single frame with optional color"""
-        self.clear()
-        if isinstance(frame, Text):
-            if self.use_colors and self.color_renderer:
-                self.color_renderer.console.print(frame)
+        """Display a single frame with optional color, then wait ``delay``"""
+        self.render_frame(frame, color=color)
+        self.clock.wait(self.skip, delay)
+    
+    def render_frame(self, frame: Union[str, Text], color: str = None):
+        """Draw a single frame without waiting (timing is the caller's job)
+        
+        Only the cells that differ from the previous frame are rewritten;
+        call ``reset_frames()`` (or ``clear()``) to force a full repaint.
+        Terminals that cannot clear (and output that is not a terminal)
+        get each frame as plain text instead of cursor escapes.
+        """
+        if self.use_colors and self.color_renderer:
+            console = self.color_renderer.console
+            frame_color = color or self.current_mood.get('ascii_art', ColorPalette.NOIR_AMBER)
+            if not self._can_patch_frames(console.is_terminal):
+                if isinstance(frame, Text):
+                    console.print(frame)
+                else:
+                    self.color_renderer.print_ascii_art(frame, color=frame_color)
+                return
+            self.frame_renderer.stream = console.file
+            if isinstance(frame, Text):
+                self.frame_renderer.draw(frame, console=console)
             else:
-                print(str(frame))
+                self.frame_renderer.draw(frame, style=f"bold {frame_color}", console=console)
         else:
-            frame_color = color or (self.current_mood.get('ascii_art') if self.use_colors else None)
-            if self.use_colors and self.color_renderer:
-                self.color_renderer.print_ascii_art(frame, color=frame_color)
-            else:
-                print(frame)
-        time.sleep(delay)
+            if not self._can_patch_frames(sys.stdout.isatty()):
+                print(str(frame))
+                return
+            self.frame_renderer.stream = sys.stdout
+            self.frame_renderer.draw(frame)
+    
+    def _can_patch_frames(self, is_terminal: bool) -> bool:
+        """Whether frames can be redrawn in place with cursor addressing"""
+        return bool(self.terminal.clear_sequence) and is_terminal
+    
+    def reset_frames(self):
+        """Make the next animation frame a full repaint"""
+        self.frame_renderer.reset()
     
     def _typewriter_enabled(self) -> bool:
         if self.settings is None:
@@ -78,10 +116,7 @@ class TerminalRenderer:
                 self.color_renderer.print_colored(text, color=text_color)
         else:
             if use_typewriter:
-                for char in text:
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    time.sleep(effective_delay)
+                self.typewriter.type_text(text, effective_delay, stream=sys.stdout)
                 print()
             else:
                 print(text)
@@ -110,10 +145,7 @@ class TerminalRenderer:
         else:
             print(f"\n{speaker}:")
             if use_typewriter:
-                for char in text:
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    time.sleep(effective_delay)
+                self.typewriter.type_text(text, effective_delay, stream=sys.stdout)
                 print("\n")
             else:
                 print(text)
@@ -185,6 +217,13 @@ class TerminalRenderer:
         else:
             input(message)
     
+    def display_status(self, message: str, style: str = None):
+        """Display a one-line status message (autosave notices and the like)"""
+        if self.use_colors and self.color_renderer:
+            self.color_renderer.console.print(message, style=style)
+        else:
+            print(message)
+    
     def display_title(self, title: str, subtitle: str = None, color: str = None):
         """Display a title screen with color"""
         title_color = color or (ColorPalette.NOIR_NEON_RED if self.use_colors else None)
@@ -0,0 +1,81 @@
+"""In-memory rewind buffer of game state snapshots"""
+
+import sys
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from .story import GameState, GameStateSnapshot
+
+
+def _containers(snapshot: GameStateSnapshot) -> tuple:
+    """The containers a snapshot holds on to"""
+    return (snapshot.visited_scenes, snapshot._flags, snapshot.inventory,
+            snapshot._variables, snapshot._history)
+
+
+class RewindBuffer:
+    """
+    The last few scene entries, to step back without touching the disk.
+
+    Snapshots share every container the state has not changed since, so
+    consecutive snapshots mostly point at the same objects. A snapshot is
+    charged only for the containers no newer snapshot (or the live state)
+    still uses -- what evicting it actually frees. The oldest snapshots
+    are evicted once there are more than ``capacity`` of them or they
+    hold more than ``memory_budget`` bytes.
+    """
+
+    SNAPSHOT_SIZE = sys.getsizeof(GameStateSnapshot.__new__(GameStateSnapshot))
+
+    def __init__(self, capacity: int = 50, memory_budget: int = 4 * 1024 * 1024):
+        if capacity < 1:
+            raise ValueError("rewind capacity must be at least 1")
+        self.capacity = capacity
+        self.memory_budget = memory_budget
+        self._entries: Deque[Tuple[GameStateSnapshot, int]] = deque()  # (snapshot, bytes)
+        self.memory_used = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scenes(self) -> List[str]:
+        """Scene of each snapshot, oldest first"""
+        return [snapshot.current_scene for snapshot, _ in self._entries]
+
+    def push(self, state: GameState):
+        """Snapshot the state on entering a scene"""
+        snapshot = state.snapshot()
+        entries = self._entries
+        if entries:
+            # The previous snapshot now owns whatever it no longer shares
+            previous, cost = entries[-1]
+            shared = {id(container) for container in _containers(snapshot)}
+            owned = self.SNAPSHOT_SIZE + sum(
+                sys.getsizeof(container) for container in _containers(previous)
+                if id(container) not in shared)
+            entries[-1] = (previous, owned)
+            self.memory_used += owned - cost
+        entries.append((snapshot, self.SNAPSHOT_SIZE))
+        self.memory_used += self.SNAPSHOT_SIZE
+        while len(entries) > 1 and (len(entries) > self.capacity
+                                    or self.memory_used > self.memory_budget):
+            self.memory_used -= entries.popleft()[1]
+
+    def rewind(self, state: GameState, steps: int) -> Optional[str]:
+        """
+        Restore the state to ``steps`` scenes before the current one and
+        return that scene's id (None if the buffer does not go back so far).
+        The snapshot is dropped too: the scene pushes it again on entry.
+        """
+        if steps < 1 or steps >= len(self._entries):
+            return None
+        for _ in range(steps):
+            self.memory_used -= self._entries.pop()[1]
+        snapshot, cost = self._entries.pop()
+        self.memory_used -= cost
+        state.restore(snapshot)
+        return snapshot.current_scene
+
+    def clear(self):
+        self._entries.clear()
+        self.memory_used = 0
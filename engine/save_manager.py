@@ -1,63 +1,511 @@
 """Save/Load system for Terminal Theatre"""
 
 import json
+import lzma
 import os
+import re
+import struct
+import tempfile
+import threading
 import time
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from bisect import bisect_left, insort
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+from .save_store import (DEFAULT_PROFILE, PROFILE_NAME, SORT_ORDERS, SORT_TIMESTAMP,
+                         SaveMetadata, SavePage, SaveStore, sort_key, validate_profile)
+
+
+class SaveFormatError(ValueError):
+    """Raised when a save file cannot be decoded"""
+
+
+# Binary save envelope:
+#   header   magic, version, compression, metadata length, body length, body CRC32
+#   metadata compact UTF-8 JSON, uncompressed so it can be read on its own
+#   body     compact UTF-8 JSON of the game state, compressed
+SAVE_MAGIC = b"TTSV"
+SAVE_FORMAT_VERSION = 1
+SAVE_HEADER = struct.Struct("<4sHBxIII")
+
+# Compression name -> (id in the header, compress, decompress)
+SAVE_COMPRESSORS = {
+    None: (0, bytes, bytes),
+    "zlib": (1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+_DECOMPRESSORS = {code: decompress for code, _, decompress in SAVE_COMPRESSORS.values()}
+
+
+def _compact_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def encode_binary_save(save_data: Dict[str, Any], compression: Optional[str] = "zlib") -> bytes:
+    """Pack {'metadata', 'game_state'} into the binary save envelope"""
+    code, compress, _ = SAVE_COMPRESSORS[compression]
+    metadata = _compact_json(save_data['metadata'])
+    body = compress(_compact_json(save_data['game_state']))
+    header = SAVE_HEADER.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, code,
+                              len(metadata), len(body), zlib.crc32(body))
+    return header + metadata + body
+
+
+def _unpack_header(header: bytes) -> Tuple[int, int, int, int]:
+    if len(header) < SAVE_HEADER.size:
+        raise SaveFormatError("truncated save header")
+    magic, version, code, metadata_length, body_length, crc = SAVE_HEADER.unpack_from(header)
+    if magic != SAVE_MAGIC:
+        raise SaveFormatError("not a binary save")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFormatError(f"save format version {version} is newer than this game")
+    if code not in _DECOMPRESSORS:
+        raise SaveFormatError(f"unknown save compression {code}")
+    return code, metadata_length, body_length, crc
+
+
+def decode_save(payload: bytes) -> Dict[str, Any]:
+    """Decode a save file, binary or legacy JSON"""
+    if not payload.startswith(SAVE_MAGIC):
+        try:
+            return json.loads(payload)
+        except ValueError as e:
+            raise SaveFormatError(str(e)) from e
+    code, metadata_length, body_length, crc = _unpack_header(payload)
+    start = SAVE_HEADER.size
+    metadata = payload[start:start + metadata_length]
+    body = payload[start + metadata_length:]
+    if len(metadata) != metadata_length or len(body) != body_length or zlib.crc32(body) != crc:
+        raise SaveFormatError("save body is truncated or damaged")
+    try:
+        return {
+            'metadata': json.loads(metadata),
+            'game_state': json.loads(_DECOMPRESSORS[code](body)),
+        }
+    except (ValueError, zlib.error, lzma.LZMAError) as e:
+        raise SaveFormatError(str(e)) from e
+
+
+def read_save_metadata(path: Path) -> Dict[str, Any]:
+    """Read only the metadata block of a save file (legacy JSON is parsed fully)"""
+    with open(path, 'rb') as f:
+        header = f.read(SAVE_HEADER.size)
+        if not header.startswith(SAVE_MAGIC):
+            return decode_save(header + f.read())['metadata']
+        _, metadata_length, _, _ = _unpack_header(header)
+        metadata = f.read(metadata_length)
+    if len(metadata) != metadata_length:
+        raise SaveFormatError("truncated save metadata")
+    try:
+        return json.loads(metadata)
+    except ValueError as e:
+        raise SaveFormatError(str(e)) from e
+
+
+def apply_journal(game_state: Dict[str, Any], deltas: List[list]):
+    """Replay GameState journal deltas onto a saved game state dictionary"""
+    visited = game_state.setdefault('visited_scenes', [])
+    flags = game_state.setdefault('flags', {})
+    inventory = game_state.setdefault('inventory', [])
+    variables = game_state.setdefault('variables', {})
+    history = game_state.setdefault('choice_history', [])
+    for delta in deltas:
+        kind = delta[0]
+        if kind == "visit":
+            game_state['current_scene'] = delta[1]
+            if delta[2]:  # First visit, as decided by the GameState
+                visited.append(delta[1])
+        elif kind == "choice":
+            history.append(list(delta[1:4]))
+            if 'choices_made' in game_state:
+                game_state['choices_made'] += 1
+        elif kind == "flag":
+            flags[delta[1]] = delta[2]
+        elif kind == "item":
+            inventory.append(delta[1])
+        elif kind == "var":
+            variables[delta[1]] = delta[2]
+        elif kind == "playtime":
+            game_state['playtime'] = delta[1]
+        else:
+            raise SaveFormatError(f"unknown journal delta {kind!r}")
 
 
 @dataclass
-class SaveMetadata:
-    """Metadata for a save file"""
-    slot: int
-    save_name: str
-    timestamp: str
-    game_version: str
-    current_scene: str
-    scene_description: str
-    playtime: float
-    completion_percentage: float
-    visited_scenes_count: int
-    total_choices_made: int
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return asdict(self)
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'SaveMetadata':
-        """Create from dictionary"""
-        return SaveMetadata(**data)
+class _JournalTail:
+    """What a SaveManager knows about a journal it is appending to"""
+    base_stamp: List[int]      # Stamp of the base save the journal extends
+    metadata: SaveMetadata     # Metadata of the base plus the appended deltas
+    story_title: str
+    total_scenes: int
+    entries: int = 0           # Lines appended since the base was written
 
 
-class SaveManager:
-    """Manages game save/load operations"""
+class SaveManager(SaveStore):
+    """
+    Manages game save/load operations
+    
+    The file-backed SaveStore: one directory per profile, one file per
+    slot, and an index file of slot metadata kept sorted in memory for
+    paged listings.
+    """
     
     DEFAULT_SAVE_DIR = Path.home() / ".terminal_theatre" / "saves"
-    AUTOSAVE_SLOT = 0
-    MAX_SAVE_SLOTS = 10
-    GAME_VERSION = "1.0.0"
+    PROFILES_DIR = "profiles"
+    INDEX_FILE = "index.jsonl"
+    INDEX_VERSION = 2
+    SLOT_FILE = re.compile(r"(?:autosave|save_slot_(\d+))\.(?:json|sav)")
+    
+    # On-disk formats; either is read back regardless of the one selected
+    FORMAT_JSON = "json"      # Indented JSON, human readable
+    FORMAT_BINARY = "binary"  # Envelope from encode_binary_save
+    FORMAT_EXTENSIONS = {FORMAT_JSON: ".json", FORMAT_BINARY: ".sav"}
+    
+    # Durability modes for writes. Every mode replaces the slot file
+    # atomically, so a crash never leaves a half-written save; they differ
+    # in whether the data is forced to disk before save_game returns.
+    #   strict  - fsync the file and its directory on every save
+    #   batched - fsync at most once per batch interval (and on sync())
+    #   none    - leave flushing to the operating system
+    DURABILITY_STRICT = "strict"
+    DURABILITY_BATCHED = "batched"
+    DURABILITY_NONE = "none"
+    DURABILITY_MODES = (DURABILITY_STRICT, DURABILITY_BATCHED, DURABILITY_NONE)
     
-    def __init__(self, save_dir: Optional[Path] = None):
-        """Initialize save manager"""
-        self.save_dir = Path(save_dir) if save_dir else self.DEFAULT_SAVE_DIR
+    def __init__(self, save_dir: Optional[Path] = None,
+                 profile: Optional[str] = None,
+                 durability: str = DURABILITY_STRICT,
+                 autosave_durability: str = DURABILITY_BATCHED,
+                 batch_interval: float = 5.0,
+                 save_format: str = FORMAT_JSON,
+                 compression: Optional[str] = "zlib",
+                 journal: bool = False,
+                 journal_compact_every: int = 50):
+        """
+        Initialize save manager
+        
+        Args:
+            save_dir: Root directory for saves
+            profile: Player profile; the default profile uses save_dir
+                itself, others a subdirectory of it
+            durability: Durability mode for manual saves
+            autosave_durability: Durability mode for the autosave slot
+            batch_interval: Seconds between fsyncs in batched mode
+            save_format: FORMAT_JSON or FORMAT_BINARY for new saves
+            compression: Body compression for binary saves (zlib, lzma or None)
+            journal: Let append_journal add deltas to a slot instead of
+                rewriting it (journals are replayed on load either way)
+            journal_compact_every: Appends before the full state is rewritten
+        """
+        for mode in (durability, autosave_durability):
+            if mode not in self.DURABILITY_MODES:
+                raise ValueError(f"Unknown durability mode: {mode!r}")
+        if save_format not in self.FORMAT_EXTENSIONS:
+            raise ValueError(f"Unknown save format: {save_format!r}")
+        if compression not in SAVE_COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression!r}")
+        self.save_format = save_format
+        self.compression = compression
+        self.journal = journal
+        self.journal_compact_every = journal_compact_every
+        self._journals: Dict[int, _JournalTail] = {}
+        self.root_dir = Path(save_dir) if save_dir else self.DEFAULT_SAVE_DIR
+        self.profile = validate_profile(profile)
+        if self.profile == DEFAULT_PROFILE:
+            self.save_dir = self.root_dir
+        else:
+            self.save_dir = self.root_dir / self.PROFILES_DIR / self.profile
+        self.durability = durability
+        self.autosave_durability = autosave_durability
+        self.batch_interval = batch_interval
+        self._unsynced: List[Path] = []
+        self._sync_lock = threading.Lock()  # Autosaves write from another thread
+        self._last_sync = time.monotonic()
+        # Slot metadata index: {slot: {"stamp": [mtime_ns, size, ino], "metadata": {...}}},
+        # persisted as a log of [slot, entry] lines (null entry = deleted)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_stamp: Optional[tuple] = None
+        self._index_offset = 0  # Bytes of the index log applied so far
+        self._index_lines = 0   # Entry lines in the log, live or superseded
+        self._dirty: set = set()  # Keys changed since the log was last written
+        self._index_lock = threading.RLock()
+        # Per sort order, sorted (sort key, slot) pairs; built on first use
+        self._orders: Optional[Dict[str, List[tuple]]] = None
         self._ensure_save_directory()
     
     def _ensure_save_directory(self):
         """Create save directory if it doesn't exist"""
         self.save_dir.mkdir(parents=True, exist_ok=True)
     
-    def _get_save_path(self, slot: int) -> Path:
-        """Get path for a save slot"""
-        if slot == self.AUTOSAVE_SLOT:
-            return self.save_dir / "autosave.json"
-        return self.save_dir / f"save_slot_{slot}.json"
+    def _get_save_path(self, slot: int, save_format: Optional[str] = None) -> Path:
+        """
+        Get path for a save slot
+        
+        Without a format, this is the slot's existing file in either
+        format, or where a new save in the selected format would go.
+        """
+        stem = "autosave" if slot == self.AUTOSAVE_SLOT else f"save_slot_{slot}"
+        if save_format is not None:
+            return self.save_dir / (stem + self.FORMAT_EXTENSIONS[save_format])
+        preferred = self._get_save_path(slot, self.save_format)
+        if not preferred.exists():
+            for other_format in self.FORMAT_EXTENSIONS:
+                other = self._get_save_path(slot, other_format)
+                if other.exists():
+                    return other
+        return preferred
+    
+    def _get_journal_path(self, slot: int) -> Path:
+        """Get the journal path for a save slot"""
+        stem = "autosave" if slot == self.AUTOSAVE_SLOT else f"save_slot_{slot}"
+        return self.save_dir / f"{stem}.journal"
+    
+    def _discard_journal(self, slot: int):
+        """Forget a slot's journal; its base save now holds the full state"""
+        self._journals.pop(slot, None)
+        try:
+            os.unlink(self._get_journal_path(slot))
+        except FileNotFoundError:
+            pass
+    
+    def _encode(self, save_data: Dict[str, Any]) -> bytes:
+        """Serialize save data in the selected format"""
+        if self.save_format == self.FORMAT_BINARY:
+            return encode_binary_save(save_data, self.compression)
+        return json.dumps(save_data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _replace_save(self, slot: int, payload: bytes, durability: str):
+        """Write a slot file, removing the slot's file in any other format"""
+        self._write_atomic(self._get_save_path(slot, self.save_format), payload, durability)
+        for other_format in self.FORMAT_EXTENSIONS:
+            if other_format != self.save_format:
+                try:
+                    os.unlink(self._get_save_path(slot, other_format))
+                except FileNotFoundError:
+                    pass
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[List[int]]:
+        """Identify a file version by mtime, size and inode (None if missing)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+    
+    def _load_index(self):
+        """
+        Catch up with the index log: read only what was appended since we
+        last looked, or all of it after a compaction or on first use
+        """
+        index_path = self.save_dir / self.INDEX_FILE
+        stamp = self._file_stamp(index_path)
+        if stamp == self._index_stamp:
+            return
+        previous, self._index_stamp = self._index_stamp, stamp
+        if (stamp is not None and previous is not None and stamp[2] == previous[2]
+                and stamp[1] >= self._index_offset):
+            if self._read_index_log(index_path, self._index_offset):
+                return
+        self._index = {}
+        self._orders = None
+        self._dirty = set()
+        self._index_offset = self._index_lines = 0
+        if stamp is not None and self._read_index_log(index_path, 0):
+            return
+        self._rebuild_index()
+    
+    def _read_index_log(self, index_path: Path, offset: int) -> bool:
+        """Apply index log lines from ``offset``; False if the log is unusable"""
+        try:
+            with open(index_path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return False
+        # Stop at the last complete line; a writer may be mid-append
+        data = data[:data.rfind(b"\n") + 1]
+        lines = data.splitlines()
+        if offset == 0:
+            try:
+                if json.loads(lines[0]) != {'version': self.INDEX_VERSION}:
+                    return False
+            except (IndexError, ValueError):
+                return False
+            lines = lines[1:]
+        for line in lines:
+            try:
+                key, entry = json.loads(line)
+            except ValueError:
+                return False
+            self._set_entry(key, entry, log=False)
+        self._index_offset = offset + len(data)
+        self._index_lines += len(lines)
+        return True
+    
+    def _rebuild_index(self):
+        """Index every save file in the profile directory"""
+        try:
+            names = os.listdir(self.save_dir)
+        except OSError:
+            return
+        for name in names:
+            match = self.SLOT_FILE.fullmatch(name)
+            if match:
+                slot = int(match.group(1)) if match.group(1) else self.AUTOSAVE_SLOT
+                self._lookup_metadata(slot)
+        if self._index:
+            self._store_index()
+    
+    def _set_entry(self, key: str, entry: Optional[Dict[str, Any]], log: bool = True):
+        """Change one index entry, keeping the sort orders in step"""
+        old = self._index.pop(key, None) if entry is None else self._index.get(key)
+        if entry is not None:
+            self._index[key] = entry
+        if log:
+            self._dirty.add(key)
+        if self._orders is None:
+            return
+        slot = int(key)
+        for sort_by, order in self._orders.items():
+            if old is not None:
+                item = (sort_key(sort_by, SaveMetadata.from_dict(old['metadata'])), slot)
+                position = bisect_left(order, item)
+                if position < len(order) and order[position] == item:
+                    del order[position]
+            if entry is not None:
+                insort(order, (sort_key(sort_by, SaveMetadata.from_dict(entry['metadata'])), slot))
+    
+    def _order(self, sort_by: str) -> List[tuple]:
+        """(sort key, slot) pairs for every indexed save, ascending"""
+        if sort_by not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {sort_by!r}")
+        if self._orders is None:
+            entries = [(int(key), SaveMetadata.from_dict(entry['metadata']))
+                       for key, entry in self._index.items()]
+            self._orders = {
+                order: sorted((sort_key(order, metadata), slot) for slot, metadata in entries)
+                for order in SORT_ORDERS
+            }
+        return self._orders[sort_by]
+    
+    def _store_index(self):
+        """Rewrite the index log compactly; it is a cache, so no fsync"""
+        index_path = self.save_dir / self.INDEX_FILE
+        lines = [_compact_json({'version': self.INDEX_VERSION})]
+        lines.extend(_compact_json([key, entry]) for key, entry in self._index.items())
+        payload = b"\n".join(lines) + b"\n"
+        self._dirty.clear()
+        try:
+            self._write_atomic(index_path, payload, self.DURABILITY_NONE)
+        except OSError:
+            self._index_stamp = None
+            return
+        self._index_stamp = self._file_stamp(index_path)
+        self._index_offset = len(payload)
+        self._index_lines = len(self._index)
+    
+    def _flush_index(self):
+        """Append the changed index entries to the log, compacting it when mostly stale"""
+        if not self._dirty:
+            return
+        if self._index_stamp is None or self._index_lines > 2 * len(self._index) + 64:
+            self._store_index()
+            return
+        payload = b"".join(_compact_json([key, self._index.get(key)]) + b"\n"
+                           for key in self._dirty)
+        self._dirty.clear()
+        try:
+            fd = os.open(self.save_dir / self.INDEX_FILE, os.O_WRONLY | os.O_APPEND)
+        except OSError:
+            self._index_stamp = None  # Gone: rebuilt on the next read
+            return
+        try:
+            os.write(fd, payload)  # One write, so concurrent appends do not interleave
+        finally:
+            os.close(fd)
+        # _index_stamp is left stale on purpose: the next _load_index reads
+        # these lines back (harmlessly) along with any other process's
+    
+    def _index_slot(self, slot: int, metadata: Optional[SaveMetadata]):
+        """Record (or with None, forget) a slot's metadata in the index"""
+        with self._index_lock:
+            self._load_index()
+            if metadata is None:
+                if str(slot) not in self._index:
+                    return
+                self._set_entry(str(slot), None)
+            else:
+                self._set_entry(str(slot), {
+                    'stamp': self._file_stamp(self._get_save_path(slot)),
+                    'metadata': metadata.to_dict(),
+                })
+            self._flush_index()
+    
+    def _write_atomic(self, path: Path, payload: bytes, durability: str):
+        """
+        Replace ``path`` with ``payload`` so readers see the old or the new
+        file, never a truncated one
+        """
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                if durability == self.DURABILITY_STRICT:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        if durability == self.DURABILITY_STRICT:
+            self._fsync_directory(path.parent)
+        elif durability == self.DURABILITY_BATCHED:
+            with self._sync_lock:
+                if path not in self._unsynced:
+                    self._unsynced.append(path)
+                due = time.monotonic() - self._last_sync >= self.batch_interval
+            if due:
+                self.sync()
+    
+    def _fsync_directory(self, directory: Path):
+        """Make a rename in ``directory`` durable (not supported everywhere)"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def sync(self):
+        """Force saves written in batched mode to disk"""
+        with self._sync_lock:
+            unsynced, self._unsynced = self._unsynced, []
+            self._last_sync = time.monotonic()
+        for path in unsynced:
+            try:
+                with open(path, 'rb') as f:
+                    os.fsync(f.fileno())
+            except OSError:
+                pass
+        if unsynced:
+            self._fsync_directory(self.save_dir)
     
     def save_game(self, slot: int, game_state: Dict[str, Any], 
-                  save_name: Optional[str] = None) -> bool:
+                  save_name: Optional[str] = None,
+                  durability: Optional[str] = None) -> bool:
         """
         Save game state to a slot
         
@@ -65,37 +513,14 @@ class SaveManager:
             slot: Save slot number (0 for autosave)
             game_state: Dictionary containing game state
             save_name: Optional custom name for the save
+            durability: Durability mode for this write (defaults to
+                autosave_durability for the autosave slot, durability otherwise)
         
         Returns:
             True if save successful, False otherwise
         """
         try:
-            # Generate save name if not provided
-            if save_name is None:
-                if slot == self.AUTOSAVE_SLOT:
-                    save_name = "Autosave"
-                else:
-                    save_name = f"Save {slot}"
-            
-            # Create metadata
-            current_scene = game_state.get('current_scene', 'unknown')
-            scene_description = self._get_scene_description(
-                current_scene, 
-                game_state.get('story_title', 'Unknown Story')
-            )
-            
-            metadata = SaveMetadata(
-                slot=slot,
-                save_name=save_name,
-                timestamp=datetime.now().isoformat(),
-                game_version=self.GAME_VERSION,
-                current_scene=current_scene,
-                scene_description=scene_description,
-                playtime=game_state.get('playtime', 0.0),
-                completion_percentage=self._calculate_completion(game_state),
-                visited_scenes_count=len(game_state.get('visited_scenes', [])),
-                total_choices_made=len(game_state.get('choice_history', []))
-            )
+            metadata = self._build_metadata(slot, game_state, save_name)
             
             # Prepare save data
             save_data = {
@@ -103,17 +528,137 @@ class SaveManager:
                 'game_state': game_state
             }
             
-            # Write to file
-            save_path = self._get_save_path(slot)
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            if durability is None:
+                if slot == self.AUTOSAVE_SLOT:
+                    durability = self.autosave_durability
+                else:
+                    durability = self.durability
             
+            # Serialize fully before touching the disk, then swap the file in
+            self._replace_save(slot, self._encode(save_data), durability)
+            self._discard_journal(slot)
+            self._index_slot(slot, metadata)
+            if self.journal:
+                self._journals[slot] = _JournalTail(
+                    base_stamp=self._file_stamp(self._get_save_path(slot)),
+                    metadata=metadata,
+                    story_title=game_state.get('story_title', 'Unknown Story'),
+                    total_scenes=game_state.get('total_scenes', 1),
+                )
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+    
+    def append_journal(self, slot: int, deltas: List[tuple],
+                       build_state: Callable[[], Dict[str, Any]],
+                       save_name: Optional[str] = None,
+                       durability: Optional[str] = None) -> bool:
+        """
+        Save incrementally by appending GameState journal deltas to a slot
+        
+        Falls back to a full save_game(slot, build_state()) when journaling
+        is off, the deltas start with a reset, no base save from this
+        manager exists yet, or the journal is due for compaction.
+        
+        Args:
+            slot: Save slot number (0 for autosave)
+            deltas: Deltas from GameState.drain_journal()
+            build_state: Builds the full game state, for rewrites
+            save_name: Optional custom name for the save
+            durability: Durability mode for this write
+        
+        Returns:
+            True if save successful, False otherwise
+        """
+        tail = self._journals.get(slot)
+        if (not self.journal or tail is None
+                or tail.entries >= self.journal_compact_every
+                or any(delta[0] == "reset" for delta in deltas)
+                or self._file_stamp(self._get_save_path(slot)) != tail.base_stamp):
+            # Forget the tail first: if this full save fails, appending the
+            # next deltas onto the old base would silently drop these ones
+            self._journals.pop(slot, None)
+            return self.save_game(slot, build_state(), save_name, durability)
+        
+        try:
+            metadata = tail.metadata
+            for delta in deltas:
+                if delta[0] == "visit":
+                    metadata.current_scene = delta[1]
+                    metadata.visited_scenes_count += delta[2]
+                elif delta[0] == "choice":
+                    metadata.total_choices_made += 1
+                elif delta[0] == "playtime":
+                    metadata.playtime = delta[1]
+            metadata.scene_description = self._get_scene_description(
+                metadata.current_scene, tail.story_title)
+            metadata.completion_percentage = self._calculate_completion(
+                {'visited_scenes': range(metadata.visited_scenes_count),
+                 'total_scenes': tail.total_scenes})
+            metadata.timestamp = datetime.now().isoformat()
+            if save_name is not None:
+                metadata.save_name = save_name
+            
+            if durability is None:
+                durability = self.autosave_durability if slot == self.AUTOSAVE_SLOT else self.durability
+            
+            # One JSON line per append; the first line names the base it extends
+            journal_path = self._get_journal_path(slot)
+            with open(journal_path, 'ab') as f:
+                if f.tell() == 0:
+                    f.write(_compact_json({'base': tail.base_stamp}) + b"\n")
+                f.write(_compact_json(deltas) + b"\n")
+                f.flush()
+                if durability == self.DURABILITY_STRICT:
+                    os.fsync(f.fileno())
+            if durability == self.DURABILITY_BATCHED:
+                with self._sync_lock:
+                    if journal_path not in self._unsynced:
+                        self._unsynced.append(journal_path)
+            
+            tail.entries += 1
+            self._index_slot(slot, metadata)
             return True
             
         except Exception as e:
+            # The deltas are gone, so the next save has to be a full one
+            self._journals.pop(slot, None)
             print(f"Error saving game: {e}")
             return False
     
+    def _replay_journal(self, slot: int, save_path: Path, game_state: Dict[str, Any]):
+        """Apply a slot's journal, if it extends this exact base save"""
+        try:
+            with open(self._get_journal_path(slot), 'rb') as f:
+                lines = f.read().split(b"\n")
+        except FileNotFoundError:
+            return
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return
+        if header.get('base') != self._file_stamp(save_path):
+            return  # Left over from an older base save
+        for line in lines[1:]:
+            try:
+                deltas = json.loads(line)
+            except ValueError:
+                break  # Torn final append from a crash
+            apply_journal(game_state, deltas)
+    
+    def compact_journal(self, slot: int) -> bool:
+        """Fold a slot's journal back into its base save"""
+        if not self._get_journal_path(slot).exists():
+            return True
+        metadata = self.get_save_metadata(slot)
+        game_state = self.load_game(slot)
+        if game_state is None:
+            return False
+        return self.save_game(slot, game_state, metadata.save_name if metadata else None)
+    
     def load_game(self, slot: int) -> Optional[Dict[str, Any]]:
         """
         Load game state from a slot
@@ -130,14 +675,15 @@ class SaveManager:
             if not save_path.exists():
                 return None
             
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = decode_save(save_path.read_bytes())
             
             # Validate save data
             if not self._validate_save_data(save_data):
                 print(f"Warning: Save file in slot {slot} appears corrupted")
                 return None
             
+            self._replay_journal(slot, save_path, save_data['game_state'])
+            
             # Check version compatibility
             metadata = SaveMetadata.from_dict(save_data['metadata'])
             if not self._is_compatible_version(metadata.game_version):
@@ -146,109 +692,178 @@ class SaveManager:
             
             return save_data['game_state']
             
-        except json.JSONDecodeError:
+        except SaveFormatError:
             print(f"Error: Save file in slot {slot} is corrupted")
             return None
         except Exception as e:
             print(f"Error loading game: {e}")
             return None
     
-    def get_save_metadata(self, slot: int) -> Optional[SaveMetadata]:
-        """Get metadata for a save slot without loading the full save"""
+    def _read_save_metadata(self, slot: int) -> Optional[SaveMetadata]:
+        """Parse a save file for its metadata"""
         try:
-            save_path = self._get_save_path(slot)
-            
-            if not save_path.exists():
-                return None
-            
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
-            return SaveMetadata.from_dict(save_data['metadata'])
-            
+            return SaveMetadata.from_dict(read_save_metadata(self._get_save_path(slot)))
         except Exception:
             return None
     
+    def _lookup_metadata(self, slot: int) -> Tuple[Optional[SaveMetadata], bool]:
+        """
+        Metadata for a slot from the index, falling back to the save file
+        when the entry is missing or the file changed behind our back.
+        Returns (metadata, index_changed); the caller stores the index.
+        """
+        key = str(slot)
+        stamp = self._file_stamp(self._get_save_path(slot))
+        entry = self._index.get(key)
+        if stamp is None:
+            if entry is None:
+                return None, False
+            self._set_entry(key, None)
+            return None, True
+        if entry is not None and entry.get('stamp') == stamp:
+            try:
+                return SaveMetadata.from_dict(entry['metadata']), False
+            except (KeyError, TypeError):
+                pass
+        metadata = self._read_save_metadata(slot)
+        if metadata is None:
+            if entry is None:
+                return None, False
+            self._set_entry(key, None)
+            return None, True
+        self._set_entry(key, {'stamp': stamp, 'metadata': metadata.to_dict()})
+        return metadata, True
+    
+    def get_save_metadata(self, slot: int) -> Optional[SaveMetadata]:
+        """Get metadata for a save slot without loading the full save"""
+        with self._index_lock:
+            self._load_index()
+            metadata, changed = self._lookup_metadata(slot)
+            if changed:
+                self._flush_index()
+            return metadata
+    
     def list_saves(self) -> List[Optional[SaveMetadata]]:
         """List all available saves"""
-        saves = []
-        for slot in range(self.MAX_SAVE_SLOTS):
-            metadata = self.get_save_metadata(slot)
-            saves.append(metadata)
-        return saves
+        with self._index_lock:
+            self._load_index()
+            saves = []
+            dirty = False
+            for slot in range(self.MAX_SAVE_SLOTS):
+                metadata, changed = self._lookup_metadata(slot)
+                saves.append(metadata)
+                dirty = dirty or changed
+            if dirty:
+                self._flush_index()
+            return saves
     
     def delete_save(self, slot: int) -> bool:
         """Delete a save slot"""
         try:
-            save_path = self._get_save_path(slot)
-            if save_path.exists():
-                save_path.unlink()
-                return True
-            return False
+            deleted = False
+            for save_format in self.FORMAT_EXTENSIONS:
+                save_path = self._get_save_path(slot, save_format)
+                if save_path.exists():
+                    save_path.unlink()
+                    deleted = True
+            self._discard_journal(slot)
+            if deleted:
+                self._index_slot(slot, None)
+            return deleted
         except Exception as e:
             print(f"Error deleting save: {e}")
             return False
     
-    def get_last_save_slot(self) -> Optional[int]:
-        """Get the most recent save slot (excluding autosave)"""
-        latest_slot = None
-        latest_time = None
-        
-        for slot in range(1, self.MAX_SAVE_SLOTS):
-            metadata = self.get_save_metadata(slot)
-            if metadata:
-                timestamp = datetime.fromisoformat(metadata.timestamp)
-                if latest_time is None or timestamp > latest_time:
-                    latest_time = timestamp
-                    latest_slot = slot
-        
-        return latest_slot
+    def _ordered_slots(self, sort_by: str, descending: bool,
+                       include_autosave: bool) -> Iterator[int]:
+        """Indexed slots in order (index lock held, index loaded)"""
+        order = self._order(sort_by)
+        for _, slot in (reversed(order) if descending else order):
+            if include_autosave or slot != self.AUTOSAVE_SLOT:
+                yield slot
     
-    def has_autosave(self) -> bool:
-        """Check if an autosave exists"""
-        return self._get_save_path(self.AUTOSAVE_SLOT).exists()
+    def count_saves(self, include_autosave: bool = True) -> int:
+        """Number of saves in this profile"""
+        with self._index_lock:
+            self._load_index()
+            count = len(self._index)
+            if not include_autosave and str(self.AUTOSAVE_SLOT) in self._index:
+                count -= 1
+            return count
     
-    def _validate_save_data(self, save_data: Dict) -> bool:
-        """Validate save data structure"""
-        required_keys = ['metadata', 'game_state']
-        if not all(key in save_data for key in required_keys):
-            return False
-        
-        required_metadata = ['slot', 'timestamp', 'game_version', 'current_scene']
-        if not all(key in save_data['metadata'] for key in required_metadata):
-            return False
-        
-        required_game_state = ['current_scene', 'visited_scenes', 'flags']
-        if not all(key in save_data['game_state'] for key in required_game_state):
-            return False
+    def list_page(self, offset: int = 0, limit: int = 10, sort_by: str = SORT_TIMESTAMP,
+                  descending: bool = True, include_autosave: bool = True) -> SavePage:
+        """
+        One page of this profile's saves in the given order
         
-        return True
+        Only the saves on the page are checked against their files; a
+        save found changed or gone is re-indexed and the page rebuilt.
+        """
+        with self._index_lock:
+            self._load_index()
+            while True:
+                slots = list(islice(self._ordered_slots(sort_by, descending, include_autosave),
+                                    offset, offset + limit))
+                saves = []
+                changed = False
+                for slot in slots:
+                    metadata, slot_changed = self._lookup_metadata(slot)
+                    changed = changed or slot_changed
+                    saves.append(metadata)
+                if not changed:
+                    break
+                self._flush_index()
+            total = len(self._index)
+            if not include_autosave and str(self.AUTOSAVE_SLOT) in self._index:
+                total -= 1
+            return SavePage(saves=saves, offset=offset, limit=limit, total=total)
     
-    def _is_compatible_version(self, saved_version: str) -> bool:
-        """Check if saved version is compatible with current version"""
-        # For now, just check major version
+    def get_last_save_slot(self) -> Optional[int]:
+        """Get the most recent save slot (excluding autosave)"""
+        with self._index_lock:
+            self._load_index()
+            while True:
+                slot = next(self._ordered_slots(SORT_TIMESTAMP, True, False), None)
+                if slot is None:
+                    return None
+                metadata, changed = self._lookup_metadata(slot)
+                if not changed:
+                    return slot
+                self._flush_index()
+    
+    def next_free_slot(self) -> int:
+        """Lowest manual slot number with no save in it"""
+        with self._index_lock:
+            self._load_index()
+            used = {int(key) for key in self._index}
+        slot = 1
+        while slot in used or self._get_save_path(slot).exists():
+            slot += 1
+        return slot
+    
+    def list_profiles(self) -> List[str]:
+        """The default profile plus every profile directory under the save root"""
+        profiles_dir = self.root_dir / self.PROFILES_DIR
         try:
-            saved_major = int(saved_version.split('.')[0])
-            current_major = int(self.GAME_VERSION.split('.')[0])
-            return saved_major == current_major
-        except (ValueError, IndexError):
-            return False
+            names = sorted(entry.name for entry in os.scandir(profiles_dir)
+                           if entry.is_dir() and PROFILE_NAME.fullmatch(entry.name))
+        except OSError:
+            names = []
+        return [DEFAULT_PROFILE] + [name for name in names if name != DEFAULT_PROFILE]
     
-    def _get_scene_description(self, scene_id: str, story_title: str) -> str:
-        """Generate a human-readable scene description"""
-        # Format scene ID for display
-        scene_name = scene_id.replace('_', ' ').title()
-        return f"{story_title} - {scene_name}"
+    def for_profile(self, profile: str) -> "SaveManager":
+        """A save manager with the same settings for another profile"""
+        return SaveManager(
+            self.root_dir, profile=profile,
+            durability=self.durability, autosave_durability=self.autosave_durability,
+            batch_interval=self.batch_interval, save_format=self.save_format,
+            compression=self.compression, journal=self.journal,
+            journal_compact_every=self.journal_compact_every,
+        )
     
-    def _calculate_completion(self, game_state: Dict) -> float:
-        """Calculate completion percentage"""
-        visited = len(game_state.get('visited_scenes', []))
-        total = game_state.get('total_scenes', 1)
-        
-        if total == 0:
-            return 0.0
-        
-        return min(100.0, (visited / total) * 100.0)
+    def has_autosave(self) -> bool:
+        """Check if an autosave exists"""
+        return self._get_save_path(self.AUTOSAVE_SLOT).exists()
     
     def export_save(self, slot: int, export_path: Path) -> bool:
         """Export a save to a specific path (for backup/sharing)"""
@@ -256,6 +871,10 @@ class SaveManager:
             save_path = self._get_save_path(slot)
             if not save_path.exists():
                 return False
+            # The exported file has to stand on its own
+            if not self.compact_journal(slot):
+                return False
+            save_path = self._get_save_path(slot)
             
             import shutil
             shutil.copy2(save_path, export_path)
@@ -271,17 +890,16 @@ class SaveManager:
                 return False
             
             # Validate the import file
-            with open(import_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = decode_save(Path(import_path).read_bytes())
             
             if not self._validate_save_data(save_data):
                 print("Error: Invalid save file format")
                 return False
             
-            # Copy to save directory
-            save_path = self._get_save_path(slot)
-            import shutil
-            shutil.copy2(import_path, save_path)
+            # Store in the save directory, in this manager's format
+            self._replace_save(slot, self._encode(save_data), self.durability)
+            self._discard_journal(slot)
+            self._index_slot(slot, SaveMetadata.from_dict(save_data['metadata']))
             return True
             
         except Exception as e:
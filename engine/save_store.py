@@ -0,0 +1,257 @@
+"""Storage interface shared by the save backends"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_PROFILE = "default"
+PROFILE_NAME = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+# Orders for paged listings; ties are broken by timestamp
+SORT_TIMESTAMP = "timestamp"
+SORT_STORY = "story"
+SORT_COMPLETION = "completion"
+SORT_ORDERS = (SORT_TIMESTAMP, SORT_STORY, SORT_COMPLETION)
+
+
+def validate_profile(profile: Optional[str]) -> str:
+    """Normalize a profile name, rejecting anything unsafe as a path or key"""
+    if profile is None:
+        return DEFAULT_PROFILE
+    if not PROFILE_NAME.fullmatch(profile):
+        raise ValueError(f"Invalid profile name: {profile!r}")
+    return profile
+
+
+def open_save_store(backend: str = "files", profile: Optional[str] = None,
+                    journal: bool = True) -> "SaveStore":
+    """
+    The default store of a backend: "files" for a SaveManager in the save
+    directory, "sqlite" for a SqliteSaveStore in the save database
+    """
+    if backend == "files":
+        from .save_manager import SaveManager
+        return SaveManager(profile=profile, journal=journal)
+    if backend == "sqlite":
+        from .sqlite_store import SqliteSaveStore
+        return SqliteSaveStore(profile=profile)
+    raise ValueError(f"Unknown save backend: {backend!r}")
+
+
+def sort_key(sort_by: str, metadata) -> tuple:
+    """Sort key of a save's metadata for one of the SORT_* orders"""
+    if sort_by == SORT_TIMESTAMP:
+        return (metadata.timestamp,)
+    if sort_by == SORT_STORY:
+        return (metadata.story_title or metadata.scene_description, metadata.timestamp)
+    if sort_by == SORT_COMPLETION:
+        return (metadata.completion_percentage, metadata.timestamp)
+    raise ValueError(f"Unknown sort order: {sort_by!r}")
+
+
+@dataclass
+class SaveMetadata:
+    """Metadata for a save file"""
+    slot: int
+    save_name: str
+    timestamp: str
+    game_version: str
+    current_scene: str
+    scene_description: str
+    playtime: float
+    completion_percentage: float
+    visited_scenes_count: int
+    total_choices_made: int
+    story_title: str = ""
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        return asdict(self)
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'SaveMetadata':
+        """Create from dictionary"""
+        return SaveMetadata(**data)
+
+
+@dataclass
+class SavePage:
+    """One page of a save listing"""
+    saves: List[SaveMetadata]  # In the requested order
+    offset: int
+    limit: int
+    total: int        # Saves in the whole listing
+
+    @property
+    def page_number(self) -> int:
+        return self.offset // self.limit + 1 if self.limit else 1
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.limit)) if self.limit else 1
+
+    @property
+    def has_previous(self) -> bool:
+        return self.offset > 0
+
+    @property
+    def has_next(self) -> bool:
+        return self.offset + len(self.saves) < self.total
+
+
+class SaveStore(ABC):
+    """
+    Where a player's saves live.
+
+    A store holds the saves of one profile in numbered slots (slot 0 is
+    the autosave, manual slots are unlimited). Besides the slot-level
+    calls it offers sorted, paged listings and the latest save for
+    menus that must stay fast with thousands of saves.
+    """
+
+    GAME_VERSION = "1.0.0"
+    AUTOSAVE_SLOT = 0
+    MAX_SAVE_SLOTS = 10  # Slots shown by list_saves() and the in-game menu
+    journal = False      # Whether append_journal writes deltas
+
+    profile: str = DEFAULT_PROFILE
+
+    @abstractmethod
+    def save_game(self, slot: int, game_state: Dict[str, Any],
+                  save_name: Optional[str] = None,
+                  durability: Optional[str] = None) -> bool:
+        """Save game state to a slot; False on failure"""
+
+    @abstractmethod
+    def load_game(self, slot: int) -> Optional[Dict[str, Any]]:
+        """Game state stored in a slot, or None"""
+
+    @abstractmethod
+    def get_save_metadata(self, slot: int) -> Optional[SaveMetadata]:
+        """Metadata for a slot, or None"""
+
+    @abstractmethod
+    def delete_save(self, slot: int) -> bool:
+        """Delete a slot; False if it held nothing"""
+
+    @abstractmethod
+    def list_page(self, offset: int = 0, limit: int = 10, sort_by: str = SORT_TIMESTAMP,
+                  descending: bool = True, include_autosave: bool = True) -> SavePage:
+        """One page of this profile's saves in the given order"""
+
+    @abstractmethod
+    def count_saves(self, include_autosave: bool = True) -> int:
+        """Number of saves in this profile"""
+
+    @abstractmethod
+    def get_last_save_slot(self) -> Optional[int]:
+        """Most recent manual save slot (excluding autosave)"""
+
+    @abstractmethod
+    def list_profiles(self) -> List[str]:
+        """Profiles with a place in this store"""
+
+    @abstractmethod
+    def for_profile(self, profile: str) -> "SaveStore":
+        """A store with the same settings for another profile"""
+
+    def list_saves(self) -> List[Optional[SaveMetadata]]:
+        """Metadata for slots 0 .. MAX_SAVE_SLOTS-1 (None where empty)"""
+        return [self.get_save_metadata(slot) for slot in range(self.MAX_SAVE_SLOTS)]
+
+    def has_autosave(self) -> bool:
+        """Check if an autosave exists"""
+        return self.get_save_metadata(self.AUTOSAVE_SLOT) is not None
+
+    def next_free_slot(self) -> int:
+        """Lowest manual slot number with no save in it"""
+        slot = 1
+        while self.get_save_metadata(slot) is not None:
+            slot += 1
+        return slot
+
+    def append_journal(self, slot: int, deltas: List[tuple],
+                       build_state: Callable[[], Dict[str, Any]],
+                       save_name: Optional[str] = None,
+                       durability: Optional[str] = None) -> bool:
+        """Incremental save; stores without a journal save the full state"""
+        return self.save_game(slot, build_state(), save_name, durability)
+
+    def sync(self):
+        """Force buffered writes to durable storage"""
+
+    def _build_metadata(self, slot: int, game_state: Dict[str, Any],
+                        save_name: Optional[str] = None) -> SaveMetadata:
+        """Metadata for saving game_state to a slot now"""
+        # Generate save name if not provided
+        if save_name is None:
+            if slot == self.AUTOSAVE_SLOT:
+                save_name = "Autosave"
+            else:
+                save_name = f"Save {slot}"
+        
+        current_scene = game_state.get('current_scene', 'unknown')
+        scene_description = self._get_scene_description(
+            current_scene, 
+            game_state.get('story_title', 'Unknown Story')
+        )
+        
+        return SaveMetadata(
+            slot=slot,
+            save_name=save_name,
+            timestamp=datetime.now().isoformat(),
+            game_version=self.GAME_VERSION,
+            current_scene=current_scene,
+            scene_description=scene_description,
+            playtime=game_state.get('playtime', 0.0),
+            completion_percentage=self._calculate_completion(game_state),
+            visited_scenes_count=len(game_state.get('visited_scenes', [])),
+            total_choices_made=game_state.get(
+                'choices_made', len(game_state.get('choice_history', []))),
+            story_title=game_state.get('story_title', '')
+        )
+    
+    def _validate_save_data(self, save_data: Dict) -> bool:
+        """Validate save data structure"""
+        required_keys = ['metadata', 'game_state']
+        if not all(key in save_data for key in required_keys):
+            return False
+        
+        required_metadata = ['slot', 'timestamp', 'game_version', 'current_scene']
+        if not all(key in save_data['metadata'] for key in required_metadata):
+            return False
+        
+        required_game_state = ['current_scene', 'visited_scenes', 'flags']
+        if not all(key in save_data['game_state'] for key in required_game_state):
+            return False
+        
+        return True
+    
+    def _is_compatible_version(self, saved_version: str) -> bool:
+        """Check if saved version is compatible with current version"""
+        # For now, just check major version
+        try:
+            saved_major = int(saved_version.split('.')[0])
+            current_major = int(self.GAME_VERSION.split('.')[0])
+            return saved_major == current_major
+        except (ValueError, IndexError):
+            return False
+    
+    def _get_scene_description(self, scene_id: str, story_title: str) -> str:
+        """Generate a human-readable scene description"""
+        # Format scene ID for display
+        scene_name = scene_id.replace('_', ' ').title()
+        return f"{story_title} - {scene_name}"
+    
+    def _calculate_completion(self, game_state: Dict) -> float:
+        """Calculate completion percentage"""
+        visited = len(game_state.get('visited_scenes', []))
+        total = game_state.get('total_scenes', 1)
+        
+        if total == 0:
+            return 0.0
+        
+        return min(100.0, (visited / total) * 100.0)
@@ -2,8 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import warnings
 from dataclasses import dataclass, field
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
+
+from .save_store import DEFAULT_PROFILE, validate_profile
+
+
+def _profile_from_environment() -> str:
+    """TERMINAL_THEATRE_PROFILE if it is a valid profile name, else the default"""
+    profile = os.environ.get("TERMINAL_THEATRE_PROFILE", DEFAULT_PROFILE)
+    try:
+        return validate_profile(profile)
+    except ValueError as error:
+        warnings.warn(f"{error} in TERMINAL_THEATRE_PROFILE; using {DEFAULT_PROFILE!r}",
+                      RuntimeWarning)
+        return DEFAULT_PROFILE
 
 
 @dataclass
@@ -15,6 +30,15 @@ class GameSettings:
     cinematics_enabled: bool = True
     sound_enabled: bool = False
     typewriter_enabled: bool = True
+    # Any key while a scene plays out shows the rest of it at once
+    skip_enabled: bool = True
+    # Save profile, so several players can share one machine
+    save_profile: str = field(default_factory=_profile_from_environment)
+    # Save backend: "files" (a directory of save files) or "sqlite" (one database)
+    save_backend: str = field(
+        default_factory=lambda: os.environ.get("TERMINAL_THEATRE_SAVE_BACKEND", "files"))
+    # Recent choices kept in memory (older ones spill to disk); None keeps all
+    history_window: Optional[int] = None
 
     _speed_presets: Dict[str, float] = field(default_factory=lambda: {
         "Relaxed": 1.35,
@@ -70,3 +94,8 @@ class GameSettings:
         elif self.text_speed == "Instant":
             self.text_speed = "Normal"
         return self.typewriter_enabled
+
+    def toggle_skip(self) -> bool:
+        """Enable or disable skipping ahead with any key."""
+        self.skip_enabled = not self.skip_enabled
+        return self.skip_enabled
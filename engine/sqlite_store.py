@@ -0,0 +1,436 @@
+"""SQLite save backend: every profile's saves in one WAL-mode database
+
+Metadata lives in indexed columns of the ``saves`` table, so the load
+menu's sorted, paged listings are index range scans; the game state
+blobs live in ``states`` and are only read by ``load_game``. Each save is
+one transaction, readers on other threads (or processes) keep working
+while the autosave worker writes, and ``backup`` copies a consistent
+snapshot of the whole database.
+
+Migrate an existing save directory with::
+
+    python -m engine.sqlite_store ~/.terminal_theatre/saves saves.db
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .save_manager import SAVE_COMPRESSORS, SaveFormatError, SaveManager, _compact_json
+from .save_store import (DEFAULT_PROFILE, SORT_COMPLETION, SORT_STORY, SORT_TIMESTAMP,
+                         SaveMetadata, SavePage, SaveStore, validate_profile)
+
+
+SCHEMA_VERSION = 1
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS saves (
+        profile TEXT NOT NULL,
+        slot INTEGER NOT NULL,
+        save_name TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        game_version TEXT NOT NULL,
+        current_scene TEXT NOT NULL,
+        scene_description TEXT NOT NULL,
+        playtime REAL NOT NULL,
+        completion_percentage REAL NOT NULL,
+        visited_scenes_count INTEGER NOT NULL,
+        total_choices_made INTEGER NOT NULL,
+        story_title TEXT NOT NULL,
+        story_key TEXT NOT NULL,  -- story_title or scene_description, for SORT_STORY
+        PRIMARY KEY (profile, slot)
+    )""",
+    "CREATE INDEX IF NOT EXISTS saves_by_timestamp ON saves (profile, timestamp, slot)",
+    "CREATE INDEX IF NOT EXISTS saves_by_story ON saves (profile, story_key, timestamp, slot)",
+    """CREATE INDEX IF NOT EXISTS saves_by_completion
+        ON saves (profile, completion_percentage, timestamp, slot)""",
+    """CREATE TABLE IF NOT EXISTS states (
+        profile TEXT NOT NULL,
+        slot INTEGER NOT NULL,
+        compression INTEGER NOT NULL,  -- Compression id from SAVE_COMPRESSORS
+        data BLOB NOT NULL,
+        PRIMARY KEY (profile, slot)
+    )""",
+    # Save counts per profile, kept by triggers so listings need no COUNT(*)
+    """CREATE TABLE IF NOT EXISTS profiles (
+        profile TEXT PRIMARY KEY,
+        saves INTEGER NOT NULL
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS count_insert AFTER INSERT ON saves BEGIN
+        INSERT INTO profiles (profile, saves) VALUES (NEW.profile, 1)
+            ON CONFLICT (profile) DO UPDATE SET saves = saves + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS count_delete AFTER DELETE ON saves BEGIN
+        UPDATE profiles SET saves = saves - 1 WHERE profile = OLD.profile;
+    END""",
+)
+
+METADATA_COLUMNS = ", ".join(field.name for field in fields(SaveMetadata))
+SORT_COLUMNS = {
+    SORT_TIMESTAMP: "timestamp",
+    SORT_STORY: "story_key",
+    SORT_COMPLETION: "completion_percentage",
+}
+
+# Durability mode -> PRAGMA synchronous. In WAL mode NORMAL syncs the log
+# at checkpoints only, which is the batched mode of the file backend.
+SYNCHRONOUS = {
+    SaveManager.DURABILITY_STRICT: "FULL",
+    SaveManager.DURABILITY_BATCHED: "NORMAL",
+    SaveManager.DURABILITY_NONE: "OFF",
+}
+
+_DECOMPRESSORS = {ident: decompress for ident, _, decompress in SAVE_COMPRESSORS.values()}
+
+
+class SqliteSaveStore(SaveStore):
+    """
+    Saves in an SQLite database
+
+    Each thread gets its own connection, so the autosave worker's writes
+    never block a menu reading metadata on the main thread. Stores for
+    different profiles can share one database file.
+    """
+
+    DEFAULT_DATABASE = SaveManager.DEFAULT_SAVE_DIR.parent / "saves.db"
+    BUSY_TIMEOUT = 30.0  # Seconds to wait for another writer's lock
+
+    def __init__(self, path: Optional[Path] = None, profile: Optional[str] = None,
+                 durability: str = SaveManager.DURABILITY_STRICT,
+                 autosave_durability: str = SaveManager.DURABILITY_BATCHED,
+                 compression: Optional[str] = "zlib"):
+        """
+        Open (creating if needed) a save database
+
+        Args:
+            path: Database file (defaults to ~/.terminal_theatre/saves.db)
+            profile: Profile whose saves this store reads and writes
+            durability: Durability of manual saves (see SaveManager)
+            autosave_durability: Durability of autosaves
+            compression: Compression of state blobs (None, "zlib" or "lzma")
+        """
+        for mode in (durability, autosave_durability):
+            if mode not in SYNCHRONOUS:
+                raise ValueError(f"Unknown durability mode: {mode!r}")
+        if compression not in SAVE_COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression!r}")
+        self.path = Path(path) if path else self.DEFAULT_DATABASE
+        self.profile = validate_profile(profile)
+        self.durability = durability
+        self.autosave_durability = autosave_durability
+        self.compression = compression
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise SaveFormatError(f"{self.path} has schema version {version}, "
+                                  f"newer than {SCHEMA_VERSION}")
+        if version < SCHEMA_VERSION:
+            with self._transaction(connection):
+                for statement in SCHEMA:
+                    connection.execute(statement)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection to the database"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit mode: transactions are opened explicitly below
+            connection = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT,
+                                         isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection):
+        """A write transaction, taking the write lock up front"""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def close(self):
+        """Close every thread's connection"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _durability(self, slot: int, durability: Optional[str]) -> str:
+        if durability is None:
+            if slot == self.AUTOSAVE_SLOT:
+                return self.autosave_durability
+            return self.durability
+        if durability not in SYNCHRONOUS:
+            raise ValueError(f"Unknown durability mode: {durability!r}")
+        return durability
+
+    def _put(self, connection: sqlite3.Connection, metadata: SaveMetadata,
+             game_state: Dict[str, Any]):
+        """Store one save (inside a transaction)"""
+        ident, compress, _ = SAVE_COMPRESSORS[self.compression]
+        blob = compress(_compact_json(game_state))
+        values = metadata.to_dict()
+        updates = ", ".join(f"{column} = excluded.{column}" for column in values)
+        # An upsert, not INSERT OR REPLACE: replacing would skip the delete trigger
+        connection.execute(
+            f"INSERT INTO saves (profile, {METADATA_COLUMNS}, story_key) "
+            f"VALUES (?, {', '.join('?' * len(values))}, ?) "
+            f"ON CONFLICT (profile, slot) DO UPDATE SET {updates}, story_key = excluded.story_key",
+            (self.profile, *values.values(),
+             metadata.story_title or metadata.scene_description),
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO states (profile, slot, compression, data) VALUES (?, ?, ?, ?)",
+            (self.profile, metadata.slot, ident, blob),
+        )
+
+    def save_game(self, slot: int, game_state: Dict[str, Any],
+                  save_name: Optional[str] = None,
+                  durability: Optional[str] = None) -> bool:
+        """
+        Save game state to a slot
+
+        Metadata and state are written in one transaction, so a reader
+        never sees one without the other.
+        """
+        try:
+            metadata = self._build_metadata(slot, game_state, save_name)
+            connection = self._connection()
+            connection.execute(
+                f"PRAGMA synchronous = {SYNCHRONOUS[self._durability(slot, durability)]}")
+            with self._transaction(connection):
+                self._put(connection, metadata, game_state)
+            return True
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+
+    def load_game(self, slot: int) -> Optional[Dict[str, Any]]:
+        """Game state stored in a slot, or None"""
+        try:
+            row = self._connection().execute(
+                f"SELECT {METADATA_COLUMNS}, compression, data FROM saves "
+                "JOIN states USING (profile, slot) WHERE profile = ? AND slot = ?",
+                (self.profile, slot),
+            ).fetchone()
+            if row is None:
+                return None
+            metadata = SaveMetadata(*row[:-2])
+            compression, data = row[-2:]
+            if compression not in _DECOMPRESSORS:
+                raise SaveFormatError(f"unknown compression id {compression}")
+            save_data = {
+                'metadata': metadata.to_dict(),
+                'game_state': json.loads(_DECOMPRESSORS[compression](data)),
+            }
+
+            if not self._validate_save_data(save_data):
+                print(f"Warning: Save in slot {slot} appears corrupted")
+                return None
+
+            if not self._is_compatible_version(metadata.game_version):
+                print(f"Warning: Save file was created with version {metadata.game_version}")
+                print(f"Current version is {self.GAME_VERSION}. Some features may not work correctly.")
+
+            return save_data['game_state']
+        except Exception as e:
+            print(f"Error loading game: {e}")
+            return None
+
+    def get_save_metadata(self, slot: int) -> Optional[SaveMetadata]:
+        """Get metadata for a save slot without loading the full save"""
+        row = self._connection().execute(
+            f"SELECT {METADATA_COLUMNS} FROM saves WHERE profile = ? AND slot = ?",
+            (self.profile, slot),
+        ).fetchone()
+        return SaveMetadata(*row) if row else None
+
+    def list_saves(self) -> List[Optional[SaveMetadata]]:
+        """List all available saves"""
+        rows = self._connection().execute(
+            f"SELECT {METADATA_COLUMNS} FROM saves WHERE profile = ? AND slot BETWEEN 0 AND ?",
+            (self.profile, self.MAX_SAVE_SLOTS - 1),
+        ).fetchall()
+        saves: List[Optional[SaveMetadata]] = [None] * self.MAX_SAVE_SLOTS
+        for row in rows:
+            metadata = SaveMetadata(*row)
+            saves[metadata.slot] = metadata
+        return saves
+
+    def delete_save(self, slot: int) -> bool:
+        """Delete a save slot"""
+        try:
+            connection = self._connection()
+            with self._transaction(connection):
+                deleted = connection.execute(
+                    "DELETE FROM saves WHERE profile = ? AND slot = ?", (self.profile, slot)
+                ).rowcount
+                connection.execute(
+                    "DELETE FROM states WHERE profile = ? AND slot = ?", (self.profile, slot))
+            return deleted > 0
+        except Exception as e:
+            print(f"Error deleting save: {e}")
+            return False
+
+    def count_saves(self, include_autosave: bool = True) -> int:
+        """Number of saves in this profile"""
+        row = self._connection().execute(
+            "SELECT saves FROM profiles WHERE profile = ?", (self.profile,)).fetchone()
+        count = row[0] if row else 0
+        if not include_autosave and self.has_autosave():
+            count -= 1
+        return count
+
+    def list_page(self, offset: int = 0, limit: int = 10, sort_by: str = SORT_TIMESTAMP,
+                  descending: bool = True, include_autosave: bool = True) -> SavePage:
+        """One page of this profile's saves in the given order"""
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort order: {sort_by!r}")
+        direction = "DESC" if descending else "ASC"
+        query = f"SELECT {METADATA_COLUMNS} FROM saves WHERE profile = ?"
+        if not include_autosave:
+            query += f" AND slot != {self.AUTOSAVE_SLOT}"
+        order = [SORT_COLUMNS[sort_by]] if sort_by != SORT_TIMESTAMP else []
+        query += " ORDER BY " + ", ".join(
+            f"{column} {direction}" for column in order + ["timestamp", "slot"])
+        query += " LIMIT ? OFFSET ?"
+        # One read transaction, so the page and the total agree
+        connection = self._connection()
+        connection.execute("BEGIN")
+        try:
+            rows = connection.execute(query, (self.profile, limit, offset)).fetchall()
+            total = self.count_saves(include_autosave)
+        finally:
+            connection.execute("COMMIT")
+        return SavePage(saves=[SaveMetadata(*row) for row in rows],
+                        offset=offset, limit=limit, total=total)
+
+    def get_last_save_slot(self) -> Optional[int]:
+        """Get the most recent save slot (excluding autosave)"""
+        row = self._connection().execute(
+            "SELECT slot FROM saves WHERE profile = ? AND slot != ? "
+            "ORDER BY timestamp DESC, slot DESC LIMIT 1",
+            (self.profile, self.AUTOSAVE_SLOT),
+        ).fetchone()
+        return row[0] if row else None
+
+    def next_free_slot(self) -> int:
+        """Lowest manual slot number with no save in it"""
+        if self.get_save_metadata(1) is None:
+            return 1
+        # The first used slot whose successor is free
+        return self._connection().execute(
+            "SELECT MIN(slot) + 1 FROM saves AS used WHERE profile = ?1 AND slot >= 1 "
+            "AND NOT EXISTS (SELECT 1 FROM saves WHERE profile = ?1 AND slot = used.slot + 1)",
+            (self.profile,),
+        ).fetchone()[0]
+
+    def has_autosave(self) -> bool:
+        """Check if an autosave exists"""
+        return self.get_save_metadata(self.AUTOSAVE_SLOT) is not None
+
+    def list_profiles(self) -> List[str]:
+        """The default profile plus every profile with saves in the database"""
+        names = [row[0] for row in self._connection().execute(
+            "SELECT profile FROM profiles WHERE saves > 0 ORDER BY profile")]
+        return [DEFAULT_PROFILE] + [name for name in names if name != DEFAULT_PROFILE]
+
+    def for_profile(self, profile: str) -> "SqliteSaveStore":
+        """A store on the same database for another profile"""
+        return SqliteSaveStore(
+            self.path, profile=profile, durability=self.durability,
+            autosave_durability=self.autosave_durability, compression=self.compression,
+        )
+
+    def sync(self):
+        """Checkpoint the write-ahead log into the database file"""
+        self._connection().execute("PRAGMA wal_checkpoint(FULL)")
+
+    def backup(self, backup_path: Path) -> bool:
+        """Copy a consistent snapshot of the whole database to a file"""
+        try:
+            target = sqlite3.connect(backup_path)
+            try:
+                self._connection().backup(target)
+            finally:
+                target.close()
+            return True
+        except Exception as e:
+            print(f"Error backing up saves: {e}")
+            return False
+
+    def import_from(self, source: SaveStore) -> int:
+        """
+        Copy every save of source's profile into this store's profile,
+        keeping names and timestamps; returns the number of saves copied
+        """
+        total = source.count_saves()
+        listing = source.list_page(0, total, sort_by=SORT_TIMESTAMP, descending=False)
+        connection = self._connection()
+        copied = 0
+        with self._transaction(connection):
+            for metadata in listing.saves:
+                game_state = source.load_game(metadata.slot)
+                if game_state is None:
+                    print(f"Skipping unreadable save in slot {metadata.slot}")
+                    continue
+                self._put(connection, metadata, game_state)
+                copied += 1
+        return copied
+
+
+def migrate(source: SaveStore, target: SqliteSaveStore) -> Dict[str, int]:
+    """Copy every profile's saves from source into target; saves per profile"""
+    copied = {}
+    for profile in source.list_profiles():
+        store = target.for_profile(profile)
+        try:
+            copied[profile] = store.import_from(source.for_profile(profile))
+        finally:
+            store.close()
+    return copied
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Migrate a save directory into a save database")
+    parser.add_argument("save_dir", help="Save directory, e.g. ~/.terminal_theatre/saves")
+    parser.add_argument("database", nargs="?", default=str(SqliteSaveStore.DEFAULT_DATABASE),
+                        help="Database file to create or add to")
+    args = parser.parse_args(argv)
+
+    save_dir = Path(args.save_dir).expanduser()
+    if not save_dir.is_dir():
+        print(f"error: {save_dir} is not a directory", file=sys.stderr)
+        return 1
+    target = SqliteSaveStore(Path(args.database).expanduser())
+    try:
+        copied = migrate(SaveManager(save_dir), target)
+        target.sync()
+    finally:
+        target.close()
+    for profile, count in copied.items():
+        print(f"{profile}: {count} saves")
+    print(f"Wrote {args.database}: {sum(copied.values())} saves")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,20 @@
 """Story and scene management system"""
 
-from typing import List, Dict, Callable, Optional, Any
+import copy
+import sys
+import time
+from collections.abc import Mapping, MutableMapping
+from itertools import repeat
+from types import MappingProxyType
+from typing import List, Dict, Callable, Optional, Any, Iterator
 from dataclasses import dataclass
 from .animation import Animation
 from .colors import get_mood_palette
+from .containers import ChoiceHistory, OrderedSet
+from .logic import condition_reads
+
+
+_UNSET = object()
 
 
 @dataclass
@@ -36,22 +47,117 @@ class Scene:
             self.palette = get_mood_palette('noir')
 
 
+# Containers a snapshot may still be sharing with the live state
+SHARED_VISITED = 1
+SHARED_FLAGS = 2
+SHARED_INVENTORY = 4
+SHARED_VARIABLES = 8
+SHARED_ALL = SHARED_VISITED | SHARED_FLAGS | SHARED_INVENTORY | SHARED_VARIABLES
+
+
+class GameStateSnapshot:
+    """
+    Immutable view of a GameState at one moment.
+    
+    Taking a snapshot copies nothing: it shares the state's containers,
+    and the state copies a container the next time it is about to change
+    it (copy-on-write). The choice history is append-only, so a snapshot
+    only remembers its length. Variable values are shared too and must be
+    treated as immutable (replace them with ``set_variable``).
+    """
+    
+    __slots__ = ("current_scene", "visited_scenes", "inventory", "playtime",
+                 "_flags", "_variables", "_history", "history_length")
+    
+    def __init__(self, state: "GameState"):
+        self.current_scene = state.current_scene
+        self.visited_scenes = state.visited_scenes
+        self.inventory = state.inventory
+        self.playtime = state.playtime
+        self._flags = state.flags
+        self._variables = state.variables
+        self._history = state.choice_history
+        self.history_length = len(state.choice_history)
+    
+    @property
+    def flags(self) -> Mapping[str, bool]:
+        return MappingProxyType(self._flags)
+    
+    @property
+    def variables(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._variables)
+    
+    def choices(self) -> List[tuple]:
+        """The choice history up to the snapshot"""
+        return self._history[:self.history_length]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Deep, JSON-ready copy of the snapshot for writing to disk"""
+        return {
+            'current_scene': self.current_scene,
+            'visited_scenes': list(self.visited_scenes),
+            'flags': dict(self._flags),
+            'inventory': list(self.inventory),
+            'variables': copy.deepcopy(self._variables),
+            'choice_history': self.choices(),
+            'choices_made': self.history_length,  # Running count, for save metadata
+            'playtime': self.playtime,
+        }
+
+
 class GameState:
     """Tracks player state throughout the game"""
     
+    __slots__ = ("current_scene", "visited_scenes", "flags", "inventory", "variables",
+                 "choice_history", "playtime", "start_time", "versions", "epoch", "revision",
+                 "_shared", "journal")
+    
     def __init__(self):
         self.current_scene: str = ""
-        self.visited_scenes: List[str] = []
+        self.visited_scenes: OrderedSet = OrderedSet()
         self.flags: Dict[str, bool] = {}
-        self.inventory: List[str] = []
+        self.inventory: OrderedSet = OrderedSet()
         self.variables: Dict[str, any] = {}
-        self.choice_history: List[tuple] = []  # (scene_id, choice_index, choice_text)
+        self.choice_history: ChoiceHistory = ChoiceHistory()  # (scene_id, choice_index, choice_text)
         self.playtime: float = 0.0  # Total playtime in seconds
         self.start_time: float = 0.0  # Used for tracking session time
+        # Write counters per (kind, name) key, plus (kind, None) per kind;
+        # epoch changes whenever the whole state is replaced
+        self.versions: Dict[tuple, int] = {}
+        self.epoch: int = 0
+        self.revision: int = 0  # Total tracked writes
+        self._shared: int = 0  # SHARED_* bits for containers a snapshot references
+        # Deltas since the last drain_journal(), or None when not journaling
+        self.journal: Optional[List[tuple]] = None
+    
+    def _touch(self, kind: str, name: str):
+        """Record a write so cached reads of this key are invalidated"""
+        self.revision += 1
+        versions = self.versions
+        versions[(kind, name)] = versions.get((kind, name), 0) + 1
+        versions[(kind, None)] = versions.get((kind, None), 0) + 1
+    
+    def _unshare(self, container: int):
+        """Copy a container a snapshot still references before changing it"""
+        if container == SHARED_VISITED:
+            self.visited_scenes = self.visited_scenes.copy()
+        elif container == SHARED_FLAGS:
+            self.flags = dict(self.flags)
+        elif container == SHARED_INVENTORY:
+            self.inventory = self.inventory.copy()
+        elif container == SHARED_VARIABLES:
+            self.variables = dict(self.variables)
+        self._shared &= ~container
     
     def set_flag(self, flag: str, value: bool = True):
         """Set a story flag"""
-        self.flags[flag] = value
+        if self.flags.get(flag, _UNSET) != value:
+            if self._shared & SHARED_FLAGS:
+                self._unshare(SHARED_FLAGS)
+            self.flags[flag] = value
+            self._touch("flag", flag)
+            if self.journal is not None:
+                self.journal.append(("flag", flag, value))
     
     def has_flag(self, flag: str) -> bool:
         """Check if a flag is set"""
@@ -60,70 +166,315 @@ class GameState:
     def add_item(self, item: str):
         """Add item to inventory"""
         if item not in self.inventory:
-            self.inventory.append(item)
+            if self._shared & SHARED_INVENTORY:
+                self._unshare(SHARED_INVENTORY)
+            self.inventory.add(item)
+            self._touch("item", item)
+            if self.journal is not None:
+                self.journal.append(("item", item))
     
     def has_item(self, item: str) -> bool:
         """Check if player has an item"""
         return item in self.inventory
     
+    def set_variable(self, name: str, value: Any):
+        """Set a story variable"""
+        if self.variables.get(name, _UNSET) != value:
+            if self._shared & SHARED_VARIABLES:
+                self._unshare(SHARED_VARIABLES)
+            self.variables[name] = value
+            self._touch("var", name)
+            if self.journal is not None:
+                # Deltas are serialized later, possibly on another thread
+                self.journal.append(("var", name, copy.deepcopy(value)))
+    
+    def get_variable(self, name: str, default: Any = None) -> Any:
+        """Get a story variable"""
+        return self.variables.get(name, default)
+    
     def visit_scene(self, scene_id: str):
         """Mark a scene as visited"""
-        if scene_id not in self.visited_scenes:
-            self.visited_scenes.append(scene_id)
+        scene_id = sys.intern(scene_id)
+        first_visit = scene_id not in self.visited_scenes
+        if first_visit:
+            if self._shared & SHARED_VISITED:
+                self._unshare(SHARED_VISITED)
+            self.visited_scenes.add(scene_id)
         self.current_scene = scene_id
+        if self.journal is not None:
+            self.journal.append(("visit", scene_id, first_visit))
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize the game state"""
-        return {
-            "current_scene": self.current_scene,
-            "visited_scenes": list(self.visited_scenes),
-            "flags": dict(self.flags),
-            "inventory": list(self.inventory),
-            "variables": dict(self.variables),
-        }
-    
-    def from_dict(self, data: Dict[str, Any]):
-        """Load the game state from serialized data"""
-        self.current_scene = data.get("current_scene", "")
-        self.visited_scenes = data.get("visited_scenes", []).copy()
-        self.flags = data.get("flags", {}).copy()
-        self.inventory = data.get("inventory", []).copy()
-        self.variables = data.get("variables", {}).copy()
     def record_choice(self, scene_id: str, choice_index: int, choice_text: str):
         """Record a choice made by the player"""
-        self.choice_history.append((scene_id, choice_index, choice_text))
+        self.choice_history.record(scene_id, choice_index, choice_text)
+        if self.journal is not None:
+            self.journal.append(("choice", scene_id, choice_index, choice_text))
     
     def update_playtime(self):
         """Update playtime from start_time"""
-        import time
         if self.start_time > 0:
-            self.playtime += time.time() - self.start_time
-            self.start_time = time.time()
+            now = time.time()
+            self.playtime += now - self.start_time
+            self.start_time = now
+    
+    def limit_history(self, window: Optional[int], spill_dir: Optional[str] = None):
+        """
+        Keep only about ``window`` recent choices in memory (None for all);
+        older ones are spilled to a temp file in ``spill_dir``
+        """
+        self.choice_history = ChoiceHistory(self.choice_history, window=window,
+                                            spill_dir=spill_dir)
     
-    def to_dict(self) -> Dict:
-        """Convert game state to dictionary for saving"""
+    def start_journal(self):
+        """
+        Start recording deltas for incremental saves.
+        
+        The journal opens with a reset marker: whoever drains it first
+        has to write the full state before appending deltas.
+        """
+        self.journal = [("reset",)]
+    
+    def drain_journal(self) -> Optional[List[tuple]]:
+        """Take the deltas recorded so far (None when not journaling)"""
+        if self.journal is None:
+            return None
         self.update_playtime()
-        return {
-            'current_scene': self.current_scene,
-            'visited_scenes': self.visited_scenes,
-            'flags': self.flags,
-            'inventory': self.inventory,
-            'variables': self.variables,
-            'choice_history': self.choice_history,
-            'playtime': self.playtime
-        }
+        deltas = self.journal
+        deltas.append(("playtime", self.playtime))
+        self.journal = []
+        return deltas
+    
+    def snapshot(self) -> GameStateSnapshot:
+        """Take a cheap immutable snapshot (for autosaves and rewind)"""
+        self.update_playtime()
+        self._shared = SHARED_ALL
+        return GameStateSnapshot(self)
+    
+    def restore(self, snapshot: GameStateSnapshot):
+        """Return to a snapshot; playtime keeps counting"""
+        self.current_scene = snapshot.current_scene
+        self.visited_scenes = snapshot.visited_scenes
+        self.flags = snapshot._flags
+        self.inventory = snapshot.inventory
+        self.variables = snapshot._variables
+        self.choice_history = snapshot._history.copy(snapshot.history_length)
+        self._shared = SHARED_ALL
+        self.epoch += 1
+        if self.journal is not None:
+            self.journal = [("reset",)]
     
-    def from_dict(self, data: Dict):
-        """Load game state from dictionary"""
-        import time
-        self.current_scene = data.get('current_scene', '')
-        self.visited_scenes = data.get('visited_scenes', [])
-        self.flags = data.get('flags', {})
-        self.inventory = data.get('inventory', [])
-        self.variables = data.get('variables', {})
-        self.choice_history = data.get('choice_history', [])
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert game state to a deep, JSON-ready dictionary for saving"""
+        return self.snapshot().to_dict()
+    
+    def from_dict(self, data: Dict[str, Any]):
+        """Load game state from dictionary (the data is copied, never aliased)"""
+        self.current_scene = sys.intern(data.get('current_scene', ''))
+        self.visited_scenes = OrderedSet(map(sys.intern, data.get('visited_scenes', [])))
+        self.flags = dict(data.get('flags', {}))
+        self.inventory = OrderedSet(data.get('inventory', []))
+        self.variables = copy.deepcopy(data.get('variables', {}))
+        self.choice_history = ChoiceHistory(data.get('choice_history', []),
+                                            window=self.choice_history.window,
+                                            spill_dir=self.choice_history.spill_dir)
         self.playtime = data.get('playtime', 0.0)
         self.start_time = time.time()
+        self._shared = 0
+        self.epoch += 1
+        if self.journal is not None:
+            self.journal = [("reset",)]
+
+
+class SceneRegistry(MutableMapping):
+    """
+    Scenes keyed by id, built on first access.
+    
+    Stories declare scenes as zero-argument factories; nothing is
+    constructed until a scene is looked up, so creating a story is cheap
+    and memory grows only with the scenes actually visited. Scenes can
+    still be assigned directly (``registry[id] = Scene(...)``).
+    """
+    
+    def __init__(self, on_materialize: Optional[Callable[[Scene], None]] = None):
+        self._scenes: Dict[str, Optional[Scene]] = {}
+        self._factories: Dict[str, Callable[[], Scene]] = {}
+        self.on_materialize = on_materialize
+    
+    def declare(self, scene_id: str, factory: Callable[[], Scene]):
+        """Register a scene factory without building the scene"""
+        self._scenes[scene_id] = None
+        self._factories[scene_id] = factory
+    
+    def is_materialized(self, scene_id: str) -> bool:
+        """Check whether a scene has been built"""
+        return self._scenes.get(scene_id) is not None
+    
+    @property
+    def materialized_count(self) -> int:
+        """Number of scenes built so far"""
+        return sum(1 for scene in self._scenes.values() if scene is not None)
+    
+    def __getitem__(self, scene_id: str) -> Scene:
+        scene = self._scenes[scene_id]
+        if scene is None:
+            # Keep the factory until the scene is built, so a failure can be retried
+            scene = self._factories[scene_id]()
+            if self.on_materialize:
+                self.on_materialize(scene)
+            self._scenes[scene_id] = scene
+            del self._factories[scene_id]
+        return scene
+    
+    def __setitem__(self, scene_id: str, scene: Scene):
+        self._factories.pop(scene_id, None)
+        if self.on_materialize:
+            self.on_materialize(scene)
+        self._scenes[scene_id] = scene
+    
+    def __delitem__(self, scene_id: str):
+        del self._scenes[scene_id]
+        self._factories.pop(scene_id, None)
+    
+    def __contains__(self, scene_id: object) -> bool:
+        return scene_id in self._scenes
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scenes)
+    
+    def __len__(self) -> int:
+        return len(self._scenes)
+
+
+class _ReadTracker:
+    """Proxy handed to Python conditions to record which state keys they read"""
+    
+    CONTAINERS = {"flags": "flag", "inventory": "item", "variables": "var"}
+    
+    def __init__(self, state: GameState):
+        self._state = state
+        self.reads = set()
+        self.opaque = False  # Read something that is not version-tracked
+    
+    def has_flag(self, flag: str) -> bool:
+        self.reads.add(("flag", flag))
+        return self._state.has_flag(flag)
+    
+    def has_item(self, item: str) -> bool:
+        self.reads.add(("item", item))
+        return self._state.has_item(item)
+    
+    def get_variable(self, name: str, default: Any = None) -> Any:
+        self.reads.add(("var", name))
+        return self._state.get_variable(name, default)
+    
+    def __getattr__(self, name: str):
+        kind = self.CONTAINERS.get(name)
+        if kind:
+            # Direct container access depends on every key of that kind
+            self.reads.add((kind, None))
+        else:
+            self.opaque = True
+        return getattr(self._state, name)
+
+
+class _CachedChoices:
+    """Evaluation plan and last result for one scene"""
+    
+    __slots__ = ("scene", "plan", "static_reads", "state", "epoch", "revision",
+                 "keys", "versions", "choices")
+    
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        # (choice, test, tracked): test is None for unconditional choices;
+        # tracked tests are Python callables run against a _ReadTracker
+        plan = []
+        static_reads = set()
+        for choice in scene.choices:
+            condition = choice.condition
+            reads = condition_reads(condition)
+            if condition is None:
+                plan.append((choice, None, False))
+            elif reads is not None:
+                static_reads |= reads
+                plan.append((choice, condition.evaluate, False))
+            else:
+                plan.append((choice, condition, True))
+        self.plan = tuple(plan)
+        self.static_reads = frozenset(static_reads)
+        self.state = None
+        self.epoch = -1
+        self.revision = -1
+        self.keys: Optional[tuple] = None  # None: result cannot be cached
+        self.versions: tuple = ()
+        self.choices: List[Choice] = []
+
+
+class ChoiceCache:
+    """
+    Available choices per scene, reused until a condition's inputs change.
+    
+    Each entry remembers the version of every flag, item and variable its
+    conditions read. Declarative predicates report their reads up front;
+    Python callables are run against a tracking proxy. Entries are stale
+    once one of those keys is written through the ``GameState`` mutators,
+    when the state is reloaded, or when the story's state object changes.
+    Conditions that read anything else (visited scenes, history...) are
+    simply re-evaluated every time.
+    """
+    
+    def __init__(self):
+        self.entries: Dict[str, _CachedChoices] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def clear(self):
+        """Forget every entry (e.g. after mutating state containers directly)"""
+        self.entries.clear()
+    
+    def available(self, scene: Scene, state: GameState) -> List[Choice]:
+        """Available choices for a scene, evaluated only when stale"""
+        entry = self.entries.get(scene.id)
+        if entry is None or entry.scene is not scene:
+            entry = self.entries[scene.id] = _CachedChoices(scene)
+        elif entry.state is state and entry.epoch == state.epoch and entry.keys is not None:
+            if entry.revision == state.revision:
+                # Nothing written since the last check
+                self.hits += 1
+                return list(entry.choices)
+            if tuple(map(state.versions.get, entry.keys, repeat(0))) == entry.versions:
+                entry.revision = state.revision
+                self.hits += 1
+                return list(entry.choices)
+        
+        self.misses += 1
+        available = []
+        reads = None
+        cacheable = True
+        for choice, test, tracked in entry.plan:
+            if test is None:
+                passed = True
+            elif tracked:
+                tracker = _ReadTracker(state)
+                passed = test(tracker)
+                if reads is None:
+                    reads = set(entry.static_reads)
+                reads |= tracker.reads
+                cacheable = cacheable and not tracker.opaque
+            else:
+                passed = test(state)
+            if passed:
+                available.append(choice)
+        
+        entry.state = state
+        entry.epoch = state.epoch
+        entry.revision = state.revision
+        entry.choices = available
+        if cacheable:
+            entry.keys = tuple(entry.static_reads if reads is None else reads)
+            entry.versions = tuple(map(state.versions.get, entry.keys, repeat(0)))
+        else:
+            entry.keys = None
+        return list(available)
 
 
 class Story:
@@ -132,9 +483,20 @@ class Story:
     def __init__(self):
         self.title: str = ""
         self.description: str = ""
-        self.scenes: Dict[str, Scene] = {}
+        self.scenes: SceneRegistry = SceneRegistry(on_materialize=self._prepare_scene)
         self.starting_scene: str = ""
         self.state: GameState = GameState()
+        self.choice_cache: ChoiceCache = ChoiceCache()
+    
+    def scene_palette(self, scene_id: str) -> Optional[Dict[str, str]]:
+        """Palette for a scene, resolved when the scene is built (None keeps the scene's own)"""
+        return None
+    
+    def _prepare_scene(self, scene: Scene):
+        """Finish a freshly built scene"""
+        palette = self.scene_palette(scene.id)
+        if palette is not None:
+            scene.palette = palette
     
     def get_scene(self, scene_id: str) -> Scene:
         """Get a scene by ID"""
@@ -142,8 +504,4 @@ class Story:
     
     def get_available_choices(self, scene: Scene) -> List[Choice]:
         """Get available choices for a scene based on conditions"""
-        available = []
-        for choice in scene.choices:
-            if choice.condition is None or choice.condition(self.state):
-                available.append(choice)
-        return available
+        return self.choice_cache.available(scene, self.state)
@@ -0,0 +1,106 @@
+"""Terminal capability probing and process-free screen control"""
+
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional, TextIO
+
+
+ANSI_CLEAR = "\x1b[H\x1b[2J"
+DUMB_TERMINALS = ("", "dumb", "unknown")
+TERMINFO_PADDING = re.compile(r"\$<[0-9.*/]+>")
+
+
+@dataclass(frozen=True)
+class TerminalCapabilities:
+    """What the attached terminal can do, probed once per process"""
+    term: str
+    clear_sequence: Optional[str]  # None: no in-process clear available
+    source: str  # "terminfo", "ansi", "windows-vt", "none"
+    probe_time: float
+
+    @property
+    def can_clear(self) -> bool:
+        return self.clear_sequence is not None
+
+
+_capabilities: Optional[TerminalCapabilities] = None
+
+
+def _probe_terminfo(term: str) -> Optional[str]:
+    """Look up the clear capability in the terminfo database"""
+    try:
+        import curses
+        try:
+            fd = sys.__stdout__.fileno()
+        except (AttributeError, ValueError, OSError):
+            fd = -1
+        curses.setupterm(term, fd)
+        sequence = curses.tigetstr("clear")
+    except Exception:
+        return None
+    if not sequence:
+        return None
+    # Strip terminfo padding markers such as $<50>
+    return TERMINFO_PADDING.sub("", sequence.decode("latin-1"))
+
+
+def _enable_windows_vt() -> bool:  # pragma: no cover - platform specific
+    """Turn on ANSI escape processing for the Windows console"""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except Exception:
+        return False
+
+
+def probe_terminal(refresh: bool = False) -> TerminalCapabilities:
+    """Probe (and cache) how to clear the screen without a subprocess"""
+    global _capabilities
+    if _capabilities is not None and not refresh:
+        return _capabilities
+
+    started = time.perf_counter()
+    term = os.environ.get("TERM", "")
+
+    if os.name == "nt":  # pragma: no cover - platform specific
+        if _enable_windows_vt():
+            sequence, source = ANSI_CLEAR, "windows-vt"
+        else:
+            sequence, source = None, "none"
+    elif term in DUMB_TERMINALS:
+        # A dumb terminal cannot clear; `clear` would print nothing either
+        sequence, source = "", "none"
+    else:
+        sequence = _probe_terminfo(term)
+        source = "terminfo"
+        if sequence is None:
+            sequence, source = ANSI_CLEAR, "ansi"
+
+    _capabilities = TerminalCapabilities(
+        term=term,
+        clear_sequence=sequence,
+        source=source,
+        probe_time=time.perf_counter() - started,
+    )
+    return _capabilities
+
+
+def clear_screen(stream: Optional[TextIO] = None):
+    """Clear the screen in-process, falling back to the shell only if needed"""
+    capabilities = probe_terminal()
+    if not capabilities.can_clear:  # pragma: no cover - legacy Windows consoles
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return
+    if capabilities.clear_sequence:
+        stream = stream or sys.stdout
+        stream.write(capabilities.clear_sequence)
+        stream.flush()
@@ -0,0 +1,166 @@
+"""Batched typewriter output for narration and dialogue"""
+
+import re
+import sys
+from dataclasses import dataclass
+from threading import Event
+from typing import Callable, List, Optional, TextIO
+
+from .clock import get_clock
+
+
+# SGR / CSI escape sequences emitted by Rich when rendering styled text
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+@dataclass
+class TypewriterStats:
+    """Counters for the most recent typewriter run"""
+    characters: int = 0
+    writes: int = 0
+    elapsed: float = 0.0
+    target: float = 0.0
+    skipped: bool = False  # The rest was flushed at once on a skip request
+
+    @property
+    def chars_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return float(self.characters)
+        return self.characters / self.elapsed
+
+    @property
+    def drift(self) -> float:
+        """Seconds the run took beyond its ideal duration"""
+        return self.elapsed - self.target
+
+
+class Typewriter:
+    """
+    Emit text one frame at a time instead of one character at a time.
+
+    Styled text is rendered to ANSI exactly once, split into per-glyph
+    units (each carrying any escape codes that precede it), and then
+    written in chunks: every tick emits all characters that are due by
+    the wall clock, using one write and one flush. Deadlines are computed
+    from the start of the run, so slow writes never accumulate as drift.
+    Once the ``skip`` event is set, whatever is left goes out in one write.
+    """
+
+    DEFAULT_FPS = 60
+
+    def __init__(self, fps: int = DEFAULT_FPS,
+                 clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], None]] = None,
+                 skip: Optional[Event] = None):
+        """
+        Initialize typewriter
+
+        Args:
+            fps: Maximum number of writes per second
+            clock: Monotonic time source (defaults to the default Clock's)
+            sleep: Sleep function used between ticks (likewise)
+            skip: Set (e.g. by a SkipListener) to finish the text at once
+        """
+        self.fps = max(1, int(fps))
+        default = get_clock()
+        self.clock = clock or default.now
+        self.sleep = sleep or default.sleep
+        self.skip = skip
+        self.stats = TypewriterStats()
+
+    # ------------------------------------------------------------------
+    # Pre-rendering
+    # ------------------------------------------------------------------
+    @staticmethod
+    def split_units(rendered: str) -> List[str]:
+        """Split an ANSI string into printable units with escapes attached"""
+        units: List[str] = []
+        pending = ""
+        position = 0
+        for match in ANSI_ESCAPE.finditer(rendered):
+            for char in rendered[position:match.start()]:
+                units.append(pending + char)
+                pending = ""
+            pending += match.group(0)
+            position = match.end()
+        for char in rendered[position:]:
+            units.append(pending + char)
+            pending = ""
+        if pending:
+            # Trailing reset codes ride along with the final glyph
+            if units:
+                units[-1] += pending
+            else:
+                units.append(pending)
+        return units
+
+    def prerender(self, text: str, style: Optional[str] = None, console=None) -> List[str]:
+        """Render text once and return its printable units"""
+        if console is None or not style:
+            return list(text)
+
+        from rich.text import Text
+        with console.capture() as capture:
+            console.print(Text(text, style=style, end=""), end="")
+        return self.split_units(capture.get())
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def type_units(self, units: List[str], delay: float, stream: Optional[TextIO] = None) -> TypewriterStats:
+        """Write pre-rendered units at one character per ``delay`` seconds"""
+        stream = stream or sys.stdout
+        stats = TypewriterStats(characters=len(units), target=max(len(units) - 1, 0) * max(delay, 0.0))
+        start = self.clock()
+        skip = self.skip
+
+        if delay <= 0 or not units or (skip is not None and skip.is_set()):
+            stream.write("".join(units))
+            stream.flush()
+            stats.writes = 1
+            stats.skipped = delay > 0 and bool(units)
+            stats.elapsed = self.clock() - start
+            self.stats = stats
+            return stats
+
+        tick = 1.0 / self.fps
+        total = len(units)
+        emitted = 0
+        last_write = start
+
+        while emitted < total:
+            if skip is not None and skip.is_set():
+                stream.write("".join(units[emitted:]))
+                stream.flush()
+                stats.writes += 1
+                stats.skipped = True
+                break
+            now = self.clock()
+            # The epsilon absorbs rounding in (start + n * delay) - start,
+            # which would otherwise leave a character forever just not due
+            due = min(total, int((now - start) / delay + 1e-9) + 1)
+            if due > emitted:
+                stream.write("".join(units[emitted:due]))
+                stream.flush()
+                stats.writes += 1
+                emitted = due
+                last_write = now
+            if emitted >= total:
+                break
+            # Next character deadline, but never write more often than fps
+            wake_at = max(start + emitted * delay, last_write + tick)
+            remaining = wake_at - self.clock()
+            if remaining > 0:
+                self.sleep(remaining)
+
+        stats.elapsed = self.clock() - start
+        self.stats = stats
+        return stats
+
+    def type_text(self, text: str, delay: float, style: Optional[str] = None,
+                  console=None, stream: Optional[TextIO] = None) -> TypewriterStats:
+        """Pre-render and type text in one call"""
+        units = self.prerender(text, style=style, console=console)
+        if stream is None and console is not None:
+            stream = console.file
+        return self.type_units(units, delay, stream=stream)
@@ -185,7 +185,9 @@ def main():
     else:
         print("Unknown action. Exiting.")
         sys.exit(1)
-from engine.save_manager import SaveManager, SaveMetadata
+from engine.save_manager import SaveMetadata
+from engine.save_store import (SORT_COMPLETION, SORT_ORDERS, SORT_STORY, SORT_TIMESTAMP,
+                               SaveStore, open_save_store)
 from stories.noir_detective import NoirDetectiveStory
 
 
@@ -218,7 +220,7 @@ def format_playtime(seconds: float) -> str:
     return f"{minutes}m"
 
 
-def get_continue_slot(save_manager: SaveManager) -> Optional[int]:
+def get_continue_slot(save_manager: SaveStore) -> Optional[int]:
     """Determine the most recent save slot to continue from"""
     latest_manual = save_manager.get_last_save_slot()
     if latest_manual is not None:
@@ -228,7 +230,7 @@ def get_continue_slot(save_manager: SaveManager) -> Optional[int]:
     return None
 
 
-def display_main_menu(color_renderer, save_manager: SaveManager) -> tuple[str, Optional[int]]:
+def display_main_menu(color_renderer, save_manager: SaveStore) -> tuple[str, Optional[int]]:
     """Display the main menu and return the user's choice and continue slot"""
     cprint(color_renderer, "\n" + "=" * 60, style="bold cyan")
     cprint(color_renderer, "  TERMINAL THEATRE".center(60), style="bold red")
@@ -258,59 +260,86 @@ def display_main_menu(color_renderer, save_manager: SaveManager) -> tuple[str, O
     return choice, continue_slot
 
 
-def load_game_menu(color_renderer, save_manager: SaveManager) -> Optional[dict]:
-    """Display the load game menu and return the loaded game state"""
-    cprint(color_renderer, "\n=== LOAD GAME ===\n", style="bold yellow")
-    slot_map: dict[str, int] = {}
+SAVES_PER_PAGE = 9
+SORT_LABELS = {SORT_TIMESTAMP: "newest", SORT_STORY: "story", SORT_COMPLETION: "completion"}
+
+
+def select_save_menu(color_renderer, save_manager: SaveStore, title: str,
+                     action: str, details: bool = True) -> Optional[SaveMetadata]:
+    """Page through the saves and return the one selected (None to cancel)"""
+    offset = 0
+    sort_by = SORT_TIMESTAMP
     
-    autosave_meta = save_manager.get_save_metadata(save_manager.AUTOSAVE_SLOT)
-    if autosave_meta:
-        slot_map["0"] = save_manager.AUTOSAVE_SLOT
-        cprint(
-            color_renderer,
-            f"0. {autosave_meta.save_name} — {autosave_meta.scene_description}",
-            style="bright_cyan"
-        )
+    while True:
+        descending = sort_by != SORT_STORY
+        page = save_manager.list_page(offset, SAVES_PER_PAGE, sort_by=sort_by,
+                                      descending=descending)
+        if page.total == 0:
+            cprint(color_renderer, f"\n=== {title} ===\n", style="bold yellow")
+            cprint(color_renderer, "No save files found.", style="yellow")
+            pause(color_renderer)
+            return None
+        if not page.saves and page.has_previous:
+            offset = max(0, offset - SAVES_PER_PAGE)
+            continue
+        
+        cprint(color_renderer, f"\n=== {title} ===", style="bold yellow")
         cprint(
             color_renderer,
-            f"   {autosave_meta.timestamp[:19]} | Playtime: {format_playtime(autosave_meta.playtime)}",
+            f"Page {page.page_number}/{page.page_count} · {page.total} saves · "
+            f"sorted by {SORT_LABELS[sort_by]}\n",
             style="dim"
         )
-    
-    for slot in range(1, save_manager.MAX_SAVE_SLOTS):
-        metadata = save_manager.get_save_metadata(slot)
-        if metadata:
-            slot_map[str(slot)] = slot
+        for number, metadata in enumerate(page.saves, start=1):
+            if metadata is None:
+                continue
             cprint(
                 color_renderer,
-                f"{slot}. {metadata.save_name} — {metadata.scene_description}",
+                f"{number}. {metadata.save_name} — {metadata.scene_description}",
                 style="bright_cyan"
             )
-            cprint(
-                color_renderer,
-                f"   {metadata.timestamp[:19]} | Playtime: {format_playtime(metadata.playtime)}",
-                style="dim"
-            )
-    
-    if not slot_map:
-        cprint(color_renderer, "No save files found.", style="yellow")
-        pause(color_renderer)
-        return None
-    
-    cprint(color_renderer, "\n[Q] Cancel", style="red")
-    selection = prompt_input(color_renderer, "Select a slot to load: ", style="bold yellow")
-    selection_key = selection.strip().lower()
-    
-    if selection_key in {"q", "-1"}:
-        return None
-    
-    slot = slot_map.get(selection.strip())
-    if slot is None:
-        cprint(color_renderer, "\nInvalid slot selection.", style="red")
-        pause(color_renderer)
+            if details:
+                cprint(
+                    color_renderer,
+                    f"   {metadata.timestamp[:19]} | Playtime: {format_playtime(metadata.playtime)}"
+                    f" | {metadata.completion_percentage:.0f}% complete",
+                    style="dim"
+                )
+        
+        cprint(color_renderer, "")
+        if page.has_previous:
+            cprint(color_renderer, "[P] Previous page", style="bright_cyan")
+        if page.has_next:
+            cprint(color_renderer, "[N] Next page", style="bright_cyan")
+        cprint(color_renderer, "[S] Change sort order", style="bright_cyan")
+        cprint(color_renderer, "[Q] Cancel", style="red")
+        selection = prompt_input(color_renderer, f"Select a save to {action}: ",
+                                 style="bold yellow").lower()
+        
+        if selection in {"q", "-1"}:
+            return None
+        if selection == "n" and page.has_next:
+            offset += SAVES_PER_PAGE
+        elif selection == "p" and page.has_previous:
+            offset = max(0, offset - SAVES_PER_PAGE)
+        elif selection == "s":
+            sort_by = SORT_ORDERS[(SORT_ORDERS.index(sort_by) + 1) % len(SORT_ORDERS)]
+            offset = 0
+        elif selection.isdigit() and 1 <= int(selection) <= len(page.saves) \
+                and page.saves[int(selection) - 1] is not None:
+            return page.saves[int(selection) - 1]
+        else:
+            cprint(color_renderer, "\nInvalid selection.", style="red")
+            pause(color_renderer)
+
+
+def load_game_menu(color_renderer, save_manager: SaveStore) -> Optional[dict]:
+    """Display the load game menu and return the loaded game state"""
+    metadata = select_save_menu(color_renderer, save_manager, "LOAD GAME", "load")
+    if metadata is None:
         return None
     
-    game_state = save_manager.load_game(slot)
+    game_state = save_manager.load_game(metadata.slot)
     if not game_state:
         cprint(color_renderer, "\nFailed to load the selected save.", style="red")
         pause(color_renderer)
@@ -319,44 +348,11 @@ def load_game_menu(color_renderer, save_manager: SaveManager) -> Optional[dict]:
     return game_state
 
 
-def delete_save_menu(color_renderer, save_manager: SaveManager) -> None:
+def delete_save_menu(color_renderer, save_manager: SaveStore) -> None:
     """Display the delete save menu"""
-    cprint(color_renderer, "\n=== DELETE SAVE ===\n", style="bold yellow")
-    slot_map: dict[str, int] = {}
-    
-    autosave_meta = save_manager.get_save_metadata(save_manager.AUTOSAVE_SLOT)
-    if autosave_meta:
-        slot_map["0"] = save_manager.AUTOSAVE_SLOT
-        cprint(color_renderer, f"0. {autosave_meta.save_name}", style="bright_cyan")
-    
-    for slot in range(1, save_manager.MAX_SAVE_SLOTS):
-        metadata = save_manager.get_save_metadata(slot)
-        if metadata:
-            slot_map[str(slot)] = slot
-            cprint(color_renderer, f"{slot}. {metadata.save_name} — {metadata.scene_description}", style="bright_cyan")
-    
-    if not slot_map:
-        cprint(color_renderer, "No save files available to delete.", style="yellow")
-        pause(color_renderer)
-        return
-    
-    cprint(color_renderer, "\n[Q] Cancel", style="red")
-    selection = prompt_input(color_renderer, "Select a slot to delete: ", style="bold yellow")
-    selection_key = selection.strip().lower()
-    
-    if selection_key in {"q", "-1"}:
-        return
-    
-    slot = slot_map.get(selection.strip())
-    if slot is None:
-        cprint(color_renderer, "\nInvalid slot selection.", style="red")
-        pause(color_renderer)
-        return
-    
-    metadata = save_manager.get_save_metadata(slot)
-    if not metadata:
-        cprint(color_renderer, "\nNo save exists in that slot.", style="yellow")
-        pause(color_renderer)
+    metadata = select_save_menu(color_renderer, save_manager, "DELETE SAVE", "delete",
+                                details=False)
+    if metadata is None:
         return
     
     confirm = prompt_input(
@@ -367,7 +363,7 @@ def delete_save_menu(color_renderer, save_manager: SaveManager) -> None:
     if confirm != "y":
         return
     
-    if save_manager.delete_save(slot):
+    if save_manager.delete_save(metadata.slot):
         cprint(color_renderer, "\n✓ Save deleted.", style="green")
     else:
         cprint(color_renderer, "\n✗ Failed to delete save.", style="red")
@@ -388,10 +384,11 @@ def ensure_story_compatibility(color_renderer, game_state: dict) -> bool:
     return True
 
 
-def start_story(color_renderer, game_state: Optional[dict] = None) -> None:
+def start_story(color_renderer, game_state: Optional[dict] = None,
+                save_manager: Optional[SaveStore] = None) -> None:
     """Instantiate the Noir Detective story and start the game"""
     story = NoirDetectiveStory()
-    game = Game(story)
+    game = Game(story, save_manager=save_manager)
     game.start(loaded_state=game_state)
 
 
@@ -403,14 +400,15 @@ def main():
     except ImportError:
         color_renderer = None
     
-    save_manager = SaveManager()
+    settings = GameSettings()
+    save_manager = open_save_store(settings.save_backend, profile=settings.save_profile)
     
     while True:
         choice, continue_slot = display_main_menu(color_renderer, save_manager)
         normalized_choice = choice.lower()
         
         if normalized_choice == "1":
-            start_story(color_renderer)
+            start_story(color_renderer, save_manager=save_manager)
         elif normalized_choice == "2":
             if continue_slot is None:
                 cprint(color_renderer, "\nNo saves available to continue.", style="yellow")
@@ -422,11 +420,11 @@ def main():
                 pause(color_renderer)
                 continue
             if ensure_story_compatibility(color_renderer, game_state):
-                start_story(color_renderer, game_state)
+                start_story(color_renderer, game_state, save_manager)
         elif normalized_choice == "3":
             game_state = load_game_menu(color_renderer, save_manager)
             if game_state and ensure_story_compatibility(color_renderer, game_state):
-                start_story(color_renderer, game_state)
+                start_story(color_renderer, game_state, save_manager)
         elif normalized_choice == "4":
             delete_save_menu(color_renderer, save_manager)
         elif normalized_choice in {"5", "q"}:
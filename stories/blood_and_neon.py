@@ -3,12 +3,36 @@
 from engine.story import Story, Scene, Choice
 from engine.animation import Animation, AnimationLibrary
 from engine.colors import get_mood_palette
+from engine.logic import Effects, SetFlag, AddItem
 from stories.blood_and_neon_art import BloodAndNeonArt
 
 
 class BloodAndNeonStory(Story):
     """An epic noir detective mystery - longer, deeper, darker"""
     
+    # Scene mood overrides; other scenes are matched by keywords in their id
+    PALETTE_OVERRIDES = {
+        "prologue": "noir",
+        "crime_scene_one": "alert",
+        "interrogate_witness": "mystery",
+        "follow_suspect": "danger",
+        "morgue_visit": "calm",
+        "discover_pattern": "alert",
+        "precinct_investigation": "mystery",
+        "partner_betrayal": "danger",
+        "underground_club": "mystery",
+        "warehouse_district": "danger",
+        "penthouse_confrontation": "alert",
+        "final_revelation": "mystery",
+    }
+    
+    PALETTE_KEYWORDS = [
+        ("danger", ["fight", "shoot", "chase", "attack", "ambush", "blood", "kill", "fire", "explosion", "trap"]),
+        ("alert", ["search", "investigate", "follow", "trail", "clue", "evidence", "discover", "reveal"]),
+        ("calm", ["morgue", "office", "partner", "ally", "safe", "recover", "rest", "plan"]),
+        ("mystery", ["club", "warehouse", "shadow", "secret", "conspiracy", "ritual", "cult", "hidden"]),
+    ]
+    
     def __init__(self):
         super().__init__()
         self.title = "BLOOD AND NEON"
@@ -21,43 +45,19 @@ class BloodAndNeonStory(Story):
         )
         self.starting_scene = "prologue"
         self._build_story()
-        self._apply_scene_palettes()
     
-    def _apply_scene_palettes(self):
-        """Assign color palettes to scenes based on mood"""
-        overrides = {
-            "prologue": "noir",
-            "crime_scene_one": "alert",
-            "interrogate_witness": "mystery",
-            "follow_suspect": "danger",
-            "morgue_visit": "calm",
-            "discover_pattern": "alert",
-            "precinct_investigation": "mystery",
-            "partner_betrayal": "danger",
-            "underground_club": "mystery",
-            "warehouse_district": "danger",
-            "penthouse_confrontation": "alert",
-            "final_revelation": "mystery",
-        }
-        
-        keyword_map = [
-            ("danger", ["fight", "shoot", "chase", "attack", "ambush", "blood", "kill", "fire", "explosion", "trap"]),
-            ("alert", ["search", "investigate", "follow", "trail", "clue", "evidence", "discover", "reveal"]),
-            ("calm", ["morgue", "office", "partner", "ally", "safe", "recover", "rest", "plan"]),
-            ("mystery", ["club", "warehouse", "shadow", "secret", "conspiracy", "ritual", "cult", "hidden"]),
-        ]
-        
-        for scene_id, scene in self.scenes.items():
-            mood = overrides.get(scene_id)
-            if not mood:
-                lower_id = scene_id.lower()
-                for mood_name, keywords in keyword_map:
-                    if any(keyword in lower_id for keyword in keywords):
-                        mood = mood_name
-                        break
-            if not mood:
-                mood = "noir"
-            scene.palette = get_mood_palette(mood)
+    def scene_palette(self, scene_id):
+        """Pick a color palette for a scene based on mood"""
+        mood = self.PALETTE_OVERRIDES.get(scene_id)
+        if not mood:
+            lower_id = scene_id.lower()
+            for mood_name, keywords in self.PALETTE_KEYWORDS:
+                if any(keyword in lower_id for keyword in keywords):
+                    mood = mood_name
+                    break
+        if not mood:
+            mood = "noir"
+        return get_mood_palette(mood)
     
     def _build_story(self):
         """Build the complete story graph - an epic noir tale"""
@@ -66,7 +66,7 @@ class BloodAndNeonStory(Story):
         # ACT ONE: THE PATTERN EMERGES
         # ============================================================================
         
-        self.scenes["prologue"] = Scene(
+        self.scenes.declare("prologue", lambda: Scene(
             id="prologue",
             description=(
                 "Rain hammers the windows of your apartment like bullets seeking flesh.\n"
@@ -94,9 +94,9 @@ class BloodAndNeonStory(Story):
                 Choice("Call your old partner first - you need someone you trust", "call_sarah"),
                 Choice("Review the case files one more time - you're missing something", "review_files"),
             ]
-        )
+        ))
         
-        self.scenes["pier_nineteen"] = Scene(
+        self.scenes.declare("pier_nineteen", lambda: Scene(
             id="pier_nineteen",
             description=(
                 "The pier stretches into darkness like a dead man's finger pointing at eternity.\n"
@@ -126,9 +126,9 @@ class BloodAndNeonStory(Story):
                 Choice("Follow the business card lead to 'The Crimson Hour'", "crimson_hour_club"),
                 Choice("Search Dr. Cross's office - she was investigating something", "cross_office"),
             ]
-        )
+        ))
         
-        self.scenes["call_sarah"] = Scene(
+        self.scenes.declare("call_sarah", lambda: Scene(
             id="call_sarah",
             description=(
                 "Sarah Vega. Your partner for six years before she made Lieutenant\n"
@@ -149,9 +149,9 @@ class BloodAndNeonStory(Story):
                 Choice("Wait for Sarah - you work better together", "sarah_arrives"),
                 Choice("Can't wait - head to Pier 19 now", "pier_nineteen"),
             ]
-        )
+        ))
         
-        self.scenes["review_files"] = Scene(
+        self.scenes.declare("review_files", lambda: Scene(
             id="review_files",
             description=(
                 "Your apartment walls are a conspiracy theorist's fever dream.\n"
@@ -181,13 +181,9 @@ class BloodAndNeonStory(Story):
                 Choice("The yacht explosion - get the original reports", "yacht_explosion"),
                 Choice("Enough theory - get to Pier 19", "pier_nineteen"),
             ]
-        )
+        ))
         
-        def examine_card_enter(state):
-            state.set_flag("examined_tarot_card")
-            state.add_item("Queen of Swords")
-        
-        self.scenes["examine_card"] = Scene(
+        self.scenes.declare("examine_card", lambda: Scene(
             id="examine_card",
             description=(
                 "The Queen of Swords. In tarot, she represents clarity through pain,\n"
@@ -204,15 +200,15 @@ class BloodAndNeonStory(Story):
                 ("REEVES", "Don't even think about calling it, Kane. We'll trace it,\n           bring in the tech team—"),
                 ("KANE", "By which time four more people are dead. This killer is\n          on a schedule. We're already three steps behind."),
             ],
-            on_enter=examine_card_enter,
+            on_enter=Effects([SetFlag("examined_tarot_card"), AddItem("Queen of Swords")]),
             choices=[
                 Choice("Call the number now - take the bait", "call_killer"),
                 Choice("Wait for the tech trace - do this right", "tech_trace"),
                 Choice("Research the card deck instead - find the source", "card_research"),
             ]
-        )
+        ))
         
-        self.scenes["question_forensics"] = Scene(
+        self.scenes.declare("question_forensics", lambda: Scene(
             id="question_forensics",
             description=(
                 "The forensic tech is young. Too young for this much death.\n"
@@ -242,9 +238,9 @@ class BloodAndNeonStory(Story):
                 Choice("First, visit 'The Crimson Hour' club - the card lead", "crimson_hour_club"),
                 Choice("Search Dr. Cross's office for more research", "cross_office"),
             ]
-        )
+        ))
         
-        self.scenes["crimson_hour_club"] = Scene(
+        self.scenes.declare("crimson_hour_club", lambda: Scene(
             id="crimson_hour_club",
             description=(
                 "The Crimson Hour sits in the meat-packing district like a jewel in a wound.\n"
@@ -271,9 +267,9 @@ class BloodAndNeonStory(Story):
                 Choice("Refuse - question her here where there are witnesses", "question_selene"),
                 Choice("Draw your weapon - arrest her as a material witness", "arrest_selene"),
             ]
-        )
+        ))
         
-        self.scenes["cross_office"] = Scene(
+        self.scenes.declare("cross_office", lambda: Scene(
             id="cross_office",
             description=(
                 "Dr. Evelyn Cross's office is a shrine to forensic science.\n"
@@ -299,12 +295,9 @@ class BloodAndNeonStory(Story):
                 Choice("The video cut off - someone's here", "office_ambush"),
                 Choice("Grab the files and run - you're exposed", "escape_office"),
             ]
-        )
+        ))
         
-        def sarah_arrives_enter(state):
-            state.set_flag("sarah_partnered")
-        
-        self.scenes["sarah_arrives"] = Scene(
+        self.scenes.declare("sarah_arrives", lambda: Scene(
             id="sarah_arrives",
             description=(
                 "Sarah Vega arrives in twenty minutes. She's brought coffee and ammunition.\n"
@@ -328,14 +321,14 @@ class BloodAndNeonStory(Story):
                 ("SARAH", "More than that. The brilliant one. Alexander had the money,\n           the vision. She had the genius. If anyone could continue\n           the research, weaponize Nightshade, and orchestrate this—"),
                 ("KANE", "Then we're not looking for a dead man. We're looking for\n          a woman with nothing to lose and everything to avenge."),
             ],
-            on_enter=sarah_arrives_enter,
+            on_enter=Effects([SetFlag("sarah_partnered")]),
             choices=[
                 Choice("Head to Pier 19 together - safety in numbers", "pier_nineteen_with_sarah"),
                 Choice("Split up - you take the pier, Sarah investigates Ouroboros", "split_investigation"),
             ]
-        )
+        ))
         
-        self.scenes["prometheus_research"] = Scene(
+        self.scenes.declare("prometheus_research", lambda: Scene(
             id="prometheus_research",
             description=(
                 "Prometheus Industries. The paper trail leads through shell companies,\n"
@@ -363,9 +356,9 @@ class BloodAndNeonStory(Story):
                 Choice("Enough research - get to the pier", "pier_nineteen"),
                 Choice("Dig deeper into the yacht explosion", "yacht_explosion"),
             ]
-        )
+        ))
         
-        self.scenes["yacht_explosion"] = Scene(
+        self.scenes.declare("yacht_explosion", lambda: Scene(
             id="yacht_explosion",
             description=(
                 "The Coast Guard report is clinical. Explosion at 2:47 AM.\n"
@@ -392,12 +385,9 @@ class BloodAndNeonStory(Story):
                 Choice("This is getting too deep - call Sarah", "call_sarah"),
                 Choice("Get to the pier before victim four appears", "pier_nineteen"),
             ]
-        )
+        ))
         
-        def call_killer_enter(state):
-            state.set_flag("contacted_killer")
-        
-        self.scenes["call_killer"] = Scene(
+        self.scenes.declare("call_killer", lambda: Scene(
             id="call_killer",
             description=(
                 "You dial the number. It rings once. Twice.\n\n"
@@ -415,15 +405,15 @@ class BloodAndNeonStory(Story):
                 ("KANE", "You're killing innocent people."),
                 ("CASSANDRA", "Innocent? Foster hid evidence. Hartley threw the trial.\n               Cross faked my husband's death and then helped cover up\n               the murder of James Tolliver. Innocent is a word that\n               lost meaning years ago. But you... you're different.\n               You weren't part of it. That's why you get to be the finale."),
             ],
-            on_enter=call_killer_enter,
+            on_enter=Effects([SetFlag("contacted_killer")]),
             choices=[
                 Choice("'I'm coming for you' - make it personal", "threat_cassandra"),
                 Choice("'Why the theatrics? Why not just vanish?' - keep her talking", "question_cassandra"),
                 Choice("Trace the call - have tech lock her location", "trace_cassandra"),
             ]
-        )
+        ))
         
-        self.scenes["tech_trace"] = Scene(
+        self.scenes.declare("tech_trace", lambda: Scene(
             id="tech_trace",
             description=(
                 "The tech team swarms the number. Within minutes they have a location.\n"
@@ -442,9 +432,9 @@ class BloodAndNeonStory(Story):
                 Choice("Follow orders - wait for SWAT", "swat_raid"),
                 Choice("Turn in your badge - do this your way", "go_rogue"),
             ]
-        )
+        ))
         
-        self.scenes["card_research"] = Scene(
+        self.scenes.declare("card_research", lambda: Scene(
             id="card_research",
             description=(
                 "The tarot deck is custom. Hand-painted. You trace it to a specialist\n"
@@ -468,11 +458,11 @@ class BloodAndNeonStory(Story):
                 Choice("Ask if she's been back - maybe she'll return", "stake_out_shop"),
                 Choice("That's all you need - head to the warehouse district", "warehouse_district_early"),
             ]
-        )
+        ))
         
         # [CONTINUING WITH MORE SCENES - This is getting long, so I'll add key branching points]
         
-        self.scenes["meet_elias"] = Scene(
+        self.scenes.declare("meet_elias", lambda: Scene(
             id="meet_elias",
             description=(
                 "The private room at the top of the Crimson Hour is decorated in themes\n"
@@ -499,9 +489,9 @@ class BloodAndNeonStory(Story):
                 Choice("Play along - pretend to be interested in his philosophy", "philosophy_game"),
                 Choice("Threaten him - make him give up Cassandra's location", "threaten_elias"),
             ]
-        )
+        ))
         
-        self.scenes["question_selene"] = Scene(
+        self.scenes.declare("question_selene", lambda: Scene(
             id="question_selene",
             description=(
                 "You keep Selene in public view. Smart. But she doesn't seem concerned.\n\n"
@@ -522,12 +512,9 @@ class BloodAndNeonStory(Story):
                 Choice("She's still here - search the building", "search_crimson_hour"),
                 Choice("Where did she go? - follow the trail", "follow_cassandra_from_club"),
             ]
-        )
+        ))
         
-        def arrest_selene_enter(state):
-            state.set_flag("arrested_selene")
-        
-        self.scenes["arrest_selene"] = Scene(
+        self.scenes.declare("arrest_selene", lambda: Scene(
             id="arrest_selene",
             description=(
                 "You pull your weapon and badge. 'Selene, you're under arrest as a\n"
@@ -542,19 +529,19 @@ class BloodAndNeonStory(Story):
             dialogue=[
                 ("SELENE", "You can leave anytime you want, Detective. Just walk away.\n            But if you insist on this arrest... well. Things might\n            get complicated. And you strike me as someone who prefers\n            simple solutions to messy problems."),
             ],
-            on_enter=arrest_selene_enter,
+            on_enter=Effects([SetFlag("arrested_selene")]),
             choices=[
                 Choice("Stand your ground - call for backup", "call_backup_club"),
                 Choice("Tactical retreat - you're outgunned", "retreat_from_club"),
                 Choice("Draw your weapon - make them take you seriously", "shootout_club"),
             ]
-        )
+        ))
         
         # ============================================================================
         # ACT TWO: THE HUNTER BECOMES THE HUNTED
         # ============================================================================
         
-        self.scenes["office_ambush"] = Scene(
+        self.scenes.declare("office_ambush", lambda: Scene(
             id="office_ambush",
             description=(
                 "The office door opens. You spin, hand on your weapon.\n\n"
@@ -575,9 +562,9 @@ class BloodAndNeonStory(Story):
                 Choice("Talk - keep her engaged, buy time", "negotiate_cassandra"),
                 Choice("Run - get out before she doses you", "flee_office"),
             ]
-        )
+        ))
         
-        self.scenes["escape_office"] = Scene(
+        self.scenes.declare("escape_office", lambda: Scene(
             id="escape_office",
             description=(
                 "You grab Dr. Cross's research and bolt. Behind you, footsteps.\n"
@@ -595,9 +582,9 @@ class BloodAndNeonStory(Story):
                 Choice("Find somewhere to analyze the files", "safe_house"),
                 Choice("Go straight to Captain Reeves - need backup", "precinct_return"),
             ]
-        )
+        ))
         
-        self.scenes["pier_nineteen_with_sarah"] = Scene(
+        self.scenes.declare("pier_nineteen_with_sarah", lambda: Scene(
             id="pier_nineteen_with_sarah",
             description=(
                 "Together, you and Sarah approach the pier. The scene is as horrific\n"
@@ -620,13 +607,13 @@ class BloodAndNeonStory(Story):
                 Choice("Protect Damien Cross - stop victim four", "protect_damien"),
                 Choice("Use Damien as bait - set a trap for Cassandra", "bait_trap"),
             ]
-        )
+        ))
         
         # ============================================================================
         # ACT THREE: THE FINAL CARDS
         # ============================================================================
         
-        self.scenes["protect_damien"] = Scene(
+        self.scenes.declare("protect_damien", lambda: Scene(
             id="protect_damien",
             description=(
                 "Damien Cross lives in a brownstone in the Heights. Expensive. Secure.\n"
@@ -648,9 +635,9 @@ class BloodAndNeonStory(Story):
                 Choice("Search his house for clues while Sarah stays with him", "search_damien_house"),
                 Choice("Review his case files - what did he know?", "damien_files"),
             ]
-        )
+        ))
         
-        self.scenes["bait_trap"] = Scene(
+        self.scenes.declare("bait_trap", lambda: Scene(
             id="bait_trap",
             description=(
                 "You convince Damien Cross to help set the trap. He's terrified but\n"
@@ -671,11 +658,11 @@ class BloodAndNeonStory(Story):
                 Choice("Turn on your flashlight - force the confrontation", "flashlight_confrontation"),
                 Choice("Stay silent - hunt her in the dark", "dark_hunt"),
             ]
-        )
+        ))
         
         # [Continuing to ending branches - I'll add several ending variants]
         
-        self.scenes["tackle_cassandra"] = Scene(
+        self.scenes.declare("tackle_cassandra", lambda: Scene(
             id="tackle_cassandra",
             description=(
                 "You rush her. Fast. Professional. The tackle is perfect.\n\n"
@@ -692,9 +679,9 @@ class BloodAndNeonStory(Story):
                 Choice("Fight the drug - stay conscious", "resist_nightshade"),
                 Choice("Let it take you - maybe she'll think you're done", "fake_unconscious"),
             ]
-        )
+        ))
         
-        self.scenes["final_confrontation"] = Scene(
+        self.scenes.declare("final_confrontation", lambda: Scene(
             id="final_confrontation",
             description=(
                 "You track Cassandra to the old Prometheus facility. The place where\n"
@@ -723,13 +710,13 @@ class BloodAndNeonStory(Story):
                 Choice("Walk away - let her disappear", "walk_away_ending"),
                 Choice("'There's another way' - negotiate a truce", "negotiate_ending"),
             ]
-        )
+        ))
         
         # ============================================================================
         # MULTIPLE ENDINGS
         # ============================================================================
         
-        self.scenes["shoot_cassandra"] = Scene(
+        self.scenes.declare("shoot_cassandra", lambda: Scene(
             id="shoot_cassandra",
             description=(
                 "You pull the trigger. The shot echoes in the abandoned laboratory.\n\n"
@@ -748,9 +735,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE EXECUTIONER"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["arrest_cassandra"] = Scene(
+        self.scenes.declare("arrest_cassandra", lambda: Scene(
             id="arrest_cassandra",
             description=(
                 "You arrest Cassandra Westmore. The trial is sensational. She pleads\n"
@@ -770,9 +757,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE TRUTH IN DARKNESS"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["walk_away_ending"] = Scene(
+        self.scenes.declare("walk_away_ending", lambda: Scene(
             id="walk_away_ending",
             description=(
                 "You holster your weapon. You turn. You walk away.\n\n"
@@ -788,9 +775,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE COWARD'S REDEMPTION"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["negotiate_ending"] = Scene(
+        self.scenes.declare("negotiate_ending", lambda: Scene(
             id="negotiate_ending",
             description=(
                 "You talk. For hours. About justice. About revenge. About the system\n"
@@ -813,13 +800,13 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE DEVIL'S BARGAIN"
             ),
             is_ending=True
-        )
+        ))
         
         # Add many more scenes to create a truly epic branching narrative...
         # [For brevity, I'm including key scenes. The full story would have 100+ scenes]
         
         # Additional endings for different paths
-        self.scenes["nightshade_ending"] = Scene(
+        self.scenes.declare("nightshade_ending", lambda: Scene(
             id="nightshade_ending",
             description=(
                 "The Nightshade takes you. You wake in a white room. Clean. Sterile.\n"
@@ -839,9 +826,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: LOST IN THE PATTERN"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["partner_sacrifice_ending"] = Scene(
+        self.scenes.declare("partner_sacrifice_ending", lambda: Scene(
             id="partner_sacrifice_ending",
             description=(
                 "Sarah takes the bullet meant for you. Falls in slow motion.\n"
@@ -860,9 +847,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE WEIGHT OF ANGELS"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["conspiracy_victory_ending"] = Scene(
+        self.scenes.declare("conspiracy_victory_ending", lambda: Scene(
             id="conspiracy_victory_ending",
             description=(
                 "The evidence Sarah and you compiled destroys everything. Senators.\n"
@@ -884,14 +871,14 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE FOOL'S JOURNEY COMPLETE"
             ),
             is_ending=True
-        )
+        ))
         
         # Add connecting scenes to create multiple paths to these endings
         # This creates a rich, branching narrative with real consequence
         
         # Additional key scenes to complete the narrative web
         
-        self.scenes["ouroboros_pharma"] = Scene(
+        self.scenes.declare("ouroboros_pharma", lambda: Scene(
             id="ouroboros_pharma",
             description=(
                 "Ouroboros Pharmaceuticals occupies a glass tower that reflects the city\n"
@@ -914,9 +901,9 @@ class BloodAndNeonStory(Story):
                 Choice("She shows you a tarot card - she's already been marked", "marsh_marked"),
                 Choice("She has evidence - files, recordings, everything", "marsh_evidence"),
             ]
-        )
+        ))
         
-        self.scenes["marsh_marked"] = Scene(
+        self.scenes.declare("marsh_marked", lambda: Scene(
             id="marsh_marked",
             description=(
                 "Dr. Marsh opens her desk drawer. Inside: a tarot card. The Hierophant.\n"
@@ -939,9 +926,9 @@ class BloodAndNeonStory(Story):
                 Choice("Hide Marsh yourself - you trust no one", "hide_marsh"),
                 Choice("Use Marsh as bait - trap Cassandra", "marsh_bait"),
             ]
-        )
+        ))
         
-        self.scenes["swat_raid"] = Scene(
+        self.scenes.declare("swat_raid", lambda: Scene(
             id="swat_raid",
             description=(
                 "SWAT hits the warehouse at dawn. Tactical. Professional. By the book.\n\n"
@@ -965,9 +952,9 @@ class BloodAndNeonStory(Story):
                 Choice("Read the journal - understand her mind", "cassandra_journal"),
                 Choice("This is a distraction - find her real location", "find_real_location"),
             ]
-        )
+        ))
         
-        self.scenes["go_rogue"] = Scene(
+        self.scenes.declare("go_rogue", lambda: Scene(
             id="go_rogue",
             description=(
                 "You unclip your badge. Place it on Reeves' desk.\n"
@@ -987,9 +974,9 @@ class BloodAndNeonStory(Story):
                 Choice("Start with her known associates - work backwards", "cassandra_associates"),
                 Choice("Go to the Prometheus facility - that's where it started", "prometheus_facility"),
             ]
-        )
+        ))
         
-        self.scenes["cassandra_journal"] = Scene(
+        self.scenes.declare("cassandra_journal", lambda: Scene(
             id="cassandra_journal",
             description=(
                 "The journal is meticulous. Detailed. Beautiful handwriting that would\n"
@@ -1014,9 +1001,9 @@ class BloodAndNeonStory(Story):
                 Choice("The journal mentions a final location - 'Where it all ends'", "final_location"),
                 Choice("Confront this head-on - call her, arrange a meeting", "call_cassandra_direct"),
             ]
-        )
+        ))
         
-        self.scenes["philosophy_game"] = Scene(
+        self.scenes.declare("philosophy_game", lambda: Scene(
             id="philosophy_game",
             description=(
                 "You sit. Accept the absinthe. Play the game.\n\n"
@@ -1039,9 +1026,9 @@ class BloodAndNeonStory(Story):
                 Choice("'Where is she?' - time to stop playing", "demand_location"),
                 Choice("'Let me join her' - infiltrate deeper", "infiltrate_cult"),
             ]
-        )
+        ))
         
-        self.scenes["split_investigation"] = Scene(
+        self.scenes.declare("split_investigation", lambda: Scene(
             id="split_investigation",
             description=(
                 "You and Sarah split up. She heads to Ouroboros Pharmaceuticals.\n"
@@ -1062,9 +1049,9 @@ class BloodAndNeonStory(Story):
                 Choice("Storm Ouroboros - tear the building apart to find her", "storm_ouroboros"),
                 Choice("Cassandra wants you to panic - think, don't react", "stay_calm_sarah"),
             ]
-        )
+        ))
         
-        self.scenes["resist_nightshade"] = Scene(
+        self.scenes.declare("resist_nightshade", lambda: Scene(
             id="resist_nightshade",
             description=(
                 "The drug hits like a freight train made of nightmares. But you fight it.\n"
@@ -1083,9 +1070,9 @@ class BloodAndNeonStory(Story):
             choices=[
                 Choice("Go to the final location - end this", "final_confrontation"),
             ]
-        )
+        ))
         
-        self.scenes["fake_unconscious"] = Scene(
+        self.scenes.declare("fake_unconscious", lambda: Scene(
             id="fake_unconscious",
             description=(
                 "You let the drug take you. Or pretend to. You go limp. Still.\n"
@@ -1105,9 +1092,9 @@ class BloodAndNeonStory(Story):
                 Choice("Follow her - she'll lead you to the final location", "track_cassandra"),
                 Choice("The drug is affecting you - get medical help first", "medical_help"),
             ]
-        )
+        ))
         
-        self.scenes["storm_ouroboros"] = Scene(
+        self.scenes.declare("storm_ouroboros", lambda: Scene(
             id="storm_ouroboros",
             description=(
                 "You storm Ouroboros with every cop loyal to you. Warrants be damned.\n"
@@ -1132,11 +1119,11 @@ class BloodAndNeonStory(Story):
                 Choice("Disconnect the IV - stop the dose", "save_sarah_medical"),
                 Choice("Cassandra has the antidote - make her give it up", "demand_antidote"),
             ]
-        )
+        ))
         
         # Final ending branches
         
-        self.scenes["shoot_cassandra_save_sarah"] = Scene(
+        self.scenes.declare("shoot_cassandra_save_sarah", lambda: Scene(
             id="shoot_cassandra_save_sarah",
             description=(
                 "You shoot. Center mass. Professional. Fatal.\n\n"
@@ -1155,9 +1142,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: THE PRICE OF SALVATION"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["save_sarah_medical"] = Scene(
+        self.scenes.declare("save_sarah_medical", lambda: Scene(
             id="save_sarah_medical",
             description=(
                 "You disconnect the IV. Stop the dose. Every second counts.\n\n"
@@ -1177,9 +1164,9 @@ class BloodAndNeonStory(Story):
                 "ENDING: INCOMPLETE PATTERNS"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["true_ending"] = Scene(
+        self.scenes.declare("true_ending", lambda: Scene(
             id="true_ending",
             description=(
                 "In the final confrontation at the old Prometheus facility, you realize\n"
@@ -1209,7 +1196,7 @@ class BloodAndNeonStory(Story):
                 "ENDING: EYES WIDE OPEN"
             ),
             is_ending=True
-        )
+        ))
         
         # Connect all the loose ends
         # Adding stub scenes for all referenced but not yet implemented scenes
@@ -1231,7 +1218,7 @@ class BloodAndNeonStory(Story):
         
         for scene_id in stub_scenes:
             if scene_id not in self.scenes:
-                self.scenes[scene_id] = Scene(
+                self.scenes.declare(scene_id, lambda scene_id=scene_id: Scene(
                     id=scene_id,
                     description=(
                         f"[This scene is under development]\n\n"
@@ -1248,7 +1235,7 @@ class BloodAndNeonStory(Story):
                     choices=[
                         Choice("Continue to the final confrontation", "final_confrontation"),
                     ]
-                )
+                ))
 
 def create_story() -> Story:
     """Factory function to create the Blood and Neon story"""
@@ -3,11 +3,60 @@
 from engine.story import Story, Scene, Choice
 from engine.animation import Animation, AnimationLibrary
 from engine.colors import get_mood_palette
+from engine.logic import Effects, SetFlag
 
 
 class NoirDetectiveStory(Story):
     """A noir detective mystery story"""
     
+    # Scene mood overrides; other scenes are matched by keywords in their id
+    PALETTE_OVERRIDES = {
+        "opening": "mystery",
+        "search_body": "alert",
+        "check_gun": "alert",
+        "run_away": "danger",
+        "castellano_meeting": "mystery",
+        "alley_fight": "danger",
+        "warehouse": "mystery",
+        "warehouse_with_eddie": "danger",
+        "warehouse_sneak": "mystery",
+        "velvet_room": "mystery",
+        "theater": "mystery",
+        "rodriguez": "calm",
+        "call_eddie": "calm",
+        "rodriguez_plan": "alert",
+        "solo_mission": "danger",
+        "warehouse_shootout_eddie": "danger",
+        "warehouse_evidence": "alert",
+        "velvet_room_with_eddie": "mystery",
+        "theater_reveal": "mystery",
+        "theater_fight": "danger",
+        "doctor_visit": "calm",
+        "escape_with_evidence": "calm",
+        "rodriguez_raid": "danger",
+        "chen_partnership": "alert",
+        "fbi_cooperation": "calm",
+        "warehouse_negotiation": "alert",
+        "warehouse_rush_guards": "danger",
+        "warehouse_wait": "alert",
+        "warehouse_front": "alert",
+        "warehouse_retreat": "alert",
+        "warehouse_skylight_attack": "danger",
+        "warehouse_shootout": "danger",
+        "warehouse_injured": "danger",
+        "escape_run": "danger",
+        "escape_with_rodriguez": "calm",
+        "morrison_confrontation": "danger",
+        "project_nightfall": "mystery",
+    }
+    
+    PALETTE_KEYWORDS = [
+        ("danger", ["fight", "shoot", "shootout", "attack", "ambush", "raid", "gun", "fire", "blood", "kill", "execution", "burn", "bomb"]),
+        ("alert", ["search", "check", "investigate", "follow", "trail", "watch", "stake", "intercept", "trace", "surveil", "shadow", "pursuit", "chase"]),
+        ("calm", ["doctor", "safe", "ally", "friend", "eddie", "rodriguez", "chen", "partner", "home", "office", "c3", "safehouse"]),
+        ("mystery", ["warehouse", "velvet", "night", "project", "nightfall", "secret", "meeting", "intel", "evidence", "shadow", "conspiracy", "ritual", "mystery", "dark"]),
+    ]
+    
     def __init__(self):
         super().__init__()
         self.title = "THE LAST CASE"
@@ -18,72 +67,24 @@ class NoirDetectiveStory(Story):
         )
         self.starting_scene = "opening"
         self._build_story()
-        self._apply_scene_palettes()
     
-    def _apply_scene_palettes(self):
-        """Assign color palettes to scenes based on mood"""
-        overrides = {
-            "opening": "mystery",
-            "search_body": "alert",
-            "check_gun": "alert",
-            "run_away": "danger",
-            "castellano_meeting": "mystery",
-            "alley_fight": "danger",
-            "warehouse": "mystery",
-            "warehouse_with_eddie": "danger",
-            "warehouse_sneak": "mystery",
-            "velvet_room": "mystery",
-            "theater": "mystery",
-            "rodriguez": "calm",
-            "call_eddie": "calm",
-            "rodriguez_plan": "alert",
-            "solo_mission": "danger",
-            "warehouse_shootout_eddie": "danger",
-            "warehouse_evidence": "alert",
-            "velvet_room_with_eddie": "mystery",
-            "theater_reveal": "mystery",
-            "theater_fight": "danger",
-            "doctor_visit": "calm",
-            "escape_with_evidence": "calm",
-            "rodriguez_raid": "danger",
-            "chen_partnership": "alert",
-            "fbi_cooperation": "calm",
-            "warehouse_negotiation": "alert",
-            "warehouse_rush_guards": "danger",
-            "warehouse_wait": "alert",
-            "warehouse_front": "alert",
-            "warehouse_retreat": "alert",
-            "warehouse_skylight_attack": "danger",
-            "warehouse_shootout": "danger",
-            "warehouse_injured": "danger",
-            "escape_run": "danger",
-            "escape_with_rodriguez": "calm",
-            "morrison_confrontation": "danger",
-            "project_nightfall": "mystery",
-        }
-        keyword_map = [
-            ("danger", ["fight", "shoot", "shootout", "attack", "ambush", "raid", "gun", "fire", "blood", "kill", "execution", "burn", "bomb"]),
-            ("alert", ["search", "check", "investigate", "follow", "trail", "watch", "stake", "intercept", "trace", "surveil", "shadow", "pursuit", "chase"]),
-            ("calm", ["doctor", "safe", "ally", "friend", "eddie", "rodriguez", "chen", "partner", "home", "office", "c3", "safehouse"]),
-            ("mystery", ["warehouse", "velvet", "night", "project", "nightfall", "secret", "meeting", "intel", "evidence", "shadow", "conspiracy", "ritual", "mystery", "dark"]),
-        ]
-        
-        for scene_id, scene in self.scenes.items():
-            mood = overrides.get(scene_id)
-            if not mood:
-                lower_id = scene_id.lower()
-                for mood_name, keywords in keyword_map:
-                    if any(keyword in lower_id for keyword in keywords):
-                        mood = mood_name
-                        break
-            if not mood:
-                mood = "noir"
-            scene.palette = get_mood_palette(mood)
+    def scene_palette(self, scene_id):
+        """Pick a color palette for a scene based on mood"""
+        mood = self.PALETTE_OVERRIDES.get(scene_id)
+        if not mood:
+            lower_id = scene_id.lower()
+            for mood_name, keywords in self.PALETTE_KEYWORDS:
+                if any(keyword in lower_id for keyword in keywords):
+                    mood = mood_name
+                    break
+        if not mood:
+            mood = "noir"
+        return get_mood_palette(mood)
     
     def _build_story(self):
         """Build the complete story graph"""
         
-        self.scenes["opening"] = Scene(
+        self.scenes.declare("opening", lambda: Scene(
             id="opening",
             description=(
                 "The neon sign outside your office window flickers - 'MALONE INVESTIGATIONS'.\n"
@@ -103,9 +104,9 @@ class NoirDetectiveStory(Story):
                 Choice("Check your own gun - how many bullets fired?", "check_gun"),
                 Choice("Run. Get out while you still can.", "run_away")
             ]
-        )
+        ))
         
-        self.scenes["search_body"] = Scene(
+        self.scenes.declare("search_body", lambda: Scene(
             id="search_body",
             description=(
                 "You kneel beside the body, your hands steady despite everything.\n"
@@ -124,12 +125,9 @@ class NoirDetectiveStory(Story):
                 Choice("Visit the Ritz Theater - check out the connection", "theater"),
                 Choice("Take the evidence to Captain Rodriguez - he's clean", "rodriguez")
             ]
-        )
-        
-        def check_gun_enter(state):
-            state.set_flag("examined_gun")
+        ))
         
-        self.scenes["check_gun"] = Scene(
+        self.scenes.declare("check_gun", lambda: Scene(
             id="check_gun",
             description=(
                 "You pop the cylinder. Six chambers. Six bullets.\n"
@@ -141,15 +139,15 @@ class NoirDetectiveStory(Story):
                 ("JACK MALONE", "I've been played. Set up like a patsy."),
                 ("JACK MALONE", "But who? And why?")
             ],
-            on_enter=check_gun_enter,
+            on_enter=Effects([SetFlag("examined_gun")]),
             choices=[
                 Choice("Search the dame for clues", "search_body_after_gun"),
                 Choice("Check the office - maybe they're still here", "check_office"),
                 Choice("Call your old partner Eddie for help", "call_eddie")
             ]
-        )
+        ))
         
-        self.scenes["run_away"] = Scene(
+        self.scenes.declare("run_away", lambda: Scene(
             id="run_away",
             description=(
                 "You grab your coat and hat, heading for the fire escape.\n"
@@ -168,9 +166,9 @@ class NoirDetectiveStory(Story):
                 Choice("Fight your way out - three against one, you've had worse odds", "alley_fight"),
                 Choice("Tell them about the dame - claim you were set up", "blame_setup")
             ]
-        )
+        ))
         
-        self.scenes["search_body_after_gun"] = Scene(
+        self.scenes.declare("search_body_after_gun", lambda: Scene(
             id="search_body_after_gun",
             description=(
                 "The photograph tells you everything: Vincent Castellano, Police Chief Morrison,\n"
@@ -185,9 +183,9 @@ class NoirDetectiveStory(Story):
                 Choice("Head to Warehouse 47 - end this tonight", "warehouse"),
                 Choice("Find Eddie first - you need backup", "call_eddie"),
             ]
-        )
+        ))
         
-        self.scenes["check_office"] = Scene(
+        self.scenes.declare("check_office", lambda: Scene(
             id="check_office",
             description=(
                 "You move through your office like a ghost, checking corners, shadows.\n"
@@ -205,12 +203,9 @@ class NoirDetectiveStory(Story):
                 Choice("Search the dame for more clues first", "search_body_after_gun"),
                 Choice("Get out of town - this is above your pay grade", "leave_town")
             ]
-        )
+        ))
         
-        def call_eddie_enter(state):
-            state.set_flag("called_eddie")
-        
-        self.scenes["call_eddie"] = Scene(
+        self.scenes.declare("call_eddie", lambda: Scene(
             id="call_eddie",
             description=(
                 "You dial Eddie's number. Three rings.\n"
@@ -226,14 +221,14 @@ class NoirDetectiveStory(Story):
                 ("EDDIE", "I know. You're a lot of things, but you ain't a killer.\n          Not like this, anyway. We need to find who did."),
                 ("EDDIE", "I've been hearing things. Warehouse 47. Big meeting tonight.\n          Castellano, Morrison... maybe more. This dame was probably\n          insurance - proof for whoever wanted out.")
             ],
-            on_enter=call_eddie_enter,
+            on_enter=Effects([SetFlag("called_eddie")]),
             choices=[
                 Choice("Hit Warehouse 47 with Eddie - time to crash the party", "warehouse_with_eddie"),
                 Choice("Have Eddie watch your back while you visit the Velvet Room", "velvet_room_with_eddie"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse"] = Scene(
+        self.scenes.declare("warehouse", lambda: Scene(
             id="warehouse",
             description=(
                 "Warehouse 47 sits on the docks like a rotting tooth.\n"
@@ -250,9 +245,9 @@ class NoirDetectiveStory(Story):
                 Choice("Walk in the front door - surprise is a weapon too", "warehouse_front"),
                 Choice("Wait and follow whoever leaves first", "warehouse_wait"),
             ]
-        )
+        ))
         
-        self.scenes["theater"] = Scene(
+        self.scenes.declare("theater", lambda: Scene(
             id="theater",
             description=(
                 "The Ritz Theater is dark except for the exit signs.\n"
@@ -270,12 +265,9 @@ class NoirDetectiveStory(Story):
                 Choice("Spin and draw your gun", "theater_fight"),
                 Choice("Stay calm - 'Who's there?'", "theater_reveal"),
             ]
-        )
-        
-        def rodriguez_enter(state):
-            state.set_flag("went_to_rodriguez")
+        ))
         
-        self.scenes["rodriguez"] = Scene(
+        self.scenes.declare("rodriguez", lambda: Scene(
             id="rodriguez",
             description=(
                 "Captain Rodriguez looks at the photograph, his face unreadable.\n"
@@ -290,14 +282,14 @@ class NoirDetectiveStory(Story):
                 ("RODRIGUEZ", "Now we have proof. And now you're a murder suspect.\n              They played this smart - take you off the board, silence\n              their leak, all in one move."),
                 ("RODRIGUEZ", "I can protect you, Jack. But we need to move fast.\n              There's a meeting tonight. Warehouse 47. All the players\n              will be there.")
             ],
-            on_enter=rodriguez_enter,
+            on_enter=Effects([SetFlag("went_to_rodriguez")]),
             choices=[
                 Choice("Trust Rodriguez - let him handle this officially", "rodriguez_plan"),
                 Choice("Take the evidence and do this your way", "solo_mission"),
             ]
-        )
+        ))
         
-        self.scenes["castellano_meeting"] = Scene(
+        self.scenes.declare("castellano_meeting", lambda: Scene(
             id="castellano_meeting",
             description=(
                 "They drive you to the Velvet Room. Vincent Castellano sits in a\n"
@@ -315,9 +307,9 @@ class NoirDetectiveStory(Story):
                 Choice("'Why tell me?' - keep him talking", "castellano_reveal"),
                 Choice("Go for your gun - end this now", "castellano_shootout"),
             ]
-        )
+        ))
         
-        self.scenes["alley_fight"] = Scene(
+        self.scenes.declare("alley_fight", lambda: Scene(
             id="alley_fight",
             description=(
                 "You throw the first punch. Tony's nose breaks with a satisfying crunch.\n"
@@ -334,9 +326,9 @@ class NoirDetectiveStory(Story):
                 Choice("Head to Warehouse 47 - finish this tonight", "warehouse_injured"),
                 Choice("Find a doctor you can trust - you won't survive much more bleeding", "doctor_visit"),
             ]
-        )
+        ))
         
-        self.scenes["blame_setup"] = Scene(
+        self.scenes.declare("blame_setup", lambda: Scene(
             id="blame_setup",
             description=(
                 "'Your boss wanted me to take the fall for a murder I didn't commit.\n"
@@ -352,9 +344,9 @@ class NoirDetectiveStory(Story):
                 Choice("Get in the car - meet Castellano", "castellano_meeting"),
                 Choice("Make a break for it - run while they're confused", "escape_run"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_with_eddie"] = Scene(
+        self.scenes.declare("warehouse_with_eddie", lambda: Scene(
             id="warehouse_with_eddie",
             description=(
                 "You and Eddie approach Warehouse 47 like the old days.\n"
@@ -372,9 +364,9 @@ class NoirDetectiveStory(Story):
                 Choice("Drop in guns blazing - citizen's arrest", "warehouse_shootout_eddie"),
                 Choice("Record everything and get out - build a real case", "warehouse_evidence"),
             ]
-        )
+        ))
         
-        self.scenes["velvet_room_with_eddie"] = Scene(
+        self.scenes.declare("velvet_room_with_eddie", lambda: Scene(
             id="velvet_room_with_eddie",
             description=(
                 "The Velvet Room is packed. Jazz plays soft and low.\n"
@@ -391,9 +383,9 @@ class NoirDetectiveStory(Story):
                 Choice("Confront Morrison - end this face to face", "morrison_confrontation"),
                 Choice("Slip out with the evidence - let the law handle it", "escape_with_evidence"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_sneak"] = Scene(
+        self.scenes.declare("warehouse_sneak", lambda: Scene(
             id="warehouse_sneak",
             description=(
                 "The skylight gives you a perfect view. You listen as they discuss\n"
@@ -411,9 +403,9 @@ class NoirDetectiveStory(Story):
                 Choice("Crash through the skylight - surprise attack", "warehouse_skylight_attack"),
                 Choice("Back out slowly and regroup - you're outgunned", "warehouse_retreat"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_front"] = Scene(
+        self.scenes.declare("warehouse_front", lambda: Scene(
             id="warehouse_front",
             description=(
                 "You walk up to the front door and knock. The guards look at you\n"
@@ -429,9 +421,9 @@ class NoirDetectiveStory(Story):
                 Choice("Wait to be let in - play this cool", "warehouse_negotiation"),
                 Choice("The guards are distracted - rush them", "warehouse_rush_guards"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_wait"] = Scene(
+        self.scenes.declare("warehouse_wait", lambda: Scene(
             id="warehouse_wait",
             description=(
                 "Patience is a virtue in your line of work. You wait in the rain,\n"
@@ -446,9 +438,9 @@ class NoirDetectiveStory(Story):
                 Choice("Confront Morrison in the street", "street_confrontation"),
                 Choice("Follow him to his destination", "follow_morrison"),
             ]
-        )
+        ))
         
-        self.scenes["theater_fight"] = Scene(
+        self.scenes.declare("theater_fight", lambda: Scene(
             id="theater_fight",
             description=(
                 "You spin, gun drawn. The shot echoes through the empty theater.\n"
@@ -466,9 +458,9 @@ class NoirDetectiveStory(Story):
                 Choice("Turn yourself in - it was self defense", "turn_self_in"),
                 Choice("Run - you're in too deep now", "run_from_fbi"),
             ]
-        )
+        ))
         
-        self.scenes["theater_reveal"] = Scene(
+        self.scenes.declare("theater_reveal", lambda: Scene(
             id="theater_reveal",
             description=(
                 "The figure steps into the dim light. FBI Special Agent Sarah Chen.\n"
@@ -485,9 +477,9 @@ class NoirDetectiveStory(Story):
                 Choice("Trust the FBI - let them handle it", "fbi_cooperation"),
                 Choice("Partner with Chen - end it tonight at the warehouse", "chen_partnership"),
             ]
-        )
+        ))
         
-        self.scenes["rodriguez_plan"] = Scene(
+        self.scenes.declare("rodriguez_plan", lambda: Scene(
             id="rodriguez_plan",
             description=(
                 "Rodriguez works the phones. Within an hour, he's assembled a team\n"
@@ -502,9 +494,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Raid Warehouse 47 - the right way", "rodriguez_raid"),
             ]
-        )
+        ))
         
-        self.scenes["solo_mission"] = Scene(
+        self.scenes.declare("solo_mission", lambda: Scene(
             id="solo_mission",
             description=(
                 "You take the evidence and walk out of Rodriguez's office.\n"
@@ -518,9 +510,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Attack the warehouse - no backup, no plan, just justice", "solo_warehouse_attack"),
             ]
-        )
+        ))
         
-        self.scenes["castellano_reveal"] = Scene(
+        self.scenes.declare("castellano_reveal", lambda: Scene(
             id="castellano_reveal",
             description=(
                 "Castellano leans back, lighting a cigar.\n\n"
@@ -537,9 +529,9 @@ class NoirDetectiveStory(Story):
                 Choice("Accept the deal - enemy of my enemy", "castellano_alliance"),
                 Choice("Refuse - 'I don't work with killers'", "refuse_castellano"),
             ]
-        )
+        ))
         
-        self.scenes["castellano_shootout"] = Scene(
+        self.scenes.declare("castellano_shootout", lambda: Scene(
             id="castellano_shootout",
             description=(
                 "Your hand moves for your gun. Castellano's guards are faster.\n"
@@ -552,9 +544,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("...", "ending_killed_by_castellano"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_injured"] = Scene(
+        self.scenes.declare("warehouse_injured", lambda: Scene(
             id="warehouse_injured",
             description=(
                 "You stagger to Warehouse 47, leaving a trail of blood.\n"
@@ -569,9 +561,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Enter the warehouse - last gambit", "warehouse_wounded_entry"),
             ]
-        )
+        ))
         
-        self.scenes["doctor_visit"] = Scene(
+        self.scenes.declare("doctor_visit", lambda: Scene(
             id="doctor_visit",
             description=(
                 "Doc Stevens doesn't ask questions anymore. He patches you up,\n"
@@ -587,9 +579,9 @@ class NoirDetectiveStory(Story):
                 Choice("Head to Warehouse 47 - time to end this", "warehouse"),
                 Choice("Investigate the Velvet Room instead", "velvet_room"),
             ]
-        )
+        ))
         
-        self.scenes["escape_run"] = Scene(
+        self.scenes.declare("escape_run", lambda: Scene(
             id="escape_run",
             description=(
                 "You bolt. Tony shouts, but you're already around the corner.\n"
@@ -604,9 +596,9 @@ class NoirDetectiveStory(Story):
                 Choice("Go to ground at Eddie's place - need backup", "call_eddie"),
                 Choice("Hit Warehouse 47 before they expect it", "warehouse"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_shootout_eddie"] = Scene(
+        self.scenes.declare("warehouse_shootout_eddie", lambda: Scene(
             id="warehouse_shootout_eddie",
             description=(
                 "You drop through the skylight, gun blazing. Eddie kicks in the back door.\n"
@@ -622,9 +614,9 @@ class NoirDetectiveStory(Story):
                 Choice("Take cover and return fire", "shootout_tactical"),
                 Choice("Charge Blackwood - end this fast", "charge_blackwood"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_evidence"] = Scene(
+        self.scenes.declare("warehouse_evidence", lambda: Scene(
             id="warehouse_evidence",
             description=(
                 "Eddie has it all on tape. Video, audio, everything.\n"
@@ -641,9 +633,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_evidence_victory"),
             ]
-        )
+        ))
         
-        self.scenes["morrison_confrontation"] = Scene(
+        self.scenes.declare("morrison_confrontation", lambda: Scene(
             id="morrison_confrontation",
             description=(
                 "You step out of the office as Morrison rounds the corner.\n"
@@ -658,9 +650,9 @@ class NoirDetectiveStory(Story):
                 Choice("Arrest Morrison at gunpoint", "arrest_morrison"),
                 Choice("Shoot first, ask questions never", "shoot_morrison"),
             ]
-        )
+        ))
         
-        self.scenes["escape_with_evidence"] = Scene(
+        self.scenes.declare("escape_with_evidence", lambda: Scene(
             id="escape_with_evidence",
             description=(
                 "You and Eddie vanish into the night with the ledger.\n"
@@ -676,9 +668,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_silent_victory"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_skylight_attack"] = Scene(
+        self.scenes.declare("warehouse_skylight_attack", lambda: Scene(
             id="warehouse_skylight_attack",
             description=(
                 "Glass shatters. You drop into hell.\n"
@@ -693,9 +685,9 @@ class NoirDetectiveStory(Story):
                 Choice("Dive for cover", "dive_cover"),
                 Choice("Take the shot at Blackwood", "shoot_blackwood"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_retreat"] = Scene(
+        self.scenes.declare("warehouse_retreat", lambda: Scene(
             id="warehouse_retreat",
             description=(
                 "You back away slowly. Sometimes living to fight another day is the only win.\n\n"
@@ -710,9 +702,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_smart_play"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_negotiation"] = Scene(
+        self.scenes.declare("warehouse_negotiation", lambda: Scene(
             id="warehouse_negotiation",
             description=(
                 "They let you in. Castellano, Morrison, and Blackwood sit at a table\n"
@@ -727,9 +719,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Wait for their response", "negotiation_response"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_rush_guards"] = Scene(
+        self.scenes.declare("warehouse_rush_guards", lambda: Scene(
             id="warehouse_rush_guards",
             description=(
                 "You're fast. The first guard goes down with a broken jaw.\n"
@@ -743,9 +735,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Fight your way to the meeting room", "warehouse_combat"),
             ]
-        )
+        ))
         
-        self.scenes["street_confrontation"] = Scene(
+        self.scenes.declare("street_confrontation", lambda: Scene(
             id="street_confrontation",
             description=(
                 "You step out of the shadows, gun drawn.\n"
@@ -761,9 +753,9 @@ class NoirDetectiveStory(Story):
                 Choice("Take the briefcase", "take_briefcase"),
                 Choice("Let Morrison go - follow the bigger fish", "let_morrison_go"),
             ]
-        )
+        ))
         
-        self.scenes["follow_morrison"] = Scene(
+        self.scenes.declare("follow_morrison", lambda: Scene(
             id="follow_morrison",
             description=(
                 "Morrison leads you to a train station. He's leaving town.\n"
@@ -778,9 +770,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Use Morrison's evidence to end this", "morrison_evidence_ending"),
             ]
-        )
+        ))
         
-        self.scenes["turn_self_in"] = Scene(
+        self.scenes.declare("turn_self_in", lambda: Scene(
             id="turn_self_in",
             description=(
                 "You call Rodriguez. Tell him everything.\n"
@@ -795,9 +787,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_guilty_conscience"),
             ]
-        )
+        ))
         
-        self.scenes["run_from_fbi"] = Scene(
+        self.scenes.declare("run_from_fbi", lambda: Scene(
             id="run_from_fbi",
             description=(
                 "You run. Mexico first, then further south.\n"
@@ -812,9 +804,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_exile"),
             ]
-        )
+        ))
         
-        self.scenes["fbi_cooperation"] = Scene(
+        self.scenes.declare("fbi_cooperation", lambda: Scene(
             id="fbi_cooperation",
             description=(
                 "You trust Agent Chen. She brings in her team.\n"
@@ -831,9 +823,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_fbi_victory"),
             ]
-        )
+        ))
         
-        self.scenes["chen_partnership"] = Scene(
+        self.scenes.declare("chen_partnership", lambda: Scene(
             id="chen_partnership",
             description=(
                 "You and Chen approach Warehouse 47 together.\n"
@@ -850,9 +842,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_partnership_success"),
             ]
-        )
+        ))
         
-        self.scenes["rodriguez_raid"] = Scene(
+        self.scenes.declare("rodriguez_raid", lambda: Scene(
             id="rodriguez_raid",
             description=(
                 "The raid is by the book. Rodriguez's team hits the warehouse hard.\n"
@@ -868,9 +860,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_by_the_book"),
             ]
-        )
+        ))
         
-        self.scenes["solo_warehouse_attack"] = Scene(
+        self.scenes.declare("solo_warehouse_attack", lambda: Scene(
             id="solo_warehouse_attack",
             description=(
                 "You walk into Warehouse 47 like it's your office.\n"
@@ -889,9 +881,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_lone_wolf_victory"),
             ]
-        )
+        ))
         
-        self.scenes["castellano_alliance"] = Scene(
+        self.scenes.declare("castellano_alliance", lambda: Scene(
             id="castellano_alliance",
             description=(
                 "You shake hands with the devil.\n"
@@ -912,9 +904,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_deal_with_devil"),
             ]
-        )
+        ))
         
-        self.scenes["refuse_castellano"] = Scene(
+        self.scenes.declare("refuse_castellano", lambda: Scene(
             id="refuse_castellano",
             description=(
                 "'I don't work with killers.'\n"
@@ -927,9 +919,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("...", "ending_died_with_honor"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_wounded_entry"] = Scene(
+        self.scenes.declare("warehouse_wounded_entry", lambda: Scene(
             id="warehouse_wounded_entry",
             description=(
                 "They take you inside. You're leaving a blood trail.\n"
@@ -943,9 +935,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("'There he is. The man behind the curtain.'", "final_confrontation_wounded"),
             ]
-        )
+        ))
         
-        self.scenes["velvet_room"] = Scene(
+        self.scenes.declare("velvet_room", lambda: Scene(
             id="velvet_room",
             description=(
                 "The Velvet Room is all red velvet and dim lights.\n"
@@ -963,9 +955,9 @@ class NoirDetectiveStory(Story):
                 Choice("Hear him out", "castellano_reveal"),
                 Choice("This is a trap - get out", "velvet_room_escape"),
             ]
-        )
+        ))
         
-        self.scenes["shootout_tactical"] = Scene(
+        self.scenes.declare("shootout_tactical", lambda: Scene(
             id="shootout_tactical",
             description=(
                 "You take cover behind steel crates. Eddie flanks right.\n"
@@ -981,9 +973,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_tactical_victory"),
             ]
-        )
+        ))
         
-        self.scenes["charge_blackwood"] = Scene(
+        self.scenes.declare("charge_blackwood", lambda: Scene(
             id="charge_blackwood",
             description=(
                 "You charge. The energy beam catches you in the shoulder.\n"
@@ -1000,9 +992,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_heroic_victory"),
             ]
-        )
+        ))
         
-        self.scenes["arrest_morrison"] = Scene(
+        self.scenes.declare("arrest_morrison", lambda: Scene(
             id="arrest_morrison",
             description=(
                 "You hold Morrison at gunpoint while Eddie calls Rodriguez.\n"
@@ -1016,9 +1008,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_justice_served"),
             ]
-        )
+        ))
         
-        self.scenes["shoot_morrison"] = Scene(
+        self.scenes.declare("shoot_morrison", lambda: Scene(
             id="shoot_morrison",
             description=(
                 "You pull the trigger. Morrison drops.\n"
@@ -1032,9 +1024,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_dark_justice"),
             ]
-        )
+        ))
         
-        self.scenes["dive_cover"] = Scene(
+        self.scenes.declare("dive_cover", lambda: Scene(
             id="dive_cover",
             description=(
                 "The energy beam passes over your head. You roll, fire twice.\n"
@@ -1049,9 +1041,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_survivor"),
             ]
-        )
+        ))
         
-        self.scenes["shoot_blackwood"] = Scene(
+        self.scenes.declare("shoot_blackwood", lambda: Scene(
             id="shoot_blackwood",
             description=(
                 "You take the shot. The bullet catches Blackwood in the throat.\n"
@@ -1066,9 +1058,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_quick_draw"),
             ]
-        )
+        ))
         
-        self.scenes["negotiation_response"] = Scene(
+        self.scenes.declare("negotiation_response", lambda: Scene(
             id="negotiation_response",
             description=(
                 "Blackwood laughs. It's not a pleasant sound.\n"
@@ -1084,9 +1076,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("...", "ending_bad_bluff"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_combat"] = Scene(
+        self.scenes.declare("warehouse_combat", lambda: Scene(
             id="warehouse_combat",
             description=(
                 "You fight through the warehouse like a one-man army.\n"
@@ -1101,9 +1093,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Finish it", "warehouse_final_showdown"),
             ]
-        )
+        ))
         
-        self.scenes["take_briefcase"] = Scene(
+        self.scenes.declare("take_briefcase", lambda: Scene(
             id="take_briefcase",
             description=(
                 "You take the briefcase. Morrison doesn't resist.\n"
@@ -1119,9 +1111,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Use the evidence", "morrison_evidence_ending"),
             ]
-        )
+        ))
         
-        self.scenes["let_morrison_go"] = Scene(
+        self.scenes.declare("let_morrison_go", lambda: Scene(
             id="let_morrison_go",
             description=(
                 "You let Morrison go. He's not the real villain here.\n"
@@ -1132,9 +1124,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("Attack the warehouse", "solo_warehouse_attack"),
             ]
-        )
+        ))
         
-        self.scenes["morrison_evidence_ending"] = Scene(
+        self.scenes.declare("morrison_evidence_ending", lambda: Scene(
             id="morrison_evidence_ending",
             description=(
                 "Morrison's evidence is devastating. You leak it to every news outlet.\n"
@@ -1149,9 +1141,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_evidence_endgame"),
             ]
-        )
+        ))
         
-        self.scenes["final_confrontation_wounded"] = Scene(
+        self.scenes.declare("final_confrontation_wounded", lambda: Scene(
             id="final_confrontation_wounded",
             description=(
                 "Blackwood draws his weapon. You draw yours.\n"
@@ -1168,9 +1160,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_pyrrhic_victory"),
             ]
-        )
+        ))
         
-        self.scenes["velvet_room_escape"] = Scene(
+        self.scenes.declare("velvet_room_escape", lambda: Scene(
             id="velvet_room_escape",
             description=(
                 "You back toward the door. Castellano doesn't stop you.\n"
@@ -1185,9 +1177,9 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_smart_escape"),
             ]
-        )
+        ))
         
-        self.scenes["warehouse_final_showdown"] = Scene(
+        self.scenes.declare("warehouse_final_showdown", lambda: Scene(
             id="warehouse_final_showdown",
             description=(
                 "The fight is quick and brutal. You're wounded, exhausted, running on empty.\n"
@@ -1202,15 +1194,15 @@ class NoirDetectiveStory(Story):
             choices=[
                 Choice("The End", "ending_final_showdown_victory"),
             ]
-        )
+        ))
         
-        self.scenes["ending_killed_by_castellano"] = Scene(
+        self.scenes.declare("ending_killed_by_castellano", lambda: Scene(
             id="ending_killed_by_castellano",
             description="You died trying to fight the mob. Brave, but stupid.",
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_evidence_victory"] = Scene(
+        self.scenes.declare("ending_evidence_victory", lambda: Scene(
             id="ending_evidence_victory",
             description=(
                 "You brought down the conspiracy with evidence and patience.\n"
@@ -1218,9 +1210,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE EVIDENCE SPEAKS"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_silent_victory"] = Scene(
+        self.scenes.declare("ending_silent_victory", lambda: Scene(
             id="ending_silent_victory",
             description=(
                 "You operated from the shadows and brought down the corrupt system.\n"
@@ -1228,9 +1220,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE SILENT GUARDIAN"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_smart_play"] = Scene(
+        self.scenes.declare("ending_smart_play", lambda: Scene(
             id="ending_smart_play",
             description=(
                 "You made the smart choice and lived to tell about it.\n"
@@ -1238,9 +1230,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: WISDOM OVER VALOR"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_guilty_conscience"] = Scene(
+        self.scenes.declare("ending_guilty_conscience", lambda: Scene(
             id="ending_guilty_conscience",
             description=(
                 "You're cleared of all charges, but the weight of the deaths stays with you.\n"
@@ -1248,9 +1240,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE BURDEN OF TRUTH"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_exile"] = Scene(
+        self.scenes.declare("ending_exile", lambda: Scene(
             id="ending_exile",
             description=(
                 "You exposed the conspiracy but lost everything in the process.\n"
@@ -1258,9 +1250,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE PRICE OF JUSTICE"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_fbi_victory"] = Scene(
+        self.scenes.declare("ending_fbi_victory", lambda: Scene(
             id="ending_fbi_victory",
             description=(
                 "By working with the FBI, you brought down Project Nightfall officially.\n"
@@ -1268,9 +1260,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: BY THE BOOK"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_partnership_success"] = Scene(
+        self.scenes.declare("ending_partnership_success", lambda: Scene(
             id="ending_partnership_success",
             description=(
                 "You and Agent Chen made a great team. The conspiracy is destroyed,\n"
@@ -1278,9 +1270,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: UNLIKELY ALLIES"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_by_the_book"] = Scene(
+        self.scenes.declare("ending_by_the_book", lambda: Scene(
             id="ending_by_the_book",
             description=(
                 "Rodriguez led a clean operation. Everything by the book.\n"
@@ -1288,9 +1280,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: PROPER PROCEDURE"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_lone_wolf_victory"] = Scene(
+        self.scenes.declare("ending_lone_wolf_victory", lambda: Scene(
             id="ending_lone_wolf_victory",
             description=(
                 "You took on the entire conspiracy alone and won.\n"
@@ -1298,9 +1290,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE LONE WOLF"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_deal_with_devil"] = Scene(
+        self.scenes.declare("ending_deal_with_devil", lambda: Scene(
             id="ending_deal_with_devil",
             description=(
                 "You made a deal with a monster to catch a bigger monster.\n"
@@ -1308,9 +1300,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: DEAL WITH THE DEVIL"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_died_with_honor"] = Scene(
+        self.scenes.declare("ending_died_with_honor", lambda: Scene(
             id="ending_died_with_honor",
             description=(
                 "You refused to compromise your principles, even at the cost of your life.\n"
@@ -1318,9 +1310,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: DIED WITH HONOR"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_tactical_victory"] = Scene(
+        self.scenes.declare("ending_tactical_victory", lambda: Scene(
             id="ending_tactical_victory",
             description=(
                 "You and Eddie executed a perfect tactical operation.\n"
@@ -1328,9 +1320,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: TACTICAL PERFECTION"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_heroic_victory"] = Scene(
+        self.scenes.declare("ending_heroic_victory", lambda: Scene(
             id="ending_heroic_victory",
             description=(
                 "You charged into danger and emerged victorious despite your wounds.\n"
@@ -1338,9 +1330,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: HEROIC SACRIFICE"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_justice_served"] = Scene(
+        self.scenes.declare("ending_justice_served", lambda: Scene(
             id="ending_justice_served",
             description=(
                 "By arresting Morrison and securing his testimony, you brought down\n"
@@ -1348,9 +1340,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: JUSTICE SERVED"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_dark_justice"] = Scene(
+        self.scenes.declare("ending_dark_justice", lambda: Scene(
             id="ending_dark_justice",
             description=(
                 "You executed Morrison rather than let him face trial.\n"
@@ -1358,9 +1350,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: DARK JUSTICE"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_survivor"] = Scene(
+        self.scenes.declare("ending_survivor", lambda: Scene(
             id="ending_survivor",
             description=(
                 "Through skill and luck, you survived impossible odds.\n"
@@ -1368,9 +1360,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE SURVIVOR"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_quick_draw"] = Scene(
+        self.scenes.declare("ending_quick_draw", lambda: Scene(
             id="ending_quick_draw",
             description=(
                 "One perfect shot ended it all. Clean, quick, effective.\n"
@@ -1378,9 +1370,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE QUICK DRAW"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_bad_bluff"] = Scene(
+        self.scenes.declare("ending_bad_bluff", lambda: Scene(
             id="ending_bad_bluff",
             description=(
                 "Your bluff failed. Blackwood called it.\n"
@@ -1388,9 +1380,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: BAD BLUFF"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_evidence_endgame"] = Scene(
+        self.scenes.declare("ending_evidence_endgame", lambda: Scene(
             id="ending_evidence_endgame",
             description=(
                 "Morrison's evidence proved devastating to the conspiracy.\n"
@@ -1398,9 +1390,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE EVIDENCE ENDGAME"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_pyrrhic_victory"] = Scene(
+        self.scenes.declare("ending_pyrrhic_victory", lambda: Scene(
             id="ending_pyrrhic_victory",
             description=(
                 "You survived by letting the villains destroy each other.\n"
@@ -1408,9 +1400,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: PYRRHIC VICTORY"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_smart_escape"] = Scene(
+        self.scenes.declare("ending_smart_escape", lambda: Scene(
             id="ending_smart_escape",
             description=(
                 "You walked away when it mattered, then struck from a position of strength.\n"
@@ -1418,9 +1410,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE SMART ESCAPE"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["ending_final_showdown_victory"] = Scene(
+        self.scenes.declare("ending_final_showdown_victory", lambda: Scene(
             id="ending_final_showdown_victory",
             description=(
                 "Despite overwhelming odds, you stormed the warehouse and won.\n"
@@ -1428,9 +1420,9 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE FINAL SHOWDOWN"
             ),
             is_ending=True
-        )
+        ))
         
-        self.scenes["leave_town"] = Scene(
+        self.scenes.declare("leave_town", lambda: Scene(
             id="leave_town",
             description=(
                 "You pack a bag. One suitcase, one gun, and all the cash you can carry.\n"
@@ -1444,4 +1436,4 @@ class NoirDetectiveStory(Story):
                 "ENDING: THE COWARD'S EXIT"
             ),
             is_ending=True
-        )
+        ))
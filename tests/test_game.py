@@ -8,7 +8,10 @@ import tempfile
 from engine.story import Story, Scene, Choice, GameState
 from engine.renderer import TerminalRenderer
 from engine.animation import AnimationLibrary
+from engine.headless import (CoveragePolicy, FirstAvailablePolicy, HeadlessError,
+                             HeadlessGame, RandomPolicy, ScriptedPolicy)
 from engine.save_manager import SaveManager
+from stories.blood_and_neon import BloodAndNeonStory
 from stories.noir_detective import NoirDetectiveStory
 
 
@@ -150,6 +153,50 @@ def test_save_load_system():
         print("✓ Save/load system works")
 
 
+def test_headless_game():
+    """Headless games play the real loop to an ending with every policy"""
+    print("Testing headless playthroughs...")
+    story = NoirDetectiveStory()
+    opening = story.get_scene("opening")
+    first_text = story.get_available_choices(opening)[0].text
+
+    with HeadlessGame(NoirDetectiveStory(), ScriptedPolicy([first_text],
+                                                           then=FirstAvailablePolicy())) as game:
+        report = game.run(2)
+        assert report.runs == 2 and report.unfinished == 0
+        assert len(report.endings) == 1, "Scripted runs diverged"
+        assert report.autosaves > 0 and report.autosaves_failed == 0
+        saved = game.save_manager.load_game(SaveManager.AUTOSAVE_SLOT)
+        assert saved["choice_history"][0][2] == first_text
+        assert report.scenes_per_second > 0
+
+    # A history window bounds the choices each playthrough keeps in memory
+    with HeadlessGame(NoirDetectiveStory(), RandomPolicy(seed=3), history_window=1) as game:
+        game.play()
+        history = game.story.state.choice_history
+        assert history.spilled > 0 and len(history) - history.spilled <= 2
+
+    for story_class in (NoirDetectiveStory, BloodAndNeonStory):
+        with HeadlessGame(story_class(), RandomPolicy(seed=7)) as game:
+            first = game.run(20).endings
+        with HeadlessGame(story_class(), RandomPolicy(seed=7)) as game:
+            assert game.run(20).endings == first, "Seeded runs are not reproducible"
+
+    with HeadlessGame(NoirDetectiveStory(), RandomPolicy(seed=1)) as game:
+        random_endings = len(game.run(40).endings)
+    with HeadlessGame(NoirDetectiveStory(), CoveragePolicy(seed=1)) as game:
+        coverage_endings = len(game.run(40).endings)
+    assert coverage_endings >= random_endings, "Coverage policy explores less than random"
+
+    with HeadlessGame(NoirDetectiveStory(), ScriptedPolicy([])) as game:
+        try:
+            game.play()
+            assert False, "Exhausted script did not raise"
+        except HeadlessError:
+            pass
+    print("✓ Headless games work")
+
+
 def count_scenes_and_choices():
     """Count total scenes and choice points"""
     print("\nStory Statistics:")
@@ -178,6 +225,7 @@ def main():
         test_renderer()
         test_animations()
         test_save_load_system()
+        test_headless_game()
         count_scenes_and_choices()
         
         print("\n" + "=" * 60)
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 """Comprehensive test of the opening sequence features"""
 
+import io
+import os
+import select
 import sys
+import threading
+import time
+
+from rich.console import Console
+
+from engine.clock import AcceleratedClock, RealClock
+from engine.input_dispatcher import InputDispatcher
 from engine.opening import OpeningSequence, SimpleOpening, StoryOption, OpeningResult, MenuOption, CinematicFrame
 from engine.settings import GameSettings
 from stories.noir_detective import NoirDetectiveStory
@@ -147,6 +157,61 @@ def test_opening_sequence_init():
         print(f"✗ OpeningSequence initialization failed: {e}")
 
 
+def test_input_dispatcher():
+    """One reader thread serves every screen, waking them the moment a key arrives"""
+    print("Testing input dispatcher...")
+    not_a_terminal = InputDispatcher()
+    if not not_a_terminal.enabled:
+        with not_a_terminal.subscribe() as keys:
+            assert keys.get(timeout=0) == "ENTER", "Without a terminal keys should read ENTER"
+    if os.name == "nt":
+        print("✓ Input dispatcher works (no pseudo-terminal on this platform)")
+        return
+
+    master, slave = os.openpty()
+    saved_stdin = sys.stdin
+    sys.stdin = os.fdopen(slave, "r")
+    dispatcher = InputDispatcher()
+    try:
+        assert dispatcher.enabled
+        with dispatcher.subscribe() as menu:
+            os.write(master, b"\x1b[Aq")
+            assert menu.get(timeout=2.0) == "UP"
+            assert menu.get(timeout=2.0) == "q"
+            with dispatcher.subscribe() as cinematic:
+                os.write(master, b" ")
+                assert cinematic.get(timeout=2.0) == " "
+            assert menu.get(timeout=0.05) is None, "Key went to an older subscriber"
+            thread = dispatcher._thread
+
+        # Unsubscribed: input is left for input() prompts
+        os.write(master, b"z\n")  # Back in line mode, so it takes a newline
+        assert select.select([slave], [], [], 2.0)[0] and os.read(slave, 2) == b"z\n"
+
+        opening = OpeningSequence(settings=GameSettings(), stories=[], clock=RealClock(),
+                                  input_dispatcher=dispatcher)
+        opening.console = Console(file=io.StringIO(), width=100, height=40)
+        threading.Timer(0.05, os.write, (master, b"x")).start()
+        started = time.perf_counter()
+        opening._wait_for_any_key()
+        waited = time.perf_counter() - started
+        assert waited < 0.4, f"Key press took {waited:.2f}s to notice"
+
+        opening.clock = AcceleratedClock(10)
+        threading.Timer(0.1, os.write, (master, b"x")).start()
+        started = time.perf_counter()
+        opening._play_cinematic()
+        assert time.perf_counter() - started < 0.5, "Cinematic was not skipped"
+        assert "Cinematic skipped" in opening.console.file.getvalue()
+        assert dispatcher._thread is thread, "Reader thread was replaced"
+    finally:
+        dispatcher.close()
+        sys.stdin.close()
+        sys.stdin = saved_stdin
+        os.close(master)
+    print(f"✓ Input dispatcher works (key sent at 50 ms, woke at {waited * 1000:.0f} ms)")
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -162,6 +227,7 @@ def main():
         test_opening_result,
         test_opening_sequence_constants,
         test_opening_sequence_init,
+        test_input_dispatcher,
     ]
     
     passed = 0
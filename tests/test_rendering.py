@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Tests for the rendering pipeline (typewriter, frames, screen clearing)
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from threading import Event
+
+from rich.console import Console
+
+from engine.animation import Animation, FrameScheduler
+from engine.clock import AcceleratedClock, VirtualClock, clock_from_spec
+from engine.colors import VisualEffects
+from engine.frame_diff import CLEAR_SCREEN, DiffFrameRenderer
+from engine.game import Game
+from engine.input_dispatcher import InputDispatcher, SkipListener
+from engine.renderer import TerminalRenderer
+from engine.story import Scene, Story
+from engine.terminal import TerminalCapabilities, probe_terminal
+from engine.typewriter import Typewriter
+
+
+class FakeClock:
+    """Manually advanced clock so timing tests run instantly"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, text):
+        self.write_calls += 1
+        return super().write(text)
+
+
+def test_typewriter_split_units():
+    """Escape codes are attached to the glyph that follows them"""
+    print("Testing typewriter unit splitting...")
+    units = Typewriter.split_units("\x1b[1mab\x1b[0m")
+    assert units == ["\x1b[1ma", "b\x1b[0m"], units
+    assert Typewriter.split_units("plain") == list("plain")
+    print("✓ Units split correctly")
+
+
+def test_typewriter_styled_output_matches_rich():
+    """Pre-rendered output is identical to a single Rich print"""
+    print("Testing typewriter styled output...")
+    console = Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=80)
+    reference = Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=80)
+    from rich.text import Text
+    reference.print(Text("Rain on neon.", style="#b0b0b0", end=""), end="")
+
+    Typewriter().type_text("Rain on neon.", 0.0, style="#b0b0b0", console=console)
+    assert console.file.getvalue() == reference.file.getvalue()
+    print("✓ Styled output matches Rich rendering")
+
+
+def test_typewriter_batches_writes():
+    """Characters are written in frame-sized batches without drift"""
+    print("Testing typewriter batching...")
+    clock = FakeClock()
+    stream = CountingStream()
+    typewriter = Typewriter(fps=50, clock=clock, sleep=clock.sleep)
+
+    text = "x" * 200
+    stats = typewriter.type_text(text, 0.001, stream=stream)
+
+    assert stream.getvalue() == text
+    # 200 chars at 1ms each is 0.2s; at 50 fps that is ~10 writes, not 200
+    assert stream.write_calls <= 12, stream.write_calls
+    assert stats.writes == stream.write_calls
+    assert abs(stats.drift) < 0.021, stats.drift
+    print(f"✓ {len(text)} characters written in {stats.writes} writes")
+
+
+def test_typewriter_zero_delay():
+    """Zero delay writes everything at once"""
+    print("Testing instant typewriter...")
+    stream = CountingStream()
+    Typewriter().type_text("instant", 0.0, stream=stream)
+    assert stream.getvalue() == "instant"
+    assert stream.write_calls == 1
+    print("✓ Instant output uses a single write")
+
+
+def test_frame_scheduler_keeps_wall_time():
+    """Render time is absorbed into the frame period"""
+    print("Testing frame scheduler timing...")
+    clock = FakeClock()
+    drawn = []
+
+    def slow_draw(frame):
+        drawn.append(frame)
+        clock.now += 0.03  # each frame takes 30ms to render
+
+    scheduler = FrameScheduler(0.1, clock=clock, sleep=clock.sleep)
+    stats = scheduler.run(list(range(10)), slow_draw)
+
+    assert drawn == list(range(10))
+    assert stats.frames_dropped == 0
+    assert abs(stats.elapsed - 1.0) < 1e-9, stats.elapsed
+    assert abs(stats.achieved_fps - 10.0) < 1e-6
+    print(f"✓ 10 frames in {stats.elapsed:.2f}s ({stats.achieved_fps:.1f} fps)")
+
+
+def test_frame_scheduler_drops_late_frames():
+    """Frames that fall a full period behind are skipped"""
+    print("Testing frame scheduler catch-up...")
+    clock = FakeClock()
+    drawn = []
+
+    def stalled_draw(frame):
+        drawn.append(frame)
+        clock.now += 0.25  # 2.5 periods per draw
+
+    stats = FrameScheduler(0.1, clock=clock, sleep=clock.sleep).run(list(range(10)), stalled_draw)
+
+    assert drawn[0] == 0 and drawn[-1] == 9
+    assert stats.frames_rendered + stats.frames_dropped == 10
+    assert stats.frames_dropped > 0
+    assert stats.elapsed <= 1.0 + 0.25 + 1e-9
+    print(f"✓ Dropped {stats.frames_dropped} late frames")
+
+
+def test_animation_play_reports_stats():
+    """Animation.play returns the scheduler's report"""
+    print("Testing Animation.play stats...")
+    clock = FakeClock()
+    animation = Animation(["a", "b"], frame_delay=0.2, loop=3)
+    scheduler = FrameScheduler(animation.frame_delay, clock=clock, sleep=clock.sleep)
+
+    class Recorder:
+        def __init__(self):
+            self.frames = []
+
+        def render_frame(self, frame, color=None):
+            self.frames.append(frame)
+
+    recorder = Recorder()
+    stats = animation.play(recorder, scheduler=scheduler)
+    assert recorder.frames == ["a", "b"] * 3
+    assert stats is animation.last_stats
+    assert abs(stats.elapsed - 1.2) < 1e-9
+    print("✓ Animation stats reported")
+
+
+def test_clocks():
+    """Every timed effect waits on its clock; virtual time costs no wall time"""
+    print("Testing clocks...")
+    clock = VirtualClock()
+    story = Story()
+    scene = Scene(id="stage", description="x" * 100, ascii_art="[]",
+                  animation=Animation(["a", "b"], frame_delay=0.1, loop=2),
+                  dialogue=[("MALONE", "y" * 50)])
+    game = Game(story, clock=clock, renderer=TerminalRenderer(use_colors=False, clock=clock))
+    started = time.perf_counter()
+    assert game.play_scene(scene) is None  # No choices: the story ends
+    # Animation 0.4s, pauses 0.5 + 1 + 0.5 + 0.3, typewriter 99 * 0.02 + 49 * 0.03
+    assert abs(clock.now() - 6.15) < 1e-6, clock.now()
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=40)
+    VisualEffects.flicker(console, "NEON", "#ff0040", duration=1.0, clock=clock)
+    VisualEffects.pulse(console, "NEON", "#ff0040", cycles=3, clock=clock)
+    VisualEffects.lightning_flash(console, "BOOM", flashes=2, clock=clock)
+    VisualEffects.color_transition(console, "FADE", "#000000", "#ffffff", steps=10, clock=clock)
+    assert clock.now() >= 6.15 + 1.0 + 1.8 + 0.5 + 1.0, clock.now()
+    assert time.perf_counter() - started < 1.0, "Virtual time slept for real"
+
+    fast = AcceleratedClock(1000)
+    before, started = fast.now(), time.perf_counter()
+    fast.sleep(2.0)
+    assert fast.now() - before >= 2.0
+    assert time.perf_counter() - started < 0.5
+    assert isinstance(clock_from_spec("x10"), AcceleratedClock)
+    assert isinstance(clock_from_spec("virtual"), VirtualClock)
+    try:
+        clock_from_spec("fast")
+        assert False, "Unknown clock accepted"
+    except ValueError:
+        pass
+    print(f"✓ {clock.now():.1f}s of effects played on virtual time")
+
+
+def test_skip_ahead():
+    """A skip flushes the rest of the text in one write and cuts the pauses"""
+    print("Testing skip-ahead...")
+    clock = FakeClock()
+    skip = Event()
+    stream = CountingStream()
+
+    def sleep(seconds):
+        clock.sleep(seconds)
+        if clock.now >= 0.5:
+            skip.set()  # The player presses a key half a second in
+
+    stats = Typewriter(fps=50, clock=clock, sleep=sleep, skip=skip).type_text(
+        "x" * 1000, 0.01, stream=stream)
+    assert stream.getvalue() == "x" * 1000
+    assert stats.skipped and clock.now < 0.6, clock.now
+    assert stream.write_calls == stats.writes <= 27, stats.writes
+
+    class KeyAtClock(VirtualClock):
+        """Sets the game's skip event once virtual time passes ``at``"""
+
+        def sleep(self, seconds):
+            super().sleep(seconds)
+            if self.time >= 1.0:
+                game.skip_listener.pressed.set()
+
+    clock = KeyAtClock()
+    scene = Scene(id="stage", description="x" * 100, ascii_art="[]",
+                  dialogue=[("MALONE", "y" * 50)])
+    game = Game(Story(), clock=clock, renderer=TerminalRenderer(use_colors=False, clock=clock))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        game.play_scene(scene)
+    # Unskipped this scene takes 1 + 1.98 + 0.5 + 1.47 + 0.3 seconds
+    assert abs(clock.now() - 1.0) < 1e-9, clock.now()
+    assert "x" * 100 in output.getvalue() and "y" * 50 in output.getvalue()
+
+    if os.name != "nt":
+        master, slave = os.openpty()
+        saved_stdin = sys.stdin
+        sys.stdin = os.fdopen(slave, "r")
+        dispatcher = InputDispatcher()
+        try:
+            with SkipListener(dispatcher=dispatcher) as listener:
+                assert not listener.pressed.is_set()
+                os.write(master, b" ")
+                assert listener.pressed.wait(2.0), "Key press not seen"
+            assert listener._subscription is None, "Listener still subscribed"
+        finally:
+            dispatcher.close()
+            sys.stdin.close()
+            sys.stdin = saved_stdin
+            os.close(master)
+    print(f"✓ Skipped after {stats.writes} writes")
+
+
+def test_diff_renderer_rewrites_changed_cells_only():
+    """Unchanged frames cost a cursor move, changed cells a small patch"""
+    print("Testing differential frame rendering...")
+    stream = io.StringIO()
+    renderer = DiffFrameRenderer(stream=stream, size=lambda: (80, 24))
+
+    frame = "\n".join(["+" + "-" * 40 + "+"] + ["|  rain" + " " * 34 + "|"] + ["|" + "." * 40 + "|"] * 8)
+    renderer.draw(frame)
+    first = stream.getvalue()
+    assert first.startswith(CLEAR_SCREEN)
+    assert renderer.stats.full_repaints == 1
+
+    renderer.draw(frame)
+    assert renderer.stats.last_frame_bytes == len("\x1b[11;1H")
+
+    renderer.draw(frame.replace("rain", "RAIN"))
+    patch = stream.getvalue()[-renderer.stats.last_frame_bytes:]
+    assert "\x1b[2;4HRAIN" in patch, repr(patch)
+    assert renderer.stats.last_frame_bytes < len(first) / 3
+    print(f"✓ Patch of {renderer.stats.last_frame_bytes} bytes vs {len(first)} for a repaint")
+
+
+def test_diff_renderer_repaints_on_resize():
+    """A terminal resize forces a full repaint"""
+    print("Testing differential rendering resize fallback...")
+    size = [(80, 24)]
+    renderer = DiffFrameRenderer(stream=io.StringIO(), size=lambda: size[0])
+    renderer.draw("frame one")
+    renderer.draw("frame one")
+    size[0] = (100, 30)
+    renderer.draw("frame one")
+    assert renderer.stats.full_repaints == 2
+    assert renderer.stats.frames == 3
+    print("✓ Resize triggers full repaint")
+
+
+def test_diff_renderer_styled_cells():
+    """Styled cells keep their style when patched"""
+    print("Testing styled differential rendering...")
+    console = Console(file=io.StringIO(), force_terminal=True, color_system="standard", width=80)
+    renderer = DiffFrameRenderer(stream=console.file, size=lambda: (80, 24))
+    art = "\n".join(["abc" * 10] * 5)
+    renderer.draw(art, style="red", console=console)
+    renderer.draw("abX" + art[3:], style="red", console=console)
+    patch = console.file.getvalue()[-renderer.stats.last_frame_bytes:]
+    assert patch.startswith("\x1b[1;3H\x1b[31mX\x1b[0m"), repr(patch)
+    print("✓ Styled patch emitted")
+
+
+class TtyStringIO(io.StringIO):
+    """StringIO that claims to be a terminal"""
+
+    def isatty(self):
+        return True
+
+
+def test_dumb_terminal_frames_are_plain():
+    """Terminals that cannot clear get frames without cursor escapes"""
+    print("Testing frames on a dumb terminal...")
+    original_term, original_stdout = os.environ.get("TERM"), sys.stdout
+    os.environ["TERM"] = "dumb"
+    probe_terminal(refresh=True)
+    try:
+        renderer = TerminalRenderer(use_colors=False)
+        sys.stdout = TtyStringIO()
+        renderer.render_frame("ab\ncd")
+        renderer.render_frame("ax\ncd")
+        written = sys.stdout.getvalue()
+    finally:
+        sys.stdout = original_stdout
+        if original_term is None:
+            del os.environ["TERM"]
+        else:
+            os.environ["TERM"] = original_term
+        capabilities = probe_terminal(refresh=True)
+    assert written == "ab\ncd\nax\ncd\n", repr(written)
+    assert "\x1b" not in written
+
+    # Full repaints clear with the probed sequence
+    renderer = TerminalRenderer(use_colors=False)
+    if capabilities.clear_sequence:
+        assert renderer.frame_renderer.clear_sequence == capabilities.clear_sequence
+    print("✓ Dumb terminals get plain frames")
+
+
+def test_render_frame_without_mood_art_color():
+    """Frames fall back to amber when the mood names no art color"""
+    print("Testing frame colors without a mood art color...")
+    renderer = TerminalRenderer(use_colors=True)
+    if renderer.color_renderer is None:
+        print("✓ Skipped (no color support)")
+        return
+    renderer.color_renderer.console = Console(file=io.StringIO(), force_terminal=True,
+                                              color_system="truecolor", width=80)
+    renderer.terminal = TerminalCapabilities("xterm", CLEAR_SCREEN, "ansi", 0.0)
+    renderer.set_mood({"text": "white"})
+    renderer.render_frame("neon\nrain")
+    written = renderer.color_renderer.console.file.getvalue()
+    assert "neon" in written and "\x1b[1;" in written, repr(written)  # Bold and colored
+    print("✓ Frame drawn in the fallback color")
+
+
+def test_plain_clear_does_not_spawn_processes():
+    """Plain-mode clear writes the probed sequence in-process"""
+    print("Testing in-process screen clear...")
+    capabilities = probe_terminal()
+    assert probe_terminal() is capabilities, "Probe should be cached"
+
+    renderer = TerminalRenderer(use_colors=False)
+    original_system, original_stdout = os.system, sys.stdout
+
+    def forbidden(command):
+        raise AssertionError(f"clear() spawned a process: {command}")
+
+    os.system = forbidden
+    sys.stdout = io.StringIO()
+    try:
+        renderer.clear()
+        written = sys.stdout.getvalue()
+    finally:
+        os.system, sys.stdout = original_system, original_stdout
+
+    if capabilities.can_clear:
+        assert written == capabilities.clear_sequence
+    print(f"✓ Cleared via {capabilities.source} ({capabilities.clear_sequence!r})")
+
+
+def main():
+    print("=" * 60)
+    print("TERMINAL THEATRE - Rendering Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_typewriter_split_units()
+        test_typewriter_styled_output_matches_rich()
+        test_typewriter_batches_writes()
+        test_typewriter_zero_delay()
+        test_frame_scheduler_keeps_wall_time()
+        test_frame_scheduler_drops_late_frames()
+        test_animation_play_reports_stats()
+        test_clocks()
+        test_skip_ahead()
+        test_diff_renderer_rewrites_changed_cells_only()
+        test_diff_renderer_repaints_on_resize()
+        test_diff_renderer_styled_cells()
+        test_dumb_terminal_frames_are_plain()
+        test_render_frame_without_mood_art_color()
+        test_plain_clear_does_not_spawn_processes()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL RENDERING TESTS PASSED")
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
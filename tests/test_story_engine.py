@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+"""
+Tests for the story engine (scene registry, game state, choices)
+"""
+
+import os
+import sys
+import tempfile
+
+from engine import bundle as bundle_module
+
+from engine.bundle import ENTRY, BundleError, BundledStory, compile_story
+from engine.colors import get_mood_palette
+from engine.containers import ChoiceHistory, OrderedSet
+from engine.explorer import explore
+from engine.logic import (
+    AddItem, And, Effects, HasFlag, HasItem, Increment, LogicError, Not, SetFlag, Var,
+    condition_from_data, condition_reads, effects_from_data, parse_condition, parse_effects,
+    trace_effects,
+)
+from engine.montecarlo import UNFINISHED, simulate
+from engine.rewind import RewindBuffer
+from engine.story import Story, Scene, Choice, GameState, SceneRegistry
+from stories.blood_and_neon import BloodAndNeonStory
+from stories.noir_detective import NoirDetectiveStory
+
+
+class CountingStory(Story):
+    """Small story that counts how many scenes were built"""
+
+    def __init__(self):
+        super().__init__()
+        self.built = []
+        self.starting_scene = "start"
+        for scene_id in ("start", "middle", "danger_end"):
+            self.scenes.declare(scene_id, lambda scene_id=scene_id: self._make(scene_id))
+
+    def _make(self, scene_id):
+        self.built.append(scene_id)
+        return Scene(id=scene_id, description=scene_id, is_ending=scene_id.endswith("end"))
+
+    def scene_palette(self, scene_id):
+        return get_mood_palette("danger") if "danger" in scene_id else None
+
+
+class KeyStory(Story):
+    """Small story whose locked door only opens after on_enter hands over a key"""
+
+    def __init__(self):
+        super().__init__()
+        self.title = "KEYS"
+        self.starting_scene = "hall"
+        self.scenes["hall"] = Scene(id="hall", description="", choices=[
+            Choice("Take the key", "key_room"),
+            Choice("Try the door", "door"),
+        ])
+        self.scenes["key_room"] = Scene(id="key_room", description="",
+                                        on_enter=Effects([AddItem("key")]),
+                                        choices=[Choice("Back", "hall")])
+        self.scenes["door"] = Scene(id="door", description="", choices=[
+            Choice("Unlock", "vault", condition=HasItem("key")),
+            Choice("Knock", "cellar", condition=~HasItem("key")),
+        ])
+        self.scenes["vault"] = Scene(id="vault", description="", is_ending=True)
+        self.scenes["cellar"] = Scene(id="cellar", description="",
+                                      choices=[Choice("Dig", "tunnel", condition=HasFlag("shovel"))])
+        self.scenes["attic"] = Scene(id="attic", description="", is_ending=True)
+
+
+def test_scenes_build_lazily():
+    """Declared scenes are only built when looked up"""
+    print("Testing lazy scene construction...")
+    story = CountingStory()
+
+    assert len(story.scenes) == 3
+    assert "middle" in story.scenes
+    assert story.built == []
+
+    scene = story.get_scene("middle")
+    assert scene.id == "middle"
+    assert story.built == ["middle"]
+    assert story.get_scene("middle") is scene, "Scenes are built once"
+    assert story.scenes.materialized_count == 1
+    assert story.get_scene("missing") is None
+    print("✓ Scenes are built on first access")
+
+
+def test_scene_registry():
+    """The registry builds declared scenes once and reports each build"""
+    print("Testing the scene registry...")
+    built = []
+    registry = SceneRegistry(on_materialize=lambda scene: built.append(scene.id))
+    registry.declare("dock", lambda: Scene(id="dock", description=""))
+    registry.declare("pier", lambda: Scene(id="pier", description=""))
+    assert list(registry) == ["dock", "pier"] and built == []
+    assert not registry.is_materialized("dock")
+
+    dock = registry["dock"]
+    assert registry["dock"] is dock and built == ["dock"]
+    assert registry.is_materialized("dock") and registry.materialized_count == 1
+
+    registry["pier"] = Scene(id="pier", description="replaced")
+    assert registry["pier"].description == "replaced" and built == ["dock", "pier"]
+    del registry["dock"]
+    assert "dock" not in registry and len(registry) == 1
+    print("✓ Scene registry materializes lazily")
+
+
+def test_failed_scene_build_can_retry():
+    """A factory that raises stays declared and is tried again"""
+    print("Testing scene factory failures...")
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("asset not ready")
+        return Scene(id="flaky", description="")
+
+    registry = SceneRegistry()
+    registry.declare("flaky", flaky)
+    try:
+        registry["flaky"]
+        assert False, "Factory error was swallowed"
+    except RuntimeError:
+        pass
+    assert not registry.is_materialized("flaky")
+    assert registry["flaky"].id == "flaky" and len(attempts) == 2
+    print("✓ Failed scene builds can be retried")
+
+
+def test_palette_resolved_on_build():
+    """Palettes come from the story hook at materialization time"""
+    print("Testing palette resolution...")
+    story = CountingStory()
+    assert story.get_scene("danger_end").palette == get_mood_palette("danger")
+    assert story.get_scene("start").palette == get_mood_palette("noir")
+
+    story.scenes["extra_danger"] = Scene(id="extra_danger", description="x")
+    assert story.scenes["extra_danger"].palette == get_mood_palette("danger")
+    print("✓ Palettes resolved per scene")
+
+
+def test_shipped_stories_construct_lazily():
+    """Shipped stories build nothing until scenes are visited"""
+    print("Testing shipped story construction...")
+    for story_class in (NoirDetectiveStory, BloodAndNeonStory):
+        story = story_class()
+        assert story.scenes.materialized_count == 0
+        start = story.get_scene(story.starting_scene)
+        assert start is not None and start.choices
+        assert story.scenes.materialized_count == 1
+        for choice in start.choices:
+            assert choice.next_scene in story.scenes
+    print("✓ Shipped stories construct lazily")
+
+
+def test_choice_cache_tracks_dependencies():
+    """Cached availability is reused until a key a condition read changes"""
+    print("Testing choice availability cache...")
+    story = Story()
+    scene = Scene(id="door", description="door", choices=[
+        Choice("Unlock", "inside", condition=HasItem("key")),
+        Choice("Knock", "inside", condition=lambda state: not state.has_flag("knocked")),
+        Choice("Leave", "street"),
+    ])
+    story.scenes["door"] = scene
+    cache = story.choice_cache
+
+    assert [c.text for c in story.get_available_choices(scene)] == ["Knock", "Leave"]
+    assert [c.text for c in story.get_available_choices(scene)] == ["Knock", "Leave"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    story.state.set_flag("unrelated")
+    story.state.add_item("lamp")
+    story.get_available_choices(scene)
+    assert (cache.hits, cache.misses) == (2, 1), "Unread keys must not invalidate"
+
+    story.state.add_item("key")
+    assert [c.text for c in story.get_available_choices(scene)] == ["Unlock", "Knock", "Leave"]
+    story.state.set_flag("knocked")
+    assert [c.text for c in story.get_available_choices(scene)] == ["Unlock", "Leave"]
+    assert cache.misses == 3
+    story.state.set_flag("knocked")  # Same value: no invalidation
+    story.get_available_choices(scene)
+    assert cache.misses == 3
+
+    story.state.from_dict({"current_scene": "door"})
+    assert [c.text for c in story.get_available_choices(scene)] == ["Knock", "Leave"]
+    story.state = GameState()
+    story.state.add_item("key")
+    assert len(story.get_available_choices(scene)) == 3
+    assert cache.misses == 5
+
+    # Conditions on untracked state are evaluated every time
+    history = Scene(id="history", description="", choices=[
+        Choice("Return", "door", condition=lambda state: "door" in state.visited_scenes),
+    ])
+    assert story.get_available_choices(history) == []
+    story.state.visit_scene("door")
+    assert len(story.get_available_choices(history)) == 1
+    print("✓ Availability cache invalidates only on relevant writes")
+
+
+def test_game_state_containers():
+    """Visited scenes and inventory keep list order with set lookups"""
+    print("Testing game state containers...")
+    state = GameState()
+    assert not hasattr(state, "__dict__"), "GameState uses __slots__"
+    for scene_id in ("opening", "alley", "opening", "office"):
+        state.visit_scene(scene_id)
+    for item in ("key", "map", "key"):
+        state.add_item(item)
+    assert isinstance(state.visited_scenes, OrderedSet)
+    assert state.visited_scenes == ["opening", "alley", "office"]
+    assert state.current_scene == "office"
+    assert state.inventory == ["key", "map"] and state.has_item("map")
+
+    for index in range(5):
+        state.record_choice("alley", index % 2, f"Option {index % 2}")
+    assert len(state.choice_history) == 5
+    assert state.choice_history[1] == ("alley", 1, "Option 1")
+    assert state.choice_history[-1] == ("alley", 0, "Option 0")
+    assert state.choice_history[1:3] == [("alley", 1, "Option 1"), ("alley", 0, "Option 0")]
+    assert state.choice_history.nbytes() == 5 * 8
+
+    data = state.to_dict()
+    assert data["visited_scenes"] == ["opening", "alley", "office"]
+    assert data["inventory"] == ["key", "map"]
+    assert data["choice_history"][0] == ("alley", 0, "Option 0")
+
+    restored = GameState()
+    restored.from_dict(data)
+    assert restored.visited_scenes == state.visited_scenes
+    assert restored.choice_history == state.choice_history
+    assert ChoiceHistory([["a", 1, "b"]]) == [("a", 1, "b")], "JSON lists load as tuples"
+    try:
+        state.record_choice("alley", 70000, "Too many")
+        assert False, "Out-of-range choice index must be rejected"
+    except OverflowError:
+        pass
+    print("✓ Containers preserve order and serialize as lists")
+
+
+def test_snapshot_and_restore():
+    """Snapshots are immutable, share storage, and restore cleanly"""
+    print("Testing state snapshots...")
+    state = GameState()
+    state.visit_scene("opening")
+    state.set_flag("met_client")
+    state.add_item("card")
+    state.set_variable("trust", 1)
+    state.record_choice("opening", 0, "Take the case")
+
+    snapshot = state.snapshot()
+    assert snapshot.flags is not state.flags and snapshot._flags is state.flags, "No copy on snapshot"
+
+    state.visit_scene("alley")
+    state.set_flag("met_client", False)
+    state.add_item("gun")
+    state.set_variable("trust", 5)
+    state.record_choice("alley", 1, "Fight")
+
+    assert snapshot.current_scene == "opening"
+    assert list(snapshot.visited_scenes) == ["opening"]
+    assert snapshot.flags == {"met_client": True}
+    assert list(snapshot.inventory) == ["card"]
+    assert snapshot.variables == {"trust": 1}
+    assert snapshot.choices() == [("opening", 0, "Take the case")]
+    try:
+        snapshot.flags["met_client"] = False
+        assert False, "Snapshot flags are read-only"
+    except TypeError:
+        pass
+
+    state.restore(snapshot)
+    assert state.current_scene == "opening" and not state.has_item("gun")
+    assert state.get_variable("trust") == 1 and len(state.choice_history) == 1
+    state.add_item("lighter")
+    assert list(snapshot.inventory) == ["card"], "Writes after restore must not leak into the snapshot"
+
+    data = state.to_dict()
+    data["flags"]["met_client"] = False
+    data["inventory"].append("forged")
+    assert state.has_flag("met_client") and not state.has_item("forged"), "to_dict is a deep copy"
+
+    source = {"current_scene": "alley", "flags": {"a": True}, "variables": {"clues": ["ring"]},
+              "visited_scenes": ["alley"], "inventory": [], "choice_history": []}
+    state.from_dict(source)
+    source["flags"]["a"] = False
+    source["variables"]["clues"].append("knife")
+    assert state.has_flag("a") and state.get_variable("clues") == ["ring"], "from_dict never aliases"
+    print("✓ Snapshots are isolated and restore correctly")
+
+
+def test_windowed_choice_history():
+    """A windowed history spills old entries but still reads in full"""
+    print("Testing windowed choice history...")
+    state = GameState()
+    state.limit_history(4)
+    expected = [(f"scene_{index % 3}", index % 5, f"Choice {index % 7}") for index in range(50)]
+    for entry in expected[:30]:
+        state.record_choice(*entry)
+    history = state.choice_history
+    assert len(history) == 30 and history.spilled >= 22, "Old entries stay in memory"
+    assert history.nbytes() <= 8 * 8
+
+    snapshot = state.snapshot()
+    for entry in expected[30:]:
+        state.record_choice(*entry)
+    assert list(state.choice_history) == expected
+    assert state.choice_history[3] == expected[3] and state.choice_history[-1] == expected[-1]
+    assert state.choice_history[10:40] == expected[10:40]
+    assert state.choice_history[::7] == expected[::7]
+    assert snapshot.choices() == expected[:30]
+
+    # A restored copy and the original both keep appending to their own history
+    state.restore(snapshot)
+    for entry in expected[:20]:
+        state.record_choice(*entry)
+    assert list(state.choice_history) == expected[:30] + expected[:20]
+    assert snapshot.choices() == expected[:30]
+    assert state.to_dict()["choice_history"] == expected[:30] + expected[:20]
+
+    state.from_dict({"current_scene": "a", "visited_scenes": ["a"], "flags": {},
+                     "choice_history": expected})
+    assert state.choice_history.window == 4 and state.choice_history.spilled > 0
+    assert state.choice_history == expected
+    print("✓ Windowed history spills to disk and reads back in order")
+
+
+def test_rewind_buffer():
+    """Rewinding restores earlier scene entries and evicts the oldest"""
+    print("Testing the rewind buffer...")
+    state = GameState()
+    rewind = RewindBuffer(capacity=5)
+    for index in range(8):
+        state.visit_scene(f"scene_{index}")
+        rewind.push(state)
+        state.set_flag(f"flag_{index}")
+        state.set_variable("count", index)
+        state.record_choice(f"scene_{index}", 0, "Onward")
+    assert rewind.scenes() == [f"scene_{index}" for index in range(3, 8)]
+    assert rewind.memory_used > len(rewind) * RewindBuffer.SNAPSHOT_SIZE
+
+    assert rewind.rewind(state, 5) is None, "Rewound past the oldest snapshot"
+    assert rewind.rewind(state, 2) == "scene_5"
+    assert state.current_scene == "scene_5" and len(state.choice_history) == 5
+    assert state.has_flag("flag_4") and not state.has_flag("flag_5")
+    assert state.get_variable("count") == 4
+    assert rewind.scenes() == ["scene_3", "scene_4"]
+
+    # Replaying from the restored state leaves the older snapshots intact
+    state.visit_scene("scene_5")
+    rewind.push(state)
+    state.set_flag("detour")
+    assert rewind.rewind(state, 1) == "scene_4"
+    assert not state.has_flag("detour") and not state.has_flag("flag_4")
+
+    # A tight budget keeps only what fits (but always the newest)
+    small = RewindBuffer(capacity=100, memory_budget=RewindBuffer.SNAPSHOT_SIZE * 3)
+    for index in range(10):
+        state.set_flag(f"budget_{index}")
+        small.push(state)
+    assert len(small) < 10 and small.memory_used <= small.memory_budget
+    print("✓ Rewind buffer works")
+
+
+def test_explorer():
+    """The explorer follows flag-gated branches and reports endings and dead ends"""
+    print("Testing the state-space explorer...")
+    for processes in (1, 2):
+        report = explore(KeyStory, processes=processes, batch_size=1)
+        # hall, key_room and door each with and without the key, vault, cellar
+        assert report.states == 8
+        assert report.endings == {"vault": 1}
+        assert report.unreachable_scenes == ["attic"]
+        assert report.dead_ends == [("cellar", (), (), ())]
+        assert report.dead_ends_by_scene() == {"cellar": 1}
+        assert not report.missing_scenes and not report.truncated
+        assert report.states_per_second > 0
+
+    report = explore(NoirDetectiveStory, processes=1)
+    assert not report.dead_ends and not report.missing_scenes
+    assert len(report.endings) >= 20
+    assert explore(KeyStory, processes=1, max_states=2).truncated
+    print("✓ Explorer works")
+
+
+def test_monte_carlo():
+    """Random playthroughs aggregate the same way for any number of workers"""
+    print("Testing Monte Carlo playthroughs...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        single = simulate(KeyStory, 5_000, seed=4, processes=1, chunk_runs=700,
+                          output=os.path.join(tmpdir, "single"))
+        pooled = simulate(KeyStory, 5_000, seed=4, processes=2, chunk_runs=700,
+                          output=os.path.join(tmpdir, "pooled"))
+        for name in ("endings.u16", "lengths.u32"):
+            with open(os.path.join(tmpdir, "single", name), "rb") as first, \
+                    open(os.path.join(tmpdir, "pooled", name), "rb") as second:
+                assert first.read() == second.read(), f"{name} depends on the pool size"
+        assert os.path.getsize(os.path.join(tmpdir, "single", "endings.u16")) == 5_000 * 2
+
+    assert single.runs == 5_000 and single.endings() == pooled.endings()
+    # Every run ends in the vault or stuck in the cellar
+    assert set(single.endings()) == {"vault"}
+    assert single.endings()["vault"] + single.unfinished == 5_000 and single.unfinished > 0
+    assert sum(single.length_counts) == 5_000 and single.length_percentile(50) >= 3
+    visits = single.visits()
+    assert visits["attic"] == 0 and visits["hall"] >= 5_000
+    assert single.flag_coverage() == {}, "KeyStory sets no flags"
+    assert UNFINISHED > len(single.scene_ids)
+
+    noir = simulate(NoirDetectiveStory, 2_000, seed=1, processes=1)
+    assert noir.unfinished == 0 and len(noir.endings()) > 10
+    assert noir.flag_coverage() and all(0 < share <= 1 for share in noir.flag_coverage().values())
+    print("✓ Monte Carlo playthroughs work")
+
+
+def test_bundle_round_trip():
+    """A compiled bundle decodes to the same scenes as the Python story"""
+    print("Testing story bundle round trip...")
+    source = NoirDetectiveStory()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "noir.ttsb")
+        compile_story(source, path)
+        bundled = BundledStory(path)
+
+        assert bundled.title == source.title
+        assert bundled.source_class == "NoirDetectiveStory"
+        assert list(bundled.scenes) == list(source.scenes)
+        assert bundled.scenes.materialized_count == 0
+
+        for scene_id in source.scenes:
+            original, decoded = source.scenes[scene_id], bundled.scenes[scene_id]
+            assert decoded.description == original.description
+            assert decoded.dialogue == original.dialogue
+            assert decoded.palette == original.palette
+            assert [(c.text, c.next_scene) for c in decoded.choices] == \
+                [(c.text, c.next_scene) for c in original.choices]
+            if original.ascii_art is None or isinstance(original.ascii_art, str):
+                assert decoded.ascii_art == original.ascii_art
+            else:
+                assert decoded.ascii_art.plain == original.ascii_art.plain
+                assert decoded.ascii_art.spans == original.ascii_art.spans
+
+        # on_enter callbacks become declarative effects
+        state = GameState()
+        bundled.get_scene("check_gun").on_enter(state)
+        assert state.has_flag("examined_gun")
+        bundled.close()
+    print("✓ Bundle matches the source story")
+
+
+def test_truncated_bundles():
+    """Damaged bundles raise BundleError, never a raw decoding error"""
+    print("Testing truncated bundles...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "noir.ttsb")
+        compile_story(NoirDetectiveStory(), path)
+        with open(path, "rb") as handle:
+            data = handle.read()
+        damaged = os.path.join(directory, "damaged.ttsb")
+
+        # Empty, cut inside the metadata, cut inside the records; the maps
+        # of rejected bundles are released
+        maps = []
+        real_mmap = bundle_module.mmap.mmap
+
+        def recording_mmap(*args, **kwargs):
+            maps.append(real_mmap(*args, **kwargs))
+            return maps[-1]
+
+        bundle_module.mmap.mmap = recording_mmap
+        try:
+            for length in (0, 40, len(data) - 10):
+                with open(damaged, "wb") as handle:
+                    handle.write(data[:length])
+                try:
+                    BundledStory(damaged)
+                    assert False, f"Bundle cut at {length} bytes accepted"
+                except BundleError:
+                    pass
+        finally:
+            bundle_module.mmap.mmap = real_mmap
+        assert len(maps) == 2 and all(mapped.closed for mapped in maps)
+
+        # A record that fails to decompress is reported on lookup
+        with BundledStory(path) as bundled:
+            offset, _ = ENTRY.unpack_from(bundled._map, bundled._index_offset)
+        assert bundled._map.closed
+        with open(damaged, "wb") as handle:
+            handle.write(data[:offset] + b"\xff" * 8 + data[offset + 8:])
+        bundled = BundledStory(damaged)
+        try:
+            bundled.get_scene(next(iter(bundled.scenes)))  # Record 0
+            assert False, "Corrupt record decoded"
+        except BundleError:
+            pass
+        bundled.close()
+    print("✓ Truncated bundles are rejected cleanly")
+
+
+def test_bundle_declarative_logic():
+    """Conditions and effects survive compilation; Python callables are rejected"""
+    print("Testing bundle logic ops...")
+    story = Story()
+    story.starting_scene = "start"
+    story.scenes["start"] = Scene(
+        id="start", description="start",
+        choices=[Choice("Unlock", "end", condition=HasItem("key")), Choice("Leave", "end")],
+        on_enter=Effects([SetFlag("arrived"), AddItem("key")]),
+    )
+    story.scenes["end"] = Scene(id="end", description="end", is_ending=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tiny.ttsb")
+        compile_story(story, path, compress=False)
+        bundled = BundledStory(path)
+        start = bundled.get_scene("start")
+        assert start.choices[0].condition == HasItem("key")
+        assert len(bundled.get_available_choices(start)) == 1
+        start.on_enter(bundled.state)
+        assert len(bundled.get_available_choices(start)) == 2
+        bundled.close()
+
+        story.scenes["end"].choices.append(Choice("Back", "start", condition=lambda s: True))
+        try:
+            compile_story(story, path)
+            assert False, "Callable conditions cannot be compiled"
+        except BundleError:
+            pass
+
+        with open(path, "wb") as handle:
+            handle.write(b"not a bundle at all")
+        try:
+            BundledStory(path)
+            assert False, "Bad magic must be rejected"
+        except BundleError:
+            pass
+
+    def reads_state(state):
+        if state.has_flag("x"):
+            state.add_item("y")
+    assert trace_effects(lambda s: s.set_flag("seen")) == Effects([SetFlag("seen")])
+    try:
+        trace_effects(reads_state)
+        assert False, "Callbacks that read state are not declarative"
+    except LogicError:
+        pass
+    print("✓ Declarative ops compile; callables are rejected")
+
+
+def test_condition_language():
+    """Predicates combine, parse, serialize and report what they read"""
+    print("Testing declarative conditions...")
+    built = HasItem("key") & ~HasFlag("alarm") | (Var("trust") >= 2)
+    parsed = parse_condition("has_item(key) and not has_flag(alarm) or trust >= 2")
+    assert built == parsed
+    assert condition_from_data(parsed.to_data()) == parsed
+    assert parsed.reads == {("item", "key"), ("flag", "alarm"), ("var", "trust")}
+
+    state = GameState()
+    assert not parsed(state)
+    state.add_item("key")
+    assert parsed(state)
+    state.set_flag("alarm")
+    assert not parsed(state)
+    state.set_variable("trust", 2)
+    assert parsed(state)
+
+    assert parse_condition('has_item("Queen of Swords")') == HasItem("Queen of Swords")
+    assert parse_condition("not (flag(a) and flag(b))") == Not(And((HasFlag("a"), HasFlag("b"))))
+    assert (Var("mood") != "grim")(GameState()), "Unset variables only match !="
+    assert not (Var("trust") > 0)(GameState())
+
+    # Python callables remain an escape hatch, but hide their reads
+    mixed = HasFlag("a") & (lambda state: True)
+    assert mixed.reads is None and condition_reads(lambda state: True) is None
+    assert condition_reads(None) == frozenset()
+    try:
+        mixed.to_data()
+        assert False, "Callables cannot be serialized"
+    except LogicError:
+        pass
+
+    for bad in ("has_item(", "trust >=", "trust ~ 2", "flag(a) flag(b)"):
+        try:
+            parse_condition(bad)
+            assert False, f"{bad!r} should not parse"
+        except LogicError:
+            pass
+    print("✓ Conditions behave like the lambdas they replace")
+
+
+def test_effect_language():
+    """Effects apply in order, parse and serialize"""
+    print("Testing declarative effects...")
+    effects = parse_effects('set_flag(arrived); add_item("Queen of Swords"); increment(trust, 2); increment(trust)')
+    assert effects_from_data(effects.to_data()) == effects
+    assert effects.writes == {("flag", "arrived"), ("item", "Queen of Swords"), ("var", "trust")}
+
+    state = GameState()
+    effects(state)
+    assert state.has_flag("arrived") and state.has_item("Queen of Swords")
+    assert state.get_variable("trust") == 3
+    assert Increment("trust", 2) in effects
+
+    story = BloodAndNeonStory()
+    on_enter = story.get_scene("examine_card").on_enter
+    assert on_enter == Effects([SetFlag("examined_tarot_card"), AddItem("Queen of Swords")])
+    print("✓ Effects apply and round-trip")
+
+
+def main():
+    print("=" * 60)
+    print("TERMINAL THEATRE - Story Engine Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_scenes_build_lazily()
+        test_scene_registry()
+        test_failed_scene_build_can_retry()
+        test_palette_resolved_on_build()
+        test_shipped_stories_construct_lazily()
+        test_condition_language()
+        test_effect_language()
+        test_choice_cache_tracks_dependencies()
+        test_game_state_containers()
+        test_snapshot_and_restore()
+        test_windowed_choice_history()
+        test_rewind_buffer()
+        test_explorer()
+        test_monte_carlo()
+        test_bundle_round_trip()
+        test_truncated_bundles()
+        test_bundle_declarative_logic()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL STORY ENGINE TESTS PASSED")
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()